@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: bench_collectors.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Benchmarks of the HTML collectors."""
+
+from fundamentus.drivers.mocks.companies_list import COMPANIES_LIST_MOCK
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+
+
+def bench_collect_all_information(benchmark, collector) -> None:
+    """Time the collection of a detail page."""
+
+    result = benchmark(collector.collect_all_information, HTML_COLLECTOR_MOCK['content'])
+
+    assert result['price']
+
+
+def bench_collect_list_of_companies(benchmark, collector) -> None:
+    """Time the collection of the listing of companies."""
+
+    result = benchmark(collector.collect_list_of_companies, COMPANIES_LIST_MOCK['content'])
+
+    assert result
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: bench_pipeline.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Benchmarks of the full pipeline, run offline against the corpus."""
+
+from corpus import StaticHttpRequester
+
+from fundamentus.cache.memory_cache_backend import MemoryCacheBackend
+from fundamentus.cache.parsed_result_cache import ParsedResultCache
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.main.fundamentus_pipeline import FundamentusPipeline
+
+# The parsed results are not cached, so every round parses the pages.
+NO_CACHE = ParsedResultCache(None)
+
+
+def bench_pipeline_mock_page(benchmark, collector) -> None:
+    """Time the pipeline over the mock detail page."""
+
+    requester = StaticHttpRequester(HTML_COLLECTOR_MOCK['content'])
+
+    def run():
+        """Run the pipeline once."""
+
+        return FundamentusPipeline(requester=requester, collector=collector,
+                                   parsed_cache=NO_CACHE).get_all_information()
+
+    assert benchmark(run).transformed_information['price_information']
+
+
+def bench_pipeline_corpus(benchmark, collector, corpus) -> None:
+    """Time the pipeline over every page of the synthetic corpus."""
+
+    requesters = [StaticHttpRequester(html) for html in corpus.values()]
+
+    def run():
+        """Run the pipeline over the corpus."""
+
+        return [FundamentusPipeline(requester=requester, collector=collector,
+                                    parsed_cache=NO_CACHE).get_all_information()
+                for requester in requesters]
+
+    assert len(benchmark.pedantic(run, rounds=1, iterations=1)) == len(corpus)
+
+
+def bench_pipeline_parsed_cache_hit(benchmark) -> None:
+    """Time the pipeline when the page was parsed before."""
+
+    requester = StaticHttpRequester(HTML_COLLECTOR_MOCK['content'])
+    parsed_cache = ParsedResultCache(MemoryCacheBackend())
+
+    def run():
+        """Run the pipeline once."""
+
+        return FundamentusPipeline(requester=requester,
+                                   parsed_cache=parsed_cache).get_all_information()
+
+    run()
+
+    assert benchmark(run).transformed_information['price_information']
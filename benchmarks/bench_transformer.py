@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: bench_transformer.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Benchmarks of the transformer."""
+
+import pytest
+
+from fundamentus.contracts.extract_contract import ExtractContract
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.drivers.single_pass_html_collector import SinglePassHtmlCollector
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation
+
+
+@pytest.fixture(name='extract_contract')
+def fixture_extract_contract() -> ExtractContract:
+    """Collect the mock detail page."""
+
+    raw_information = SinglePassHtmlCollector().collect_all_information(
+        HTML_COLLECTOR_MOCK['content'])
+
+    return ExtractContract(raw_information=raw_information, extraction_date=0)
+
+
+def bench_transform_all_information(benchmark, extract_contract) -> None:
+    """Time the transformation of a detail page with a new transformer."""
+
+    result = benchmark(lambda: TransformRawInformation().transform_all_information(
+        extract_contract))
+
+    assert result.transformed_information['price_information']
+
+
+def bench_transform_many(benchmark, corpus) -> None:
+    """Time the batch transformation of the synthetic corpus."""
+
+    collector = SinglePassHtmlCollector()
+    contracts = [ExtractContract(raw_information=collector.collect_all_information(html),
+                                 extraction_date=0) for html in corpus.values()]
+
+    result = benchmark.pedantic(lambda: TransformRawInformation().transform_many(contracts),
+                                rounds=3, iterations=1)
+
+    assert len(result) == len(corpus)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: conftest.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Fixtures shared by the benchmarks."""
+
+import os
+import sys
+from importlib import import_module
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+# pylint: disable=wrong-import-position
+from corpus import build_corpus  # noqa: E402
+
+# Number of pages of the synthetic corpus.
+CORPUS_SIZE = int(os.environ.get('FUNDAMENTUS_BENCHMARK_CORPUS_SIZE', '1000'))
+
+COLLECTORS = {
+    'html_parser': ('fundamentus.drivers.html_collector', 'HtmlCollector'),
+    'single_pass': ('fundamentus.drivers.single_pass_html_collector', 'SinglePassHtmlCollector'),
+    'lxml': ('fundamentus.drivers.lxml_html_collector', 'LxmlHtmlCollector'),
+    'selectolax': ('fundamentus.drivers.selectolax_html_collector', 'SelectolaxHtmlCollector'),
+}
+
+
+@pytest.fixture(name='collector', params=list(COLLECTORS))
+def fixture_collector(request):
+    """Build each collector engine, skipping the ones not installed."""
+
+    module_name, class_name = COLLECTORS[request.param]
+
+    try:
+        return getattr(import_module(module_name), class_name)()
+    except ImportError as exception:
+        pytest.skip(str(exception))
+
+
+@pytest.fixture(name='corpus', scope='session')
+def fixture_corpus():
+    """Build the synthetic corpus once per session."""
+
+    return build_corpus(CORPUS_SIZE)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: corpus.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Benchmark corpus.
+
+Builds the pages the benchmarks run against: the mock pages bundled with the tests
+and a synthetic corpus of detail pages, derived from the mock by renaming the
+ticker and perturbing every number, so no two pages are identical.
+"""
+
+import random
+import re
+from typing import Dict
+
+import requests
+
+from fundamentus.contracts.request_contract import RequestContract
+from fundamentus.drivers.interfaces.http_requester import HttpRequesterInterface
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+
+# Numbers formatted as in the Fundamentus website, e.g. 30.775.100.000 or -72,48.
+__NUMBER = re.compile(r'(?<=>)(\s*)(-?\d{1,3}(?:\.\d{3})*(?:,\d+)?|-?\d+,\d+)(%?\s*)(?=<)')
+
+__MOCK_TICKER = 'MGLU3'
+
+
+def synthetic_ticker(index: int) -> str:
+    """Build the ticker of a synthetic page, e.g. AAAB3.
+
+    :param index: int: Index of the page in the corpus.
+    :return: str: The ticker.
+    """
+
+    letters = ''
+    for _ in range(4):
+        index, remainder = divmod(index, 26)
+        letters = chr(ord('A') + remainder) + letters
+
+    return f'{letters}3'
+
+
+def __perturb(match: re.Match, generator: random.Random) -> str:
+    """Scale a number of the page, keeping its format.
+
+    :param match: re.Match: The number found in the page.
+    :param generator: random.Random: The source of the scale factors.
+    :return: str: The scaled number.
+    """
+
+    leading, number, trailing = match.groups()
+    if ',' not in number and '.' not in number:
+        # Years and counts are kept as they are.
+        return match.group(0)
+
+    decimals = len(number.split(',')[1]) if ',' in number else 0
+    value = float(number.replace('.', '').replace(',', '.')) * generator.uniform(0.5, 1.5)
+
+    formatted = f'{value:,.{decimals}f}'.replace(',', '_').replace('.', ',').replace('_', '.')
+
+    return f'{leading}{formatted}{trailing}'
+
+
+def build_corpus(size: int, seed: int = 42) -> Dict[str, str]:
+    """Build a synthetic corpus of detail pages.
+
+    :param size: int: Number of pages.
+    :param seed: int: Seed of the perturbations, so the corpus is reproducible.
+    :return: Dict[str, str]: The page of each ticker.
+    """
+
+    generator = random.Random(seed)
+    template = HTML_COLLECTOR_MOCK['content']
+
+    corpus = {}
+    for index in range(size):
+        ticker = synthetic_ticker(index)
+        page = __NUMBER.sub(lambda match: __perturb(match, generator), template)
+        corpus[ticker] = page.replace(__MOCK_TICKER, ticker)
+
+    return corpus
+
+
+# pylint: disable=too-few-public-methods
+class StaticHttpRequester(HttpRequesterInterface):
+    """Represents a request answered with a page held in memory."""
+
+    def __init__(self, html: str) -> None:
+        """Initialize the class.
+
+        :param html: str: The page returned by the request.
+        """
+
+        self.__content = html.encode('utf-8')
+
+    def make_request(self) -> RequestContract:
+        """Return the page as a response, without hitting the network.
+
+        :return: RequestContract: Response of the request.
+        """
+
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = 'utf-8'
+        response._content = self.__content  # pylint: disable=protected-access
+
+        return RequestContract(status_code=200, request=None, response=response)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: conftest.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Fixtures shared by the tests."""
+
+import pytest
+
+from fundamentus.cache.memory_cache_backend import MemoryCacheBackend
+from fundamentus.cache.parsed_result_cache import (ParsedResultCache,
+                                                   set_default_parsed_cache)
+from fundamentus.cache.response_cache import ResponseCache, set_default_cache
+from fundamentus.utilities.config import PARSED_CACHE_MAX_ENTRIES
+
+
+@pytest.fixture(autouse=True)
+def fixture_default_caches():
+    """Give each test empty shared caches, kept in memory.
+
+    The shared response cache is stored on disk by default, so the mocked
+    responses of a run would be served to the next one.
+    """
+
+    set_default_cache(ResponseCache(MemoryCacheBackend()))
+    set_default_parsed_cache(ParsedResultCache(MemoryCacheBackend(PARSED_CACHE_MAX_ENTRIES)))
+
+    yield
+
+    set_default_cache(ResponseCache(MemoryCacheBackend()))
+    set_default_parsed_cache(ParsedResultCache(MemoryCacheBackend(PARSED_CACHE_MAX_ENTRIES)))
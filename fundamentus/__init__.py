@@ -24,7 +24,13 @@ empowering investors with comprehensive market analysis.
 
 """
 
+from fundamentus.main.async_fundamentus_pipeline import \
+    AsyncFundamentusPipeline as AsyncPipeline
 from fundamentus.main.fundamentus_pipeline import FundamentusPipeline as Pipeline
+from fundamentus.main.hybrid_pipeline import \
+    HybridFundamentusPipeline as HybridPipeline
+from fundamentus.main.incremental_pipeline import \
+    IncrementalFundamentusPipeline as IncrementalPipeline
 
 
-__all__ = ['Pipeline']
+__all__ = ['AsyncPipeline', 'HybridPipeline', 'IncrementalPipeline', 'Pipeline']
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: cache_backend_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Cache Backend Test."""
+
+import time
+
+import pytest
+
+from .filesystem_cache_backend import FileSystemCacheBackend
+from .memory_cache_backend import MemoryCacheBackend
+from .mocks.fake_redis import FakeRedis
+from .redis_cache_backend import RedisCacheBackend
+from .sqlite_cache_backend import SqliteCacheBackend
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'filesystem', 'redis'])
+def backend(request, tmp_path):
+    """Build each cache backend."""
+
+    if request.param == 'memory':
+        return MemoryCacheBackend()
+    if request.param == 'sqlite':
+        return SqliteCacheBackend(str(tmp_path / 'cache.sqlite'))
+    if request.param == 'filesystem':
+        return FileSystemCacheBackend(str(tmp_path / 'cache'))
+
+    return RedisCacheBackend(FakeRedis())
+
+
+def test_set_and_get(backend) -> None:
+    """Test the set and get methods."""
+
+    assert backend.get('GET https://example.com') is None
+
+    backend.set('GET https://example.com', b'content', ttl=60)
+    backend.set('GET https://example.com', b'new content', ttl=60)
+
+    assert backend.get('GET https://example.com') == b'new content'
+
+
+def test_expiration(backend) -> None:
+    """Test that the entries expire after their time to live."""
+
+    backend.set('expired', b'content', ttl=0.01)
+    backend.set('fresh', b'content', ttl=60)
+
+    time.sleep(0.05)
+
+    assert backend.get('expired') is None
+    assert backend.get('fresh') == b'content'
+
+
+def test_delete_and_clear(backend) -> None:
+    """Test the delete and clear methods."""
+
+    for key in ('a', 'b', 'c'):
+        backend.set(key, key.encode(), ttl=60)
+
+    backend.delete('a')
+    backend.delete('missing')
+
+    assert backend.get('a') is None
+    assert backend.get('b') == b'b'
+
+    backend.clear()
+
+    assert backend.get('b') is None
+    assert backend.get('c') is None
+
+
+def test_memory_backend_is_bounded() -> None:
+    """Test that the least recently used entries are evicted."""
+
+    backend = MemoryCacheBackend(max_entries=2)
+
+    backend.set('a', b'a', ttl=60)
+    backend.set('b', b'b', ttl=60)
+    backend.get('a')
+    backend.set('c', b'c', ttl=60)
+
+    assert len(backend) == 2
+    assert backend.get('b') is None
+    assert backend.get('a') == b'a'
+
+
+def test_redis_backend_prefix() -> None:
+    """Test that clear only evicts the keys of the cache."""
+
+    client = FakeRedis()
+    client.set('other', b'data')
+
+    backend = RedisCacheBackend(client, prefix='fundamentus:')
+    backend.set('key', b'content', ttl=60)
+    backend.clear()
+
+    assert backend.get('key') is None
+    assert client.get('other') == b'data'
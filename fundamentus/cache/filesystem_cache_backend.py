@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: filesystem_cache_backend.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Filesystem Cache Backend - A lock-free cache made of one file per entry."""
+
+import hashlib
+import os
+import struct
+import tempfile
+import time
+from typing import Optional
+
+from fundamentus.drivers.interfaces.cache_backend import CacheBackendInterface
+from fundamentus.utilities.config import CACHE_NAME
+
+# Each file starts with the expiration time of the entry, as a double.
+_EXPIRES_AT = struct.Struct('!d')
+
+
+class FileSystemCacheBackend(CacheBackendInterface):
+    """Represents a cache stored as one file per entry in a directory.
+
+    Files are replaced atomically, so many processes can read and write the cache
+    without sharing a lock.
+    """
+
+    def __init__(self, directory: str = CACHE_NAME) -> None:
+        """Initialize the class, creating the directory if it does not exist.
+
+        :param directory: str: Directory of the cache.
+        """
+
+        self.__directory = directory
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __path(self, key: str) -> str:
+        """Path of the file of the entry.
+
+        :param key: str: Key of the entry.
+        :return: str: Path of the file.
+        """
+
+        return os.path.join(self.__directory, hashlib.sha256(key.encode('utf-8')).hexdigest())
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value stored under the key, or None if missing or expired.
+
+        :param key: str: Key of the entry.
+        :return: Optional[bytes]: The value.
+        """
+
+        try:
+            with open(self.__path(key), 'rb') as entry:
+                content = entry.read()
+        except FileNotFoundError:
+            return None
+
+        expires_at, = _EXPIRES_AT.unpack_from(content)
+        if expires_at <= time.time():
+            self.delete(key)
+            return None
+
+        return content[_EXPIRES_AT.size:]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store the value under the key for ttl seconds.
+
+        :param key: str: Key of the entry.
+        :param value: bytes: The value.
+        :param ttl: float: Seconds before the entry expires.
+        """
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.__directory, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as entry:
+                entry.write(_EXPIRES_AT.pack(time.time() + ttl))
+                entry.write(value)
+            os.replace(temporary_path, self.__path(key))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        """Evict the entry stored under the key, if any.
+
+        :param key: str: Key of the entry.
+        """
+
+        try:
+            os.unlink(self.__path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        """Evict every entry."""
+
+        for name in os.listdir(self.__directory):
+            try:
+                os.unlink(os.path.join(self.__directory, name))
+            except FileNotFoundError:
+                pass
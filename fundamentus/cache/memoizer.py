@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: memoizer.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Memoizer.
+
+This module memoizes the results of the pipeline in the process, in front of the
+HTTP and parsed result caches: a burst of lookups for the same ticker is answered
+from memory, and concurrent lookups of a ticker not yet memoized share a single
+request and parse.
+"""
+
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Hashable, TypeVar
+
+from fundamentus.utilities.config import MEMOIZER_MAX_ENTRIES, MEMOIZER_TTL
+
+T = TypeVar('T')
+
+
+class Memoizer:
+    """Represents a bounded, expiring memo of results, with single-flight computation.
+
+    The memoized results are shared between every caller, so they must not be
+    modified. Failed computations are not memoized.
+
+    Attributes:
+        statistics (Counter): How many lookups were 'hits', 'misses' or 'coalesced'
+                              into a computation in flight, and how many results
+                              were 'evicted' or 'expired'.
+    """
+
+    def __init__(self, max_entries: int = MEMOIZER_MAX_ENTRIES,
+                 ttl: float = MEMOIZER_TTL) -> None:
+        """Initialize the class.
+
+        :param max_entries: int: Maximum number of results kept.
+        :param ttl: float: Seconds a result is reused.
+        """
+
+        self.__max_entries = max_entries
+        self.__ttl = ttl
+        self.__entries = OrderedDict()
+        self.__in_flight = {}
+        self.__lock = threading.Lock()
+        self.statistics = Counter()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the memoized result of the key, computing it on a miss.
+
+        When the key is already being computed by another thread, the call waits
+        for that computation instead of starting a new one.
+
+        :param key: Hashable: Key of the result.
+        :param compute: Callable[[], T]: Computes the result.
+        :return: T: The result.
+        :raises Exception: Whatever the computation raised.
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > time.monotonic():
+                    self.__entries.move_to_end(key)
+                    self.statistics['hits'] += 1
+                    return result
+
+                del self.__entries[key]
+                self.statistics['expired'] += 1
+
+            future = self.__in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self.__in_flight[key] = Future()
+                self.statistics['misses'] += 1
+            else:
+                self.statistics['coalesced'] += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = compute()
+        except BaseException as exception:
+            with self.__lock:
+                del self.__in_flight[key]
+            future.set_exception(exception)
+            raise
+
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + self.__ttl, result)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+                self.statistics['evicted'] += 1
+            del self.__in_flight[key]
+        future.set_result(result)
+
+        return result
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Drop the memoized result of the key, or every result.
+
+        :param key: Hashable: Key of the result. Defaults to every key.
+        """
+
+        with self.__lock:
+            if key is None:
+                self.__entries.clear()
+            else:
+                self.__entries.pop(key, None)
+
+    def __len__(self) -> int:
+        """Number of results kept, expired or not."""
+
+        return len(self.__entries)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: memoizer_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Memoizer Test."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.main.fundamentus_pipeline import FundamentusPipeline
+from fundamentus.utilities.config import URL
+
+from .memoizer import Memoizer
+
+
+def test_get_or_compute() -> None:
+    """Test that a result is computed once and then reused."""
+
+    memoizer = Memoizer()
+
+    assert memoizer.get_or_compute('PETR4', lambda: ['PETR4']) == ['PETR4']
+    assert memoizer.get_or_compute('PETR4', lambda: ['other']) == ['PETR4']
+    assert memoizer.statistics == {'misses': 1, 'hits': 1}
+
+
+def test_expiration_and_eviction() -> None:
+    """Test that the results expire after their TTL and are bounded in number."""
+
+    memoizer = Memoizer(max_entries=2, ttl=0.01)
+    memoizer.get_or_compute('PETR4', lambda: 1)
+
+    time.sleep(0.05)
+
+    assert memoizer.get_or_compute('PETR4', lambda: 2) == 2
+    assert memoizer.statistics['expired'] == 1
+
+    memoizer.get_or_compute('VALE3', lambda: 3)
+    memoizer.get_or_compute('ITUB4', lambda: 4)
+
+    assert len(memoizer) == 2
+    assert memoizer.statistics['evicted'] == 1
+
+
+def test_single_flight() -> None:
+    """Test that concurrent lookups of the same key share a single computation."""
+
+    memoizer = Memoizer()
+    release = threading.Event()
+    calls = []
+
+    def compute() -> str:
+        """Block until every lookup is waiting."""
+
+        calls.append(1)
+        release.wait(timeout=5)
+        return 'VALE3'
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(memoizer.get_or_compute, 'VALE3', compute)
+                   for _ in range(8)]
+
+        while memoizer.statistics['coalesced'] < 7:
+            time.sleep(0.001)
+        release.set()
+
+        assert [future.result() for future in futures] == ['VALE3'] * 8
+
+    assert len(calls) == 1
+    assert memoizer.statistics == {'misses': 1, 'coalesced': 7}
+
+
+def test_errors_are_not_memoized() -> None:
+    """Test that a failed computation is retried on the next lookup."""
+
+    memoizer = Memoizer()
+
+    def fail() -> None:
+        """Fail the computation."""
+
+        raise ValueError('failed')
+
+    with pytest.raises(ValueError):
+        memoizer.get_or_compute('ITUB4', fail)
+
+    assert memoizer.get_or_compute('ITUB4', lambda: 'ITUB4') == 'ITUB4'
+    assert memoizer.statistics == {'misses': 2}
+
+
+def test_pipeline_memoizer(requests_mock) -> None:
+    """Test that pipelines sharing a memoizer reuse the results.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    memoizer = Memoizer()
+
+    first = FundamentusPipeline('MGLU3', memoizer=memoizer).get_all_information()
+    second = FundamentusPipeline('mglu3', memoizer=memoizer).get_all_information()
+
+    assert second is first
+    assert memoizer.statistics == {'misses': 1, 'hits': 1}
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: memory_cache_backend.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Memory Cache Backend - An in-process cache bounded by its number of entries."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fundamentus.drivers.interfaces.cache_backend import CacheBackendInterface
+from fundamentus.utilities.config import CACHE_MAX_ENTRIES
+
+
+class MemoryCacheBackend(CacheBackendInterface):
+    """Represents a least recently used cache kept in memory.
+
+    Entries are private to the process. When the cache is full, the least
+    recently used entry is evicted.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        """Initialize the class.
+
+        :param max_entries: int: Maximum number of entries kept.
+        """
+
+        self.__max_entries = max_entries
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value stored under the key, or None if missing or expired.
+
+        :param key: str: Key of the entry.
+        :return: Optional[bytes]: The value.
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self.__entries[key]
+                return None
+
+            self.__entries.move_to_end(key)
+
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store the value under the key for ttl seconds.
+
+        :param key: str: Key of the entry.
+        :param value: bytes: The value.
+        :param ttl: float: Seconds before the entry expires.
+        """
+
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + ttl, value)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Evict the entry stored under the key, if any.
+
+        :param key: str: Key of the entry.
+        """
+
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Evict every entry."""
+
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        """Number of entries kept, expired or not."""
+
+        return len(self.__entries)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: fake_redis.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""A minimal in-memory stand-in for the redis-py client, used by the tests."""
+
+import fnmatch
+import time
+
+
+class FakeRedis:
+    """Implements the subset of the redis-py client used by the RedisCacheBackend."""
+
+    def __init__(self) -> None:
+        """Initialize the class."""
+
+        self.__data = {}
+
+    def get(self, name: str):
+        """Return the value of the key, or None if missing or expired."""
+
+        entry = self.__data.get(name)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.__data[name]
+            return None
+
+        return value
+
+    def set(self, name: str, value: bytes, px: int = None) -> bool:
+        """Set the value of the key, expiring after px milliseconds."""
+
+        expires_at = None if px is None else time.monotonic() + px / 1000
+        self.__data[name] = (value, expires_at)
+
+        return True
+
+    def delete(self, *names: str) -> int:
+        """Delete the keys, returning how many existed."""
+
+        return sum(self.__data.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match: str = '*'):
+        """Iterate over the keys matching the glob pattern."""
+
+        return iter([name for name in self.__data if fnmatch.fnmatchcase(name, match)])
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: parsed_result_cache.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Parsed Result Cache.
+
+This module caches the transformed information of a page, addressed by the SHA-256
+of its HTML. A page served again, either by the response cache or because it did
+not change on the Fundamentus website, is returned without being parsed and
+transformed again.
+
+The contracts are stored pickled: every hit returns a new copy, so callers can
+modify it freely. The key includes the version of the package, so the results of
+an older parser are never returned.
+"""
+
+import hashlib
+import pickle
+import threading
+from typing import Callable, Optional
+
+from fundamentus._version import __version__
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.interfaces.cache_backend import CacheBackendInterface
+from fundamentus.metrics.instrumentation import increment
+from fundamentus.utilities.config import (PARSED_CACHE_MAX_ENTRIES,
+                                          PARSED_CACHE_TTL)
+from .memory_cache_backend import MemoryCacheBackend
+
+
+class ParsedResultCache:
+    """Represents a cache of transformed pages, addressed by the hash of their HTML.
+
+    A cache without backend is disabled: every page is parsed.
+    """
+
+    def __init__(self, backend: Optional[CacheBackendInterface],
+                 ttl: float = PARSED_CACHE_TTL) -> None:
+        """Initialize the class.
+
+        :param backend: CacheBackendInterface: Backend storing the results.
+                        None disables the cache.
+        :param ttl: float: Seconds before a result expires.
+        """
+
+        self.__backend = backend
+        self.__ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the results are cached."""
+
+        return self.__backend is not None
+
+    @staticmethod
+    def key(kind: str, html: str) -> str:
+        """Key of the result of a page.
+
+        :param kind: str: Kind of the result, e.g. 'all_information' or 'listings'.
+        :param html: str: The HTML of the page.
+        :return: str: The key.
+        """
+
+        sha256 = hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+        return f'parsed:{__version__}:{kind}:{sha256}'
+
+    def get_or_build(self, kind: str, html: str,
+                     build: Callable[[str], TransformContract],
+                     ttl: float = None) -> TransformContract:
+        """Return the cached result of the page, building and storing it on a miss.
+
+        :param kind: str: Kind of the result, e.g. 'all_information' or 'listings'.
+        :param html: str: The HTML of the page.
+        :param build: Callable[[str], TransformContract]: Parses and transforms the HTML.
+        :param ttl: float: Seconds before the result expires, if it is built.
+                    Defaults to the time to live of the cache.
+        :return: TransformContract: The transformed information of the page.
+        :raises ExtractException: If the page is built and its collection fails.
+        :raises TransformException: If the page is built and its transformation fails.
+        """
+
+        if self.__backend is None:
+            return build(html)
+
+        key = self.key(kind, html)
+
+        content = self.__backend.get(key)
+        if content is not None:
+            increment('parsed_cache_hit')
+            return pickle.loads(content)
+
+        increment('parsed_cache_miss')
+        result = build(html)
+        self.__backend.set(key, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL),
+                           self.__ttl if ttl is None else ttl)
+
+        return result
+
+    def clear(self) -> None:
+        """Evict every cached result."""
+
+        if self.__backend is not None:
+            self.__backend.clear()
+
+
+__DEFAULT_CACHE: Optional[ParsedResultCache] = None
+__DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_default_parsed_cache() -> ParsedResultCache:
+    """Return the cache shared by every pipeline, building it on first use.
+
+    The shared cache is kept in memory, bounded by PARSED_CACHE_MAX_ENTRIES.
+
+    :return: ParsedResultCache: The shared cache.
+    """
+
+    global __DEFAULT_CACHE  # pylint: disable=global-statement
+
+    with __DEFAULT_CACHE_LOCK:
+        if __DEFAULT_CACHE is None:
+            __DEFAULT_CACHE = ParsedResultCache(MemoryCacheBackend(PARSED_CACHE_MAX_ENTRIES))
+
+        return __DEFAULT_CACHE
+
+
+def set_default_parsed_cache(cache: ParsedResultCache) -> None:
+    """Replace the cache shared by every pipeline.
+
+    :param cache: ParsedResultCache: The new shared cache. ParsedResultCache(None)
+                  disables caching.
+    """
+
+    global __DEFAULT_CACHE  # pylint: disable=global-statement
+
+    with __DEFAULT_CACHE_LOCK:
+        __DEFAULT_CACHE = cache
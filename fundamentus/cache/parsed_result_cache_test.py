@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: parsed_result_cache_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Parsed Result Cache Test."""
+
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.html_collector import HtmlCollector
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.main.fundamentus_pipeline import FundamentusPipeline
+from fundamentus.utilities.config import URL
+
+from .memory_cache_backend import MemoryCacheBackend
+from .parsed_result_cache import ParsedResultCache
+
+
+class CountingHtmlCollector(HtmlCollector):
+    """Counts how many pages are collected."""
+
+    def __init__(self) -> None:
+        """Initialize the class."""
+
+        super().__init__()
+        self.calls = 0
+
+    def collect_all_information(self, html: str) -> dict:
+        """Count the page and collect it."""
+
+        self.calls += 1
+        return super().collect_all_information(html)
+
+
+def test_get_or_build() -> None:
+    """Test that a page is built once and returned as a new copy afterwards."""
+
+    cache = ParsedResultCache(MemoryCacheBackend())
+    calls = []
+
+    def build(html: str) -> TransformContract:
+        """Build a contract holding the page."""
+
+        calls.append(html)
+        return TransformContract(transformed_information={'html': html})
+
+    first = cache.get_or_build('all_information', '<html>', build)
+    second = cache.get_or_build('all_information', '<html>', build)
+    cache.get_or_build('companies', '<html>', build)
+    cache.get_or_build('all_information', '<html> ', build)
+
+    assert len(calls) == 3
+    assert second == first
+    assert second.transformed_information is not first.transformed_information
+
+
+def test_get_or_build_ttl() -> None:
+    """Test that a result can be kept longer than the time to live of the cache."""
+
+    backend = MemoryCacheBackend()
+    ttls = []
+    store = backend.set
+    backend.set = lambda key, value, ttl: ttls.append(ttl) or store(key, value, ttl)
+
+    def build(html: str) -> TransformContract:
+        """Build a contract holding the page."""
+
+        return TransformContract(transformed_information=html)
+
+    cache = ParsedResultCache(backend, ttl=60)
+    cache.get_or_build('all_information', '<html>', build)
+    cache.get_or_build('listings', '<html>', build, ttl=3600)
+
+    assert ttls == [60, 3600]
+
+
+def test_disabled_cache() -> None:
+    """Test that a cache without backend always builds the page."""
+
+    cache = ParsedResultCache(None)
+    calls = []
+
+    for _ in range(2):
+        cache.get_or_build('all_information', '<html>', calls.append)
+
+    assert not cache.enabled
+    assert len(calls) == 2
+
+
+def test_pipeline_skips_parsing(requests_mock) -> None:
+    """Test that the pipeline does not parse a page seen before.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    cache = ParsedResultCache(MemoryCacheBackend())
+    collector = CountingHtmlCollector()
+
+    first = FundamentusPipeline('MGLU3', collector=collector,
+                                parsed_cache=cache).get_all_information()
+    second = FundamentusPipeline('MGLU3', collector=collector,
+                                 parsed_cache=cache).get_all_information()
+
+    assert collector.calls == 1
+    assert second == first
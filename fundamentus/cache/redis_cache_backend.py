@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: redis_cache_backend.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Redis Cache Backend - A cache shared by every process and machine through a Redis server."""
+
+from typing import Optional
+
+from fundamentus.drivers.interfaces.cache_backend import CacheBackendInterface
+from fundamentus.utilities.config import CACHE_NAME
+
+
+class RedisCacheBackend(CacheBackendInterface):
+    """Represents a cache stored in a Redis compatible server.
+
+    The entries expire on the server itself. Any client exposing the `get`, `set`,
+    `delete` and `scan_iter` methods of redis-py can be used.
+    """
+
+    def __init__(self, client, prefix: str = f'{CACHE_NAME}:') -> None:
+        """Initialize the class.
+
+        :param client: redis.Redis: Client of the server.
+        :param prefix: str: Prefix of the keys, isolating the cache from other data.
+        """
+
+        self.__client = client
+        self.__prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value stored under the key, or None if missing or expired.
+
+        :param key: str: Key of the entry.
+        :return: Optional[bytes]: The value.
+        """
+
+        return self.__client.get(self.__prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store the value under the key for ttl seconds.
+
+        :param key: str: Key of the entry.
+        :param value: bytes: The value.
+        :param ttl: float: Seconds before the entry expires.
+        """
+
+        self.__client.set(self.__prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    def delete(self, key: str) -> None:
+        """Evict the entry stored under the key, if any.
+
+        :param key: str: Key of the entry.
+        """
+
+        self.__client.delete(self.__prefix + key)
+
+    def clear(self) -> None:
+        """Evict every entry under the prefix of the cache."""
+
+        keys = list(self.__client.scan_iter(match=f'{self.__prefix}*'))
+        if keys:
+            self.__client.delete(*keys)
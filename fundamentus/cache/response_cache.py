@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: response_cache.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Response Cache.
+
+This module caches the HTTP responses of the Fundamentus website on a pluggable
+backend. Each endpoint has its own time to live: the listing of the companies
+changes rarely, while the detail page of a ticker and the market results change
+every trading day.
+
+The cache shared by every requester is built on first use from the CACHE_BACKEND
+and CACHE_NAME settings, with the MarketHoursTtl policy, and can be replaced with
+set_default_cache.
+"""
+
+import pickle
+import threading
+from datetime import datetime
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from fundamentus.drivers.interfaces.cache_backend import CacheBackendInterface
+from fundamentus.utilities.config import (CACHE_BACKEND, CACHE_NAME,
+                                          CACHE_TTL, SESSION_CACHE_TTL)
+from fundamentus.utilities.trading_calendar import TradingCalendar
+from .filesystem_cache_backend import FileSystemCacheBackend
+from .memory_cache_backend import MemoryCacheBackend
+from .sqlite_cache_backend import SqliteCacheBackend
+
+
+def endpoint_kind(url: str) -> str:
+    """Return the kind of page of the given URL.
+
+    :param url: str: URL of the request.
+    :return: str: 'detail', 'listing', 'results' or 'default'.
+    """
+
+    split_url = urlsplit(url)
+
+    if split_url.path.endswith('detalhes.php'):
+        if 'papel' in parse_qs(split_url.query):
+            return 'detail'
+
+        return 'listing'
+
+    if split_url.path.endswith('resultado.php'):
+        return 'results'
+
+    return 'default'
+
+
+def endpoint_ttl(url: str) -> float:
+    """Return the time to live of the responses of the given URL.
+
+    :param url: str: URL of the request.
+    :return: float: Seconds before the response expires.
+    """
+
+    return CACHE_TTL[endpoint_kind(url)]
+
+
+class MarketHoursTtl:
+    """Represents a time to live policy following the trading sessions of B3.
+
+    The detail pages and the market results only change while the prices may
+    change: they expire after a short time during a session, and no later than
+    when its closing prices are published; outside of a session they are kept
+    until the next one opens, across nights, weekends and holidays. The other
+    pages expire as in endpoint_ttl.
+    """
+
+    def __init__(self, calendar: TradingCalendar = None,
+                 session_ttl: float = SESSION_CACHE_TTL,
+                 clock: Callable[[], datetime] = None) -> None:
+        """Initialize the class.
+
+        :param calendar: TradingCalendar: The trading sessions. Defaults to the
+                         sessions of B3.
+        :param session_ttl: float: Seconds a page is valid while the prices may change.
+        :param clock: Callable[[], datetime]: Returns the current time.
+                      Defaults to the clock of the calendar.
+        """
+
+        self.__calendar = calendar or TradingCalendar()
+        self.__session_ttl = session_ttl
+        self.__clock = clock or self.__calendar.now
+
+    def __call__(self, url: str) -> float:
+        """Return the time to live of the responses of the given URL, stored now.
+
+        :param url: str: URL of the request.
+        :return: float: Seconds before the response expires.
+        """
+
+        if endpoint_kind(url) not in ('detail', 'results'):
+            return endpoint_ttl(url)
+
+        return self.__calendar.ttl(self.__session_ttl, self.__clock())
+
+
+def create_cache_backend(name: str = CACHE_BACKEND,
+                         location: str = CACHE_NAME) -> CacheBackendInterface:
+    """Build one of the local cache backends by name.
+
+    :param name: str: Name of the backend: 'memory', 'sqlite' or 'filesystem'.
+    :param location: str: Base name of the sqlite file or of the cache directory.
+    :return: CacheBackendInterface: The backend.
+    :raises ValueError: If the backend is unknown.
+    """
+
+    if name == 'memory':
+        return MemoryCacheBackend()
+    if name == 'sqlite':
+        return SqliteCacheBackend(f'{location}.sqlite')
+    if name == 'filesystem':
+        return FileSystemCacheBackend(location)
+
+    raise ValueError(f'Unknown cache backend: {name}.')
+
+
+class ResponseCache:
+    """Represents a cache of HTTP responses stored on a backend.
+
+    Only successful responses are cached. A cache without backend is disabled:
+    nothing is stored and every lookup misses.
+    """
+
+    def __init__(self, backend: Optional[CacheBackendInterface],
+                 ttl: Callable[[str], float] = endpoint_ttl) -> None:
+        """Initialize the class.
+
+        :param backend: CacheBackendInterface: Backend storing the responses.
+                        None disables the cache.
+        :param ttl: Callable[[str], float]: Policy returning the time to live of
+                    the responses of a URL. Defaults to endpoint_ttl.
+        """
+
+        self.__backend = backend
+        self.__ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the responses are cached."""
+
+        return self.__backend is not None
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        """Key of the response of a request.
+
+        :param method: str: HTTP method of the request.
+        :param url: str: URL of the request, including the query string.
+        :return: str: The key.
+        """
+
+        return f'{method.upper()} {url}'
+
+    def get(self, request: requests.PreparedRequest) -> Optional[requests.Response]:
+        """Return the cached response of the request, if any.
+
+        :param request: requests.PreparedRequest: The request.
+        :return: Optional[requests.Response]: The response, flagged with from_cache.
+        """
+
+        if self.__backend is None:
+            return None
+
+        content = self.__backend.get(self.key(request.method, request.url))
+        if content is None:
+            return None
+
+        state = pickle.loads(content)
+
+        response = requests.Response()
+        response.status_code = state['status_code']
+        response.headers.update(state['headers'])
+        response._content = state['content']  # pylint: disable=protected-access
+        response.encoding = state['encoding']
+        response.url = state['url']
+        response.request = request
+        response.from_cache = True
+
+        return response
+
+    def set(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        """Store the response of the request, if it is successful.
+
+        :param request: requests.PreparedRequest: The request.
+        :param response: requests.Response: The response.
+        """
+
+        if self.__backend is None or response.status_code != 200:
+            return
+
+        state = {'status_code': response.status_code,
+                 'headers': dict(response.headers),
+                 'content': response.content,
+                 'encoding': response.encoding,
+                 'url': response.url}
+
+        self.__backend.set(self.key(request.method, request.url),
+                           pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL),
+                           self.__ttl(request.url))
+
+    def evict(self, url: str, method: str = 'GET') -> None:
+        """Evict the cached response of a request.
+
+        :param url: str: URL of the request, including the query string.
+        :param method: str: HTTP method of the request.
+        """
+
+        if self.__backend is not None:
+            self.__backend.delete(self.key(method, url))
+
+    def clear(self) -> None:
+        """Evict every cached response."""
+
+        if self.__backend is not None:
+            self.__backend.clear()
+
+
+__DEFAULT_CACHE: Optional[ResponseCache] = None
+__DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_default_cache() -> ResponseCache:
+    """Return the cache shared by every requester, building it on first use.
+
+    The pages showing the prices expire following the trading sessions of B3.
+
+    :return: ResponseCache: The shared cache.
+    """
+
+    global __DEFAULT_CACHE  # pylint: disable=global-statement
+
+    with __DEFAULT_CACHE_LOCK:
+        if __DEFAULT_CACHE is None:
+            __DEFAULT_CACHE = ResponseCache(create_cache_backend(), ttl=MarketHoursTtl())
+
+        return __DEFAULT_CACHE
+
+
+def set_default_cache(cache: ResponseCache) -> None:
+    """Replace the cache shared by every requester.
+
+    :param cache: ResponseCache: The new shared cache. ResponseCache(None) disables caching.
+    """
+
+    global __DEFAULT_CACHE  # pylint: disable=global-statement
+
+    with __DEFAULT_CACHE_LOCK:
+        __DEFAULT_CACHE = cache
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: response_cache_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Response Cache Test."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fundamentus.drivers.http_requester import HttpRequester
+from fundamentus.drivers.mocks.http_requester import REQUESTER_MOCK
+from fundamentus.utilities.config import CACHE_TTL
+
+from .memory_cache_backend import MemoryCacheBackend
+from .response_cache import (MarketHoursTtl, ResponseCache, create_cache_backend,
+                             endpoint_ttl)
+
+URL = 'https://www.fundamentus.com.br/detalhes.php'
+
+
+def test_endpoint_ttl() -> None:
+    """Test the time to live of each endpoint."""
+
+    assert endpoint_ttl(f'{URL}?papel=WEGE3&interface=mobile') == CACHE_TTL['detail']
+    assert endpoint_ttl(URL) == CACHE_TTL['listing']
+    assert endpoint_ttl('https://www.fundamentus.com.br/resultado.php') == CACHE_TTL['results']
+    assert endpoint_ttl('https://www.fundamentus.com.br/fii_resultado.php') == CACHE_TTL['default']
+
+
+def test_market_hours_ttl() -> None:
+    """Test the prices expire after a short time during a session, and at the next one."""
+
+    brt = timezone(timedelta(hours=-3))
+    detail = f'{URL}?papel=WEGE3&interface=mobile'
+    results = 'https://www.fundamentus.com.br/resultado.php'
+
+    in_session = MarketHoursTtl(session_ttl=900,
+                                clock=lambda: datetime(2026, 3, 13, 12, tzinfo=brt))
+    assert in_session(detail) == 900
+    assert in_session(results) == 900
+    assert in_session(URL) == CACHE_TTL['listing']
+
+    weekend = MarketHoursTtl(session_ttl=900,
+                             clock=lambda: datetime(2026, 3, 14, 12, tzinfo=brt))
+    assert weekend(detail) == timedelta(days=1, hours=22).total_seconds()
+    assert weekend(URL) == CACHE_TTL['listing']
+
+
+def test_create_cache_backend(tmp_path) -> None:
+    """Test create_cache_backend function."""
+
+    assert isinstance(create_cache_backend('memory'), MemoryCacheBackend)
+
+    with pytest.raises(ValueError):
+        create_cache_backend('unknown', str(tmp_path / 'cache'))
+
+
+def test_make_request_with_cache(requests_mock) -> None:
+    """Test that the requester serves the repeated requests from the cache.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    requests_mock.get(url=URL,
+                      status_code=REQUESTER_MOCK['status_code'],
+                      text=REQUESTER_MOCK['content'])
+
+    cache = ResponseCache(MemoryCacheBackend())
+
+    first = HttpRequester(url=URL, params={'papel': 'WEGE3'}, cache=cache).make_request()
+    second = HttpRequester(url=URL, params={'papel': 'WEGE3'}, cache=cache).make_request()
+
+    assert requests_mock.call_count == 1
+    assert not getattr(first.response, 'from_cache', False)
+    assert second.response.from_cache
+    assert second.response.text == REQUESTER_MOCK['content']
+
+    cache.evict(f'{URL}?papel=WEGE3')
+    HttpRequester(url=URL, params={'papel': 'WEGE3'}, cache=cache).make_request()
+
+    assert requests_mock.call_count == 2
+
+
+def test_errors_are_not_cached(requests_mock) -> None:
+    """Test that only the successful responses are cached.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    requests_mock.get(url=URL, status_code=503)
+
+    cache = ResponseCache(MemoryCacheBackend())
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            HttpRequester(url=URL, params={'papel': 'WEGE3'}, cache=cache).make_request()
+
+    assert requests_mock.call_count == 2
+
+
+def test_disabled_cache(requests_mock) -> None:
+    """Test that a cache without backend never stores the responses.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    requests_mock.get(url=URL, text=REQUESTER_MOCK['content'])
+
+    cache = ResponseCache(None)
+
+    for _ in range(2):
+        HttpRequester(url=URL, params={'papel': 'WEGE3'}, cache=cache).make_request()
+
+    assert not cache.enabled
+    assert requests_mock.call_count == 2
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: section_cache.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Section Cache.
+
+This module caches the transformed sections of the detail page of each ticker
+separately, each one with its own time to live: the price derived sections follow
+the trading sessions, as the detail pages of the response cache do, while the
+sections of the financial statements are kept for days. A pipeline reading its
+sections from this cache only requests the page again when one of the sections it
+needs expired.
+
+The sections are stored pickled: every hit returns a new copy, so callers can
+modify it freely. The key includes the version of the package, so the sections of
+an older parser are never returned.
+
+The backend must be dedicated to the sections: clearing the cache clears the whole
+backend, so it must not be shared with the response or the parsed result caches.
+"""
+
+import pickle
+from datetime import datetime
+from typing import (Any, Callable, Dict, Hashable, Iterable, Mapping, Optional,
+                    Tuple)
+
+from fundamentus._version import __version__
+from fundamentus.drivers.interfaces.cache_backend import CacheBackendInterface
+from fundamentus.metrics.instrumentation import increment
+from fundamentus.utilities.config import (CACHE_TTL, PRICE_SECTIONS,
+                                          SECTION_CACHE_TTL, SESSION_CACHE_TTL)
+from fundamentus.utilities.trading_calendar import TradingCalendar
+
+
+def section_ttl(section: str) -> float:
+    """Return the time to live of a transformed section.
+
+    :param section: str: Name of the transformed section.
+    :return: float: Seconds before the section expires. A section not listed in
+             SECTION_CACHE_TTL expires as a detail page does.
+    """
+
+    return SECTION_CACHE_TTL.get(section, CACHE_TTL['detail'])
+
+
+class MarketHoursSectionTtl:
+    """Represents a time to live policy of the sections following the trading sessions of B3.
+
+    The price derived sections expire as the detail pages of MarketHoursTtl: after
+    a short time during a session, and no later than when its closing prices are
+    published; outside of a session they are kept until the next one opens. The
+    other sections expire as in section_ttl.
+    """
+
+    def __init__(self, calendar: TradingCalendar = None,
+                 session_ttl: float = SESSION_CACHE_TTL,
+                 clock: Callable[[], datetime] = None) -> None:
+        """Initialize the class.
+
+        :param calendar: TradingCalendar: The trading sessions. Defaults to the
+                         sessions of B3.
+        :param session_ttl: float: Seconds a price derived section is valid while
+                            the prices may change.
+        :param clock: Callable[[], datetime]: Returns the current time.
+                      Defaults to the clock of the calendar.
+        """
+
+        self.__calendar = calendar or TradingCalendar()
+        self.__session_ttl = session_ttl
+        self.__clock = clock or self.__calendar.now
+
+    def __call__(self, section: str) -> float:
+        """Return the time to live of a transformed section, stored now.
+
+        :param section: str: Name of the transformed section.
+        :return: float: Seconds before the section expires.
+        """
+
+        if section not in PRICE_SECTIONS:
+            return section_ttl(section)
+
+        return self.__calendar.ttl(self.__session_ttl, self.__clock())
+
+
+class SectionCache:
+    """Represents a cache of the transformed sections of the stock detail pages.
+
+    A cache without backend is disabled: every section is missing.
+    """
+
+    def __init__(self, backend: Optional[CacheBackendInterface],
+                 ttl: Callable[[str], float] = None) -> None:
+        """Initialize the class.
+
+        :param backend: CacheBackendInterface: Backend storing the sections, dedicated
+                        to them. None disables the cache.
+        :param ttl: Callable[[str], float]: Policy returning the time to live of a
+                    section, by name. Defaults to a MarketHoursSectionTtl.
+        """
+
+        self.__backend = backend
+        self.__ttl = ttl or MarketHoursSectionTtl()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the sections are cached."""
+
+        return self.__backend is not None
+
+    @staticmethod
+    def key(page: Tuple[Hashable, ...], section: str) -> str:
+        """Key of a section of a page.
+
+        :param page: Tuple[Hashable, ...]: Identity of the page, e.g. its URL,
+                     interface and ticker.
+        :param section: str: Name of the transformed section, e.g. 'balance_sheet'.
+        :return: str: The key.
+        """
+
+        return f'section:{__version__}:{":".join(map(str, page))}:{section}'
+
+    def ttl(self, section: str) -> float:
+        """Seconds before a section expires.
+
+        :param section: str: Name of the transformed section.
+        :return: float: The time to live of the section, stored now.
+        """
+
+        return self.__ttl(section)
+
+    def get(self, page: Tuple[Hashable, ...], sections: Iterable[str]) -> Dict[str, Any]:
+        """Return the sections of the page still fresh.
+
+        :param page: Tuple[Hashable, ...]: Identity of the page.
+        :param sections: Iterable[str]: Names of the transformed sections.
+        :return: Dict[str, Any]: The fresh sections, by name. The missing or
+                 expired ones are left out.
+        """
+
+        fresh = {}
+
+        for section in sections:
+            content = self.__backend.get(self.key(page, section)) if self.enabled else None
+
+            if content is None:
+                increment('section_cache_miss')
+            else:
+                increment('section_cache_hit')
+                fresh[section] = pickle.loads(content)
+
+        return fresh
+
+    def set(self, page: Tuple[Hashable, ...], sections: Mapping[str, Any]) -> None:
+        """Store the sections of the page, each one for its own time to live.
+
+        :param page: Tuple[Hashable, ...]: Identity of the page.
+        :param sections: Mapping[str, Any]: The transformed sections, by name.
+        """
+
+        if not self.enabled:
+            return
+
+        for section, information in sections.items():
+            self.__backend.set(self.key(page, section),
+                               pickle.dumps(information, protocol=pickle.HIGHEST_PROTOCOL),
+                               self.ttl(section))
+
+    def invalidate(self, page: Tuple[Hashable, ...], sections: Iterable[str]) -> None:
+        """Evict the given sections of the page.
+
+        :param page: Tuple[Hashable, ...]: Identity of the page.
+        :param sections: Iterable[str]: Names of the transformed sections.
+        """
+
+        if not self.enabled:
+            return
+
+        for section in sections:
+            self.__backend.delete(self.key(page, section))
+
+    def clear(self) -> None:
+        """Evict every cached section, clearing the whole backend."""
+
+        if self.enabled:
+            self.__backend.clear()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: section_cache_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Section Cache Test."""
+
+from datetime import datetime, timedelta, timezone
+
+from fundamentus.utilities.config import CACHE_TTL, SECTION_CACHE_TTL
+
+from .memory_cache_backend import MemoryCacheBackend
+from .section_cache import MarketHoursSectionTtl, SectionCache, section_ttl
+
+PAGE = ('https://www.fundamentus.com.br/detalhes.php', 'mobile', 'MGLU3')
+
+
+def test_get_and_set() -> None:
+    """Test that each section expires on its own and is returned as a new copy."""
+
+    ttl = {'price_information': 0, 'balance_sheet': 60}
+    cache = SectionCache(MemoryCacheBackend(), ttl=ttl.get)
+    balance_sheet = {'equity': 10}
+
+    cache.set(PAGE, {'price_information': {'price': 4}, 'balance_sheet': balance_sheet})
+    fresh = cache.get(PAGE, ['price_information', 'balance_sheet'])
+
+    assert fresh == {'balance_sheet': balance_sheet}
+    assert fresh['balance_sheet'] is not balance_sheet
+    assert not cache.get(PAGE[:2] + ('WEGE3',), ['balance_sheet'])
+    assert cache.ttl('balance_sheet') == 60
+
+
+def test_section_ttl() -> None:
+    """Test the fixed time to live of each section."""
+
+    assert section_ttl('price_information') == SECTION_CACHE_TTL['price_information']
+    assert section_ttl('balance_sheet') == SECTION_CACHE_TTL['balance_sheet']
+    assert section_ttl('unknown') == CACHE_TTL['detail']
+
+
+def test_market_hours_section_ttl() -> None:
+    """Test the price sections follow the trading sessions, the others keep their time to live."""
+
+    brt = timezone(timedelta(hours=-3))
+
+    in_session = MarketHoursSectionTtl(session_ttl=900,
+                                       clock=lambda: datetime(2026, 3, 13, 12, tzinfo=brt))
+    assert in_session('price_information') == 900
+    assert in_session('balance_sheet') == SECTION_CACHE_TTL['balance_sheet']
+
+    weekend = MarketHoursSectionTtl(session_ttl=900,
+                                    clock=lambda: datetime(2026, 3, 14, 12, tzinfo=brt))
+    assert weekend('valuation_indicators') == timedelta(days=1, hours=22).total_seconds()
+    assert weekend('balance_sheet') == SECTION_CACHE_TTL['balance_sheet']
+
+
+def test_invalidate() -> None:
+    """Test that the given sections are evicted."""
+
+    cache = SectionCache(MemoryCacheBackend())
+
+    cache.set(PAGE, {'price_information': {}, 'balance_sheet': {}})
+    cache.invalidate(PAGE, ['balance_sheet'])
+
+    assert list(cache.get(PAGE, ['price_information', 'balance_sheet'])) == ['price_information']
+
+
+def test_disabled_cache() -> None:
+    """Test that a cache without backend has no section."""
+
+    cache = SectionCache(None)
+    cache.set(PAGE, {'balance_sheet': {}})
+
+    assert not cache.enabled
+    assert not cache.get(PAGE, ['balance_sheet'])
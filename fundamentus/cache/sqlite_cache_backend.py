@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: sqlite_cache_backend.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Sqlite Cache Backend - A cache shared by the processes of a machine through a sqlite file."""
+
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from fundamentus.drivers.interfaces.cache_backend import CacheBackendInterface
+from fundamentus.utilities.config import CACHE_NAME
+
+
+class SqliteCacheBackend(CacheBackendInterface):
+    """Represents a cache stored in a sqlite database in WAL mode.
+
+    WAL lets many readers proceed while a single writer commits. Each thread
+    keeps its own connection.
+    """
+
+    def __init__(self, path: str = f'{CACHE_NAME}.sqlite') -> None:
+        """Initialize the class, creating the database if it does not exist.
+
+        :param path: str: Path of the database file.
+        """
+
+        self.__path = path
+        self.__local = threading.local()
+
+        connection = self.__connection()
+        connection.execute('PRAGMA journal_mode=WAL')
+        with connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS cache ('
+                               'key TEXT PRIMARY KEY, expires_at REAL NOT NULL, '
+                               'value BLOB NOT NULL)')
+
+    def __connection(self) -> sqlite3.Connection:
+        """Return the connection of the current thread.
+
+        :return: sqlite3.Connection: Connection to the database.
+        """
+
+        connection = getattr(self.__local, 'connection', None)
+        if connection is None:
+            connection = self.__local.connection = sqlite3.connect(self.__path, timeout=30)
+            # The cache can be rebuilt, so durability is traded for fewer fsyncs.
+            connection.execute('PRAGMA synchronous=NORMAL')
+
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value stored under the key, or None if missing or expired.
+
+        :param key: str: Key of the entry.
+        :return: Optional[bytes]: The value.
+        """
+
+        row = self.__connection().execute('SELECT value FROM cache WHERE key = ? '
+                                          'AND expires_at > ?', (key, time.time())).fetchone()
+
+        return None if row is None else bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store the value under the key for ttl seconds.
+
+        :param key: str: Key of the entry.
+        :param value: bytes: The value.
+        :param ttl: float: Seconds before the entry expires.
+        """
+
+        connection = self.__connection()
+        with connection:
+            connection.execute('INSERT OR REPLACE INTO cache VALUES (?, ?, ?)',
+                               (key, time.time() + ttl, value))
+
+    def delete(self, key: str) -> None:
+        """Evict the entry stored under the key, if any.
+
+        :param key: str: Key of the entry.
+        """
+
+        connection = self.__connection()
+        with connection:
+            connection.execute('DELETE FROM cache WHERE key = ?', (key,))
+
+    def clear(self) -> None:
+        """Evict every entry."""
+
+        connection = self.__connection()
+        with connection:
+            connection.execute('DELETE FROM cache')
+
+    def purge_expired(self) -> None:
+        """Evict the expired entries, reclaiming their space."""
+
+        connection = self.__connection()
+        with connection:
+            connection.execute('DELETE FROM cache WHERE expires_at <= ?', (time.time(),))
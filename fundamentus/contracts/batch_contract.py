@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: batch_contract.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Batch Contract Module.
+
+Defines the structure returned for each ticker processed by a batch run of the
+Python Fundamentus API. Each contract carries either the transformed information
+of the ticker or the error that prevented it from being processed, so a single
+failure never aborts the whole batch.
+"""
+
+from collections import namedtuple
+
+# A contract for the result of a single ticker inside a batch.
+BatchContract = namedtuple('BatchContract',
+                           ['ticker', 'transform_contract', 'error'])
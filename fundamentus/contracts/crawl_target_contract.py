@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: crawl_target_contract.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Crawl Target Contract Module.
+
+Defines a detail page to be fetched by a crawl, as listed by the companies listing
+of the Python Fundamentus API.
+"""
+
+from collections import namedtuple
+
+# A contract for a detail page to be crawled.
+CrawlTarget = namedtuple('CrawlTarget', ['ticker', 'kind', 'link'])
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: information_contract.py
-#  Version: 0.0.1
+#  Version: 0.0.2
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -21,12 +21,23 @@
 Provides a data structure for storing and managing collected financial information
 within the Python Fundamentus API, using a dataclass for enhanced readability and
 efficiency.
+
+Every ticker holds dozens of items whose titles and tooltips are the same for the
+whole market, so the items are slotted and their strings are interned: a snapshot
+of the market keeps a single copy of each text.
 """
 
+import sys
 from dataclasses import dataclass
 from decimal import Decimal
 
 
+def _intern(value):
+    """Intern the value if it is a string, returning it unchanged otherwise."""
+
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 @dataclass
 class InformationItem:
     """Represents a single item of collected financial information.
@@ -38,6 +49,21 @@ class InformationItem:
                          a Decimal for precision.
     """
 
+    __slots__ = ('title', 'tooltip', 'value')
+
     title: str
     tooltip: str
     value: Decimal
+
+    def __post_init__(self) -> None:
+        """Share the strings of the item with every other item holding the same text."""
+
+        self.title = _intern(self.title)
+        self.tooltip = _intern(self.tooltip)
+        # Text values, such as the sector, repeat across the market too.
+        self.value = _intern(self.value)
+
+    def __reduce__(self) -> tuple:
+        """Rebuild the item through its constructor, so unpickled strings are interned."""
+
+        return self.__class__, (self.title, self.tooltip, self.value)
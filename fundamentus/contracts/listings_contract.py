@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: listings_contract.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Listings Contract Module.
+
+Defines the lists of companies and of property funds of the Python Fundamentus API,
+collected together from the single page listing both.
+"""
+
+from collections import namedtuple
+
+# A contract for both listings, each one a TransformContract.
+ListingsContract = namedtuple('ListingsContract', ['companies', 'property_funds'])
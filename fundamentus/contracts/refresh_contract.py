@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: refresh_contract.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Refresh Contract Module.
+
+Defines the state kept for each ticker by an incremental refresh: the validators
+of the last page fetched and the information transformed from it, so a page that
+did not change is neither collected nor transformed again.
+"""
+
+from collections import namedtuple
+
+# A contract for the last known version of the page of a ticker.
+RefreshContract = namedtuple('RefreshContract',
+                             ['etag', 'last_modified', 'sha256', 'transform_contract'])
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: response_body_contract.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Response Body Contract Module.
+
+Defines the structure of a response body of the service, already encoded as JSON
+and split into chunks that can be streamed, along with its entity tag.
+"""
+
+from collections import namedtuple
+
+ResponseBodyContract = namedtuple('ResponseBodyContract',
+                                  ['chunks', 'etag'])
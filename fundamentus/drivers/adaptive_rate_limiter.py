@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: adaptive_rate_limiter.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Adaptive Rate Limiter.
+
+This module adapts the rate of a token bucket, and the number of requests in flight,
+to the responses of the website, with an additive increase, multiplicative decrease
+(AIMD) control, as TCP does with its congestion window:
+
+    - every healthy response adds a fraction of a request per second, and of a
+      request in flight, so both grow by a fixed step per window of requests;
+    - a throttled response (429 or 503), a failed request or a latency spike divides
+      both by a factor, at most once per cooldown, as the responses of the requests
+      already in flight report the same congestion.
+
+The current rate and concurrency are reported as the `rate_limit` and
+`concurrency_limit` gauges of the instrumentation.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from fundamentus.metrics.instrumentation import increment, set_gauge
+from fundamentus.utilities.config import (ADAPTIVE_COOLDOWN,
+                                          ADAPTIVE_DECREASE_FACTOR,
+                                          ADAPTIVE_LATENCY_FACTOR,
+                                          ADAPTIVE_MAX_RATE,
+                                          ADAPTIVE_MIN_RATE,
+                                          ADAPTIVE_RATE_INCREASE, MAX_WORKERS,
+                                          THROTTLE_STATUS_CODES)
+from .interfaces.rate_limiter import RateLimiterInterface
+from .token_bucket_rate_limiter import TokenBucketRateLimiter
+
+# Weight of the last healthy request in the average latency.
+_LATENCY_WEIGHT = 0.1
+
+# Healthy requests averaged before the latency spikes are detected.
+_LATENCY_WARM_UP = 5
+
+# Seconds between two checks for a free slot, while waiting in the event loop.
+_POLL_INTERVAL = 0.005
+
+
+class AdaptiveRateLimiter(RateLimiterInterface):
+    """Represents a rate limiter adapting its rate and concurrency to the responses."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(self,
+                 bucket: TokenBucketRateLimiter = None,
+                 max_concurrency: int = MAX_WORKERS,
+                 concurrency: int = None,
+                 min_rate: float = ADAPTIVE_MIN_RATE,
+                 max_rate: float = ADAPTIVE_MAX_RATE,
+                 rate_increase: float = ADAPTIVE_RATE_INCREASE,
+                 decrease_factor: float = ADAPTIVE_DECREASE_FACTOR,
+                 latency_factor: float = ADAPTIVE_LATENCY_FACTOR,
+                 cooldown: float = ADAPTIVE_COOLDOWN) -> None:
+        """Initialize the class.
+
+        :param bucket: TokenBucketRateLimiter: Bucket whose rate is adapted, e.g. a
+                       SharedTokenBucketRateLimiter to adapt the rate of every process.
+                       Defaults to a TokenBucketRateLimiter.
+        :param max_concurrency: int: Maximum number of requests in flight.
+        :param concurrency: int: Initial number of requests in flight.
+                            Defaults to half the maximum.
+        :param min_rate: float: Minimum requests per second.
+        :param max_rate: float: Maximum requests per second.
+        :param rate_increase: float: Requests per second added per window of healthy requests.
+        :param decrease_factor: float: Factor applied to the rate and the concurrency
+                                on congestion.
+        :param latency_factor: float: A request this many times slower than the average
+                               is a latency spike.
+        :param cooldown: float: Minimum seconds between two decreases.
+        """
+
+        self.__bucket = bucket or TokenBucketRateLimiter()
+        self.__max_concurrency = max_concurrency
+        self.__concurrency = float(concurrency or max(1, max_concurrency // 2))
+        self.__min_rate = min_rate
+        self.__max_rate = max_rate
+        self.__rate_increase = rate_increase
+        self.__decrease_factor = decrease_factor
+        self.__latency_factor = latency_factor
+        self.__cooldown = cooldown
+
+        self.__in_flight = 0
+        self.__latency = 0.0
+        self.__latency_samples = 0
+        self.__decreased_at = float('-inf')
+        self.__condition = threading.Condition()
+
+        self.__report(self.__bucket.rate)
+
+    @property
+    def rate(self) -> float:
+        """Requests per second currently allowed."""
+
+        return self.__bucket.rate
+
+    @property
+    def concurrency(self) -> int:
+        """Requests in flight currently allowed."""
+
+        return int(self.__concurrency)
+
+    def __report(self, rate: float) -> None:
+        """Report the current rate and concurrency to the instrumentation.
+
+        :param rate: float: Requests per second currently allowed.
+        """
+
+        set_gauge('rate_limit', rate)
+        set_gauge('concurrency_limit', int(self.__concurrency))
+
+    def __try_enter(self) -> bool:
+        """Take a slot for a request in flight, if one is free.
+
+        :return: bool: Whether a slot was taken.
+        """
+
+        with self.__condition:
+            if self.__in_flight < int(self.__concurrency):
+                self.__in_flight += 1
+                return True
+
+            return False
+
+    def __leave(self) -> None:
+        """Free a slot taken for a request that was never sent, keeping the rate."""
+
+        with self.__condition:
+            self.__in_flight -= 1
+            self.__condition.notify_all()
+
+    def acquire(self) -> None:
+        """Block until a slot is free and a token is available, and take them."""
+
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__in_flight < int(self.__concurrency))
+            self.__in_flight += 1
+
+        try:
+            self.__bucket.acquire()
+        except BaseException:
+            self.__leave()
+            raise
+
+    async def acquire_async(self) -> None:
+        """Wait until a slot is free and a token is available, without blocking
+        the event loop, and take them."""
+
+        while not self.__try_enter():
+            await asyncio.sleep(_POLL_INTERVAL)
+
+        try:
+            await self.__bucket.acquire_async()
+        except BaseException:
+            # A task cancelled while waiting for a token gives its slot back.
+            self.__leave()
+            raise
+
+    def __is_congested(self, status_code: Optional[int], seconds: float) -> bool:
+        """Tell whether a response shows the website is congested.
+
+        :param status_code: Optional[int]: Status code of the response, None if the
+                            request failed.
+        :param seconds: float: Duration of the request.
+        :return: bool: Whether the response is throttled, failed or a latency spike.
+        """
+
+        if status_code is None or status_code in THROTTLE_STATUS_CODES:
+            return True
+
+        return (self.__latency_samples >= _LATENCY_WARM_UP
+                and seconds > self.__latency_factor * self.__latency)
+
+    def release(self, status_code: Optional[int], seconds: float) -> None:
+        """Free the slot of the request, and adapt the rate and the concurrency.
+
+        :param status_code: Optional[int]: Status code of the response, None if the
+                            request failed.
+        :param seconds: float: Duration of the request.
+        """
+
+        with self.__condition:
+            self.__in_flight -= 1
+            rate = self.__bucket.rate
+
+            if self.__is_congested(status_code, seconds):
+                now = time.monotonic()
+                if now - self.__decreased_at >= self.__cooldown:
+                    self.__decreased_at = now
+                    rate = max(self.__min_rate, rate * self.__decrease_factor)
+                    self.__bucket.rate = rate
+                    self.__concurrency = max(1.0, self.__concurrency * self.__decrease_factor)
+                    increment('rate_limit_backoff')
+            else:
+                # The latency starts at zero, so the first request sets the average.
+                weight = _LATENCY_WEIGHT if self.__latency_samples else 1.0
+                self.__latency += weight * (seconds - self.__latency)
+                self.__latency_samples += 1
+
+                # A window is as many requests as allowed in flight.
+                window = max(1.0, self.__concurrency)
+                rate = min(self.__max_rate, rate + self.__rate_increase / window)
+                self.__bucket.rate = rate
+                self.__concurrency = min(float(self.__max_concurrency),
+                                         self.__concurrency + 1 / window)
+
+            self.__condition.notify_all()
+
+        self.__report(rate)
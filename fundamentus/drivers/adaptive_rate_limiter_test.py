@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: adaptive_rate_limiter_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Adaptive Rate Limiter Test."""
+
+import asyncio
+import threading
+
+import pytest
+
+from fundamentus.metrics.callback_recorder import CallbackRecorder
+from fundamentus.metrics.instrumentation import set_recorder
+
+from .adaptive_rate_limiter import AdaptiveRateLimiter
+from .token_bucket_rate_limiter import TokenBucketRateLimiter
+
+
+@pytest.fixture(name='gauges')
+def fixture_gauges():
+    """Record the last value of the gauges while the test runs."""
+
+    gauges = {}
+    set_recorder(CallbackRecorder(on_gauge=gauges.__setitem__))
+    try:
+        yield gauges
+    finally:
+        set_recorder(None)
+
+
+def build_rate_limiter(**kwargs) -> AdaptiveRateLimiter:
+    """Build an adaptive rate limiter over a bucket that never waits."""
+
+    return AdaptiveRateLimiter(TokenBucketRateLimiter(rate=4, capacity=1000), **kwargs)
+
+
+def send(rate_limiter: AdaptiveRateLimiter, status_code: int = 200, seconds: float = 0.1) -> None:
+    """Send a request through the rate limiter."""
+
+    rate_limiter.acquire()
+    rate_limiter.release(status_code, seconds)
+
+
+def test_increase_when_healthy(gauges) -> None:
+    """Test the rate and concurrency grow by a step per window of healthy requests."""
+
+    rate_limiter = build_rate_limiter(max_concurrency=8, concurrency=2, rate_increase=1)
+
+    for _ in range(2):
+        send(rate_limiter)
+
+    assert rate_limiter.rate == pytest.approx(5, rel=0.1)
+    assert rate_limiter.concurrency == 2
+
+    for _ in range(40):
+        send(rate_limiter)
+
+    assert rate_limiter.concurrency == 8
+    assert gauges == {'rate_limit': rate_limiter.rate, 'concurrency_limit': 8}
+
+
+@pytest.mark.parametrize('status_code', [429, 503, None])
+def test_decrease_when_throttled(gauges, status_code) -> None:
+    """Test the rate and concurrency are halved once per cooldown when throttled."""
+
+    rate_limiter = build_rate_limiter(max_concurrency=8, concurrency=8, cooldown=60)
+
+    send(rate_limiter, status_code)
+    # The other requests in flight report the same congestion: ignored.
+    send(rate_limiter, status_code)
+
+    assert rate_limiter.rate == pytest.approx(2)
+    assert rate_limiter.concurrency == 4
+    assert gauges == {'rate_limit': pytest.approx(2), 'concurrency_limit': 4}
+
+
+def test_decrease_on_latency_spike() -> None:
+    """Test a request much slower than the average is handled as congestion."""
+
+    rate_limiter = build_rate_limiter(max_concurrency=4, concurrency=4, rate_increase=0,
+                                      latency_factor=3)
+
+    for _ in range(5):
+        send(rate_limiter, seconds=0.1)
+    send(rate_limiter, seconds=0.2)
+
+    assert rate_limiter.concurrency == 4
+
+    send(rate_limiter, seconds=1.0)
+
+    assert rate_limiter.rate == pytest.approx(2)
+    assert rate_limiter.concurrency == 2
+
+
+def test_min_rate() -> None:
+    """Test the rate never goes below the minimum."""
+
+    rate_limiter = build_rate_limiter(min_rate=3, cooldown=0)
+
+    send(rate_limiter, 429)
+    send(rate_limiter, 429)
+
+    assert rate_limiter.rate == 3
+
+
+def test_concurrency_limit() -> None:
+    """Test no more requests than the concurrency are in flight."""
+
+    rate_limiter = build_rate_limiter(max_concurrency=1)
+    rate_limiter.acquire()
+
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (rate_limiter.acquire(), acquired.set()))
+    thread.start()
+
+    assert not acquired.wait(0.1)
+
+    rate_limiter.release(200, 0.1)
+
+    assert acquired.wait(1)
+    thread.join()
+
+
+def test_acquire_async() -> None:
+    """Test the tasks wait for a free slot without blocking the event loop."""
+
+    rate_limiter = build_rate_limiter(max_concurrency=1)
+
+    async def task(index: int, order: list) -> None:
+        await rate_limiter.acquire_async()
+        order.append(index)
+        await asyncio.sleep(0.01)
+        rate_limiter.release(200, 0.01)
+
+    async def main() -> list:
+        order = []
+        await asyncio.gather(*(task(index, order) for index in range(3)))
+        return order
+
+    assert sorted(asyncio.run(main())) == [0, 1, 2]
+
+
+class StalledBucket(TokenBucketRateLimiter):
+    """A bucket whose tokens never come while it is stalled."""
+
+    stalled = True
+
+    def acquire(self) -> None:
+        """Fail while stalled, as an interrupted wait would."""
+
+        if self.stalled:
+            raise KeyboardInterrupt
+
+    async def acquire_async(self) -> None:
+        """Wait forever while stalled."""
+
+        while self.stalled:
+            await asyncio.sleep(0.01)
+
+
+def test_slot_freed_when_acquire_interrupted() -> None:
+    """Test the slot is given back when the wait for a token is interrupted."""
+
+    bucket = StalledBucket()
+    rate_limiter = AdaptiveRateLimiter(bucket, max_concurrency=1)
+
+    with pytest.raises(KeyboardInterrupt):
+        rate_limiter.acquire()
+
+    bucket.stalled = False
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (rate_limiter.acquire(), acquired.set()),
+                              daemon=True)
+    thread.start()
+
+    assert acquired.wait(1)
+    thread.join()
+
+
+def test_slot_freed_when_acquire_async_cancelled() -> None:
+    """Test a task cancelled while waiting for a token gives its slot back."""
+
+    bucket = StalledBucket()
+    rate_limiter = AdaptiveRateLimiter(bucket, max_concurrency=1)
+
+    async def main() -> None:
+        waiting = asyncio.ensure_future(rate_limiter.acquire_async())
+        await asyncio.sleep(0.05)
+        waiting.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        bucket.stalled = False
+        await asyncio.wait_for(rate_limiter.acquire_async(), 1)
+
+    asyncio.run(main())
+    assert rate_limiter.concurrency == 1
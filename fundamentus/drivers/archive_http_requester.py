@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: archive_http_requester.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Archive HTTP Requester - This module records pages into and replays pages from an HtmlArchive."""
+
+from datetime import date
+
+import requests
+
+from fundamentus.contracts.request_contract import RequestContract
+from .html_archive import HtmlArchive
+from .interfaces.http_requester import HttpRequesterInterface
+
+
+# pylint: disable=too-few-public-methods
+class ArchiveHttpRequester(HttpRequesterInterface):
+    """Represents a request replayed from the archive, without hitting the network."""
+
+    def __init__(self, archive: HtmlArchive, ticker: str, fetch_date: date = None) -> None:
+        """Initialize the class.
+
+        :param archive: HtmlArchive: Archive holding the pages.
+        :param ticker: str: Ticker of the page.
+        :param fetch_date: date: Date the page was fetched. Defaults to the latest one.
+        """
+
+        self.__archive = archive
+        self.__ticker = ticker
+        self.__fetch_date = fetch_date
+        self.__fundamentus_request = RequestContract
+
+    def make_request(self) -> RequestContract:
+        """Load the page from the archive and return it as a response.
+
+        :return: RequestContract: Response of the request.
+        :raises KeyError: If the page is not archived.
+        """
+
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = 'utf-8'
+        response._content = self.__archive.load(  # pylint: disable=protected-access
+            self.__ticker, self.__fetch_date).encode('utf-8')
+
+        return self.__fundamentus_request(status_code=response.status_code,
+                                          request=None,
+                                          response=response)
+
+
+# pylint: disable=too-few-public-methods
+class RecordingHttpRequester(HttpRequesterInterface):
+    """Represents a request whose page is stored in the archive once fetched."""
+
+    def __init__(self, requester: HttpRequesterInterface,
+                 archive: HtmlArchive, ticker: str) -> None:
+        """Initialize the class.
+
+        :param requester: HttpRequesterInterface: Requester that fetches the page.
+        :param archive: HtmlArchive: Archive storing the pages.
+        :param ticker: str: Ticker of the page.
+        """
+
+        self.__requester = requester
+        self.__archive = archive
+        self.__ticker = ticker
+
+    def make_request(self) -> RequestContract:
+        """Make the request and archive the page of the response.
+
+        :return: RequestContract: Response of the request.
+        :raises HTTPError: If the request fails.
+        """
+
+        request_contract = self.__requester.make_request()
+
+        self.__archive.store(self.__ticker, request_contract.response.text)
+
+        return request_contract
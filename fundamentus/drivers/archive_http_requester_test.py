@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: archive_http_requester_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Archive HTTP Requester Test."""
+
+from fundamentus.main.fundamentus_pipeline import FundamentusPipeline
+
+from .archive_http_requester import ArchiveHttpRequester, RecordingHttpRequester
+from .html_archive import HtmlArchive
+from .http_requester import HttpRequester
+from .mocks.html_collector import HTML_COLLECTOR_MOCK
+
+
+def test_record_and_replay(requests_mock, tmp_path) -> None:
+    """Test recording a page and replaying it without the network.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    :param pathlib.Path tmp_path: Temporary directory.
+    """
+
+    url = 'https://www.fundamentus.com.br/detalhes.php'
+    archive = HtmlArchive(str(tmp_path))
+
+    requests_mock.get(url=url, text=HTML_COLLECTOR_MOCK['content'])
+
+    requester = RecordingHttpRequester(HttpRequester(url=url, params={'papel': 'MGLU3'}),
+                                       archive, 'MGLU3')
+    recorded = FundamentusPipeline(requester=requester).get_all_information()
+
+    replay = ArchiveHttpRequester(archive, 'MGLU3').make_request()
+    replayed = FundamentusPipeline(
+        requester=ArchiveHttpRequester(archive, 'MGLU3')).get_all_information()
+
+    assert requests_mock.call_count == 1
+    assert replay.status_code == 200
+    assert replay.response.text == HTML_COLLECTOR_MOCK['content']
+    assert replayed == recorded
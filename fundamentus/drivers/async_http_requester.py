@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: async_http_requester.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Async HTTP Requester - This module is responsible for making non-blocking HTTP requests."""
+
+import time
+
+import httpx
+
+from fundamentus.contracts.request_contract import RequestContract
+from fundamentus.utilities.random_user_agent import get_random_user_agent
+from .interfaces.async_http_requester import AsyncHttpRequesterInterface
+from .interfaces.rate_limiter import RateLimiterInterface
+
+
+# pylint: disable=too-few-public-methods
+class AsyncHttpRequester(AsyncHttpRequesterInterface):
+    """Represents a complete asynchronous HTTP request."""
+
+    def __init__(self, url: str, params: dict, client: httpx.AsyncClient = None,
+                 rate_limiter: RateLimiterInterface = None) -> None:
+        """Initialize the class.
+
+        :param url: str: URL to make the request.
+        :param params: dict: Parameters to make the request.
+        :param client: httpx.AsyncClient: Shared client used to make the request.
+                       When omitted, a short-lived client is opened for the request.
+        :param rate_limiter: RateLimiterInterface: Limit on the rate of the requests sent,
+                             told about each response.
+        """
+
+        self.__url = url
+        # Drop empty parameters, as requests does, so the query string is the same.
+        self.__params = {key: value for key, value in params.items() if value is not None}
+        self.__headers = {"User-Agent": get_random_user_agent()}
+        self.__client = client
+        self.__rate_limiter = rate_limiter
+        self.__fundamentus_request = RequestContract
+
+    async def __send_http_request(self, client: httpx.AsyncClient) -> httpx.Response:
+        """Send the HTTP request.
+
+        :param client: httpx.AsyncClient: Client used to send the request.
+        :return: httpx.Response: Response of the request.
+        :raises HTTPStatusError: If the request fails.
+        """
+
+        if self.__rate_limiter is None:
+            response = await client.get(self.__url, params=self.__params, headers=self.__headers)
+        else:
+            acquired = False
+            started = time.perf_counter()
+            status_code = None
+            try:
+                await self.__rate_limiter.acquire_async()
+                acquired = True
+                started = time.perf_counter()
+
+                response = await client.get(self.__url, params=self.__params,
+                                            headers=self.__headers)
+                status_code = response.status_code
+            finally:
+                # A cancelled acquire has already given its slot back.
+                if acquired:
+                    self.__rate_limiter.release(status_code, time.perf_counter() - started)
+
+        response.raise_for_status()
+
+        return response
+
+    async def make_request(self) -> RequestContract:
+        """Make request to the url and return the response.
+
+        :return: RequestContract: Response of the request.
+        :raises HTTPError: If the request fails.
+        """
+
+        if self.__client is not None:
+            response = await self.__send_http_request(self.__client)
+        else:
+            async with httpx.AsyncClient() as client:
+                response = await self.__send_http_request(client)
+
+        return self.__fundamentus_request(status_code=response.status_code,
+                                          request=response.request,
+                                          response=response)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: async_http_requester_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Async HTTP Requester Test."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from .async_http_requester import AsyncHttpRequester
+from .mocks.http_requester import REQUESTER_MOCK
+
+
+def test_make_request() -> None:
+    """Test make_request method."""
+
+    url = 'https://www.fundamentus.com.br/detalhes.php'
+    payload = {'papel': 'MGLU3', 'interface': None}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code=REQUESTER_MOCK['status_code'],
+                              text=REQUESTER_MOCK['content'])
+
+    async def make_request():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            requester = AsyncHttpRequester(url=url, params=payload, client=client)
+            return await requester.make_request()
+
+    fundamentus_response = asyncio.run(make_request())
+
+    assert fundamentus_response.request.method == 'GET'
+    assert str(fundamentus_response.request.url) == f'{url}?papel=MGLU3'
+    assert fundamentus_response.status_code == REQUESTER_MOCK['status_code']
+    assert fundamentus_response.response.text == REQUESTER_MOCK['content']
+
+
+def test_make_request_error() -> None:
+    """Test make_request method with error."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code=404, json={'detail': 'something went wrong.'})
+
+    async def make_request():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            requester = AsyncHttpRequester(url='http://invalid_url.com',
+                                           params={'papel': 'MGLU3'},
+                                           client=client)
+            return await requester.make_request()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(make_request())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: crawl_progress.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Crawl Progress.
+
+This module records, in a SQLite file, the outcome of each ticker of a crawl as soon
+as it completes, so a crawl that stopped halfway can be resumed without fetching
+again the tickers already done.
+"""
+
+import sqlite3
+from collections import Counter
+from contextlib import closing
+from datetime import datetime as dt
+from typing import Dict, Set
+
+__SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    ticker TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    updated_at TEXT NOT NULL
+)
+"""
+
+# Status of a ticker fetched, collected and transformed.
+DONE = 'done'
+# Status of a ticker whose processing raised an error.
+FAILED = 'failed'
+
+
+def _create_progress(path: str) -> None:
+    """Create the progress database.
+
+    :param path: str: Path of the database.
+    """
+
+    with closing(sqlite3.connect(path)) as connection:
+        # WAL lets the progress be read while the crawl records into it.
+        connection.execute('PRAGMA journal_mode=WAL')
+        with connection:
+            connection.execute(__SCHEMA)
+
+
+class CrawlProgress:
+    """Represents the progress of a crawl, persisted to disk."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the class, creating the database if it does not exist.
+
+        :param path: str: Path of the database.
+        """
+
+        self.__path = path
+
+        _create_progress(path)
+
+    def __connect(self) -> sqlite3.Connection:
+        """Open a connection to the database.
+
+        A connection is opened per operation, so the progress can be shared
+        between threads.
+
+        :return: sqlite3.Connection: Connection to the database.
+        """
+
+        return sqlite3.connect(self.__path, timeout=30)
+
+    def record(self, ticker: str, kind: str, error: Exception = None) -> None:
+        """Record the outcome of a ticker, replacing the previous one.
+
+        :param ticker: str: Ticker of the page.
+        :param kind: str: Kind of the ticker, e.g. 'company' or 'property_fund'.
+        :param error: Exception: Error raised while processing the ticker, if any.
+        """
+
+        status = DONE if error is None else FAILED
+        message = None if error is None else f'{type(error).__name__}: {error}'
+
+        with closing(self.__connect()) as connection, connection:
+            connection.execute('INSERT OR REPLACE INTO progress VALUES (?, ?, ?, ?, ?)',
+                               (ticker.upper(), kind, status, message,
+                                dt.now().isoformat(timespec='seconds')))
+
+    def done(self) -> Set[str]:
+        """List the tickers already done.
+
+        :return: Set[str]: The tickers.
+        """
+
+        with closing(self.__connect()) as connection:
+            rows = connection.execute('SELECT ticker FROM progress WHERE status = ?', (DONE,))
+
+            return {ticker for ticker, in rows}
+
+    def failed(self) -> Dict[str, str]:
+        """List the tickers that failed, with their last error.
+
+        :return: Dict[str, str]: The error message of each ticker.
+        """
+
+        with closing(self.__connect()) as connection:
+            rows = connection.execute('SELECT ticker, error FROM progress WHERE status = ?',
+                                      (FAILED,))
+
+            return dict(rows.fetchall())
+
+    def counts(self) -> Counter:
+        """Count the tickers of each status.
+
+        :return: Counter: The number of tickers 'done' and 'failed'.
+        """
+
+        with closing(self.__connect()) as connection:
+            rows = connection.execute('SELECT status, COUNT(*) FROM progress GROUP BY status')
+
+            return Counter(dict(rows.fetchall()))
+
+    def reset(self) -> None:
+        """Forget every ticker, so the next crawl starts over."""
+
+        with closing(self.__connect()) as connection, connection:
+            connection.execute('DELETE FROM progress')
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: crawl_progress_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Crawl Progress Test."""
+
+from .crawl_progress import CrawlProgress
+
+
+def test_record_and_resume(tmp_path) -> None:
+    """Test the outcomes are kept between two instances of the progress.
+
+    :param pathlib.Path tmp_path: Temporary directory.
+    """
+
+    path = str(tmp_path / 'crawl.sqlite')
+
+    progress = CrawlProgress(path)
+    progress.record('mglu3', 'company')
+    progress.record('WEGE3', 'company', ValueError('failed'))
+    progress.record('ABCP11', 'property_fund', ValueError('failed'))
+    # A new outcome replaces the previous one.
+    progress.record('ABCP11', 'property_fund')
+
+    resumed = CrawlProgress(path)
+
+    assert resumed.done() == {'MGLU3', 'ABCP11'}
+    assert resumed.failed() == {'WEGE3': 'ValueError: failed'}
+    assert resumed.counts() == {'done': 2, 'failed': 1}
+
+    resumed.reset()
+
+    assert not resumed.done()
+    assert not resumed.counts()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: html_archive.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""HTML Archive.
+
+This module keeps the raw pages fetched from the Fundamentus website, keyed by ticker
+and fetch date, so the collection and transformation can be re-run offline over the
+history. Pages are stored gzip compressed and addressed by the SHA-256 of their
+content: a page that did not change between two days is stored only once.
+
+Layout of the archive directory:
+
+    manifest.sqlite         (ticker, fetch_date) -> sha256
+    blobs/ab/abcdef....gz   compressed pages, named by their hash
+
+"""
+
+import gzip
+import hashlib
+import os
+import sqlite3
+import tempfile
+from contextlib import closing
+from datetime import date
+from typing import Iterator, List, Tuple
+
+__SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    ticker TEXT NOT NULL,
+    fetch_date TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (ticker, fetch_date)
+)
+"""
+
+
+def _create_manifest(path: str) -> None:
+    """Create the manifest database of the archive.
+
+    :param path: str: Path of the manifest.
+    """
+
+    with closing(sqlite3.connect(path)) as connection:
+        # WAL lets readers replay the archive while another process records into it.
+        connection.execute('PRAGMA journal_mode=WAL')
+        with connection:
+            connection.execute(__SCHEMA)
+
+
+class HtmlArchive:
+    """Represents a content-addressed archive of raw HTML pages."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the class, creating the archive if it does not exist.
+
+        :param path: str: Directory of the archive.
+        """
+
+        self.__path = path
+        self.__blobs = os.path.join(path, 'blobs')
+        self.__manifest = os.path.join(path, 'manifest.sqlite')
+
+        os.makedirs(self.__blobs, exist_ok=True)
+        _create_manifest(self.__manifest)
+
+    def __connect(self) -> sqlite3.Connection:
+        """Open a connection to the manifest.
+
+        A connection is opened per operation, so the archive can be shared
+        between threads and processes.
+
+        :return: sqlite3.Connection: Connection to the manifest.
+        """
+
+        return sqlite3.connect(self.__manifest, timeout=30)
+
+    def __blob_path(self, sha256: str) -> str:
+        """Path of the blob holding the page with the given hash.
+
+        :param sha256: str: Hash of the page.
+        :return: str: Path of the blob.
+        """
+
+        return os.path.join(self.__blobs, sha256[:2], f'{sha256}.gz')
+
+    def __write_blob(self, sha256: str, content: bytes) -> None:
+        """Write the compressed page, unless a page with the same hash is stored.
+
+        :param sha256: str: Hash of the page.
+        :param content: bytes: Content of the page.
+        """
+
+        blob_path = self.__blob_path(sha256)
+        if os.path.exists(blob_path):
+            return
+
+        directory = os.path.dirname(blob_path)
+        os.makedirs(directory, exist_ok=True)
+
+        # Write to a temporary file first, so readers never see a partial blob.
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(file_descriptor, 'wb') as temporary_file:
+                temporary_file.write(gzip.compress(content))
+            os.replace(temporary_path, blob_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def store(self, ticker: str, html: str, fetch_date: date = None) -> str:
+        """Store the page of a ticker fetched on the given date.
+
+        Storing the same ticker and date again replaces the previous page.
+
+        :param ticker: str: Ticker of the page.
+        :param html: str: Content of the page.
+        :param fetch_date: date: Date the page was fetched. Defaults to today.
+        :return: str: The SHA-256 of the page.
+        """
+
+        content = html.encode('utf-8')
+        sha256 = hashlib.sha256(content).hexdigest()
+        fetch_date = fetch_date or date.today()
+
+        self.__write_blob(sha256, content)
+
+        with closing(self.__connect()) as connection, connection:
+            connection.execute('INSERT OR REPLACE INTO pages VALUES (?, ?, ?)',
+                               (ticker.upper(), fetch_date.isoformat(), sha256))
+
+        return sha256
+
+    def load(self, ticker: str, fetch_date: date = None) -> str:
+        """Load the page of a ticker.
+
+        :param ticker: str: Ticker of the page.
+        :param fetch_date: date: Date the page was fetched. Defaults to the latest one.
+        :return: str: Content of the page.
+        :raises KeyError: If the page is not archived.
+        """
+
+        with closing(self.__connect()) as connection:
+            if fetch_date is None:
+                row = connection.execute('SELECT sha256 FROM pages WHERE ticker = ? '
+                                         'ORDER BY fetch_date DESC LIMIT 1',
+                                         (ticker.upper(),)).fetchone()
+            else:
+                row = connection.execute('SELECT sha256 FROM pages '
+                                         'WHERE ticker = ? AND fetch_date = ?',
+                                         (ticker.upper(), fetch_date.isoformat())).fetchone()
+
+        if row is None:
+            raise KeyError(f'No archived page for {ticker} on {fetch_date or "any date"}.')
+
+        return self.load_blob(row[0])
+
+    def load_blob(self, sha256: str) -> str:
+        """Load a page by its hash.
+
+        :param sha256: str: Hash of the page.
+        :return: str: Content of the page.
+        """
+
+        with open(self.__blob_path(sha256), 'rb') as blob:
+            return gzip.decompress(blob.read()).decode('utf-8')
+
+    def tickers(self) -> List[str]:
+        """List the archived tickers.
+
+        :return: List[str]: The tickers, sorted.
+        """
+
+        with closing(self.__connect()) as connection:
+            rows = connection.execute('SELECT DISTINCT ticker FROM pages ORDER BY ticker')
+
+            return [ticker for ticker, in rows]
+
+    def dates(self, ticker: str) -> List[date]:
+        """List the dates a ticker was archived on.
+
+        :param ticker: str: Ticker of the pages.
+        :return: List[date]: The dates, sorted.
+        """
+
+        with closing(self.__connect()) as connection:
+            rows = connection.execute('SELECT fetch_date FROM pages WHERE ticker = ? '
+                                      'ORDER BY fetch_date', (ticker.upper(),))
+
+            return [date.fromisoformat(fetch_date) for fetch_date, in rows]
+
+    def entries(self, start: date = None, end: date = None) -> Iterator[Tuple[str, date, str]]:
+        """List the archived pages, optionally within a range of dates.
+
+        :param start: date: First fetch date included. Defaults to the oldest one.
+        :param end: date: Last fetch date included. Defaults to the newest one.
+        :return: Iterator[Tuple[str, date, str]]: The ticker, fetch date and hash of
+                 each page, sorted by date and ticker.
+        """
+
+        query = 'SELECT ticker, fetch_date, sha256 FROM pages WHERE fetch_date >= ? ' \
+                'AND fetch_date <= ? ORDER BY fetch_date, ticker'
+        bounds = ((start or date.min).isoformat(), (end or date.max).isoformat())
+
+        with closing(self.__connect()) as connection:
+            rows = connection.execute(query, bounds).fetchall()
+
+        for ticker, fetch_date, sha256 in rows:
+            yield ticker, date.fromisoformat(fetch_date), sha256
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: html_archive_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""HTML Archive Test."""
+
+import os
+from datetime import date
+
+import pytest
+
+from .html_archive import HtmlArchive
+from .mocks.html_collector import HTML_COLLECTOR_MOCK
+
+
+def test_store_and_load(tmp_path) -> None:
+    """Test storing and loading pages.
+
+    :param pathlib.Path tmp_path: Temporary directory.
+    """
+
+    archive = HtmlArchive(str(tmp_path))
+
+    archive.store('mglu3', HTML_COLLECTOR_MOCK['content'], date(2024, 1, 1))
+    archive.store('MGLU3', 'changed', date(2024, 1, 2))
+
+    assert archive.load('MGLU3', date(2024, 1, 1)) == HTML_COLLECTOR_MOCK['content']
+    assert archive.load('MGLU3') == 'changed'
+    assert archive.tickers() == ['MGLU3']
+    assert archive.dates('MGLU3') == [date(2024, 1, 1), date(2024, 1, 2)]
+
+    with pytest.raises(KeyError):
+        archive.load('MGLU3', date(2024, 1, 3))
+
+
+def test_store_deduplicates_unchanged_pages(tmp_path) -> None:
+    """Test an unchanged page is stored only once.
+
+    :param pathlib.Path tmp_path: Temporary directory.
+    """
+
+    archive = HtmlArchive(str(tmp_path))
+
+    first = archive.store('MGLU3', HTML_COLLECTOR_MOCK['content'], date(2024, 1, 1))
+    second = archive.store('MGLU3', HTML_COLLECTOR_MOCK['content'], date(2024, 1, 2))
+
+    blobs = [name for _, _, names in os.walk(tmp_path / 'blobs') for name in names]
+
+    assert first == second
+    assert len(blobs) == 1
+    assert os.path.getsize(tmp_path / 'blobs' / first[:2] / f'{first}.gz') < \
+        len(HTML_COLLECTOR_MOCK['content'])
+    assert list(archive.entries(start=date(2024, 1, 2))) == [('MGLU3', date(2024, 1, 2), first)]
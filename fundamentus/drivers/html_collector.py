@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: http_requester.py
-#  Version: 0.1.1
+#  Version: 0.1.6
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -21,10 +21,14 @@ This module is responsible for collecting the HTML information from the response
 
 """
 
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 from bs4 import BeautifulSoup as bs
 
+from fundamentus.exceptions.stock_not_found_error import StockNotFoundError
+from fundamentus.metrics.instrumentation import instrumented, timed
+from fundamentus.utilities.market_results import RESULTS_COLUMNS, TICKER_COLUMN
+from fundamentus.utilities.sections import RAW_SECTIONS
 from .interfaces.html_collector import HtmlCollectorInterface
 
 
@@ -841,78 +845,90 @@ class HtmlCollector(HtmlCollectorInterface):
 
         return {'twelve_months': twelve_months, 'three_months': three_months}
 
-    def collect_all_information(self, html: str) -> Dict:
-        """Collect information from the html.
-
-        param: html (str): HTML content.
+    def parse_document(self, html: str) -> bs:
+        """Parse the html of a stock, for its sections to be collected.
 
-        :return: dict: Dictionary with the collected information.
+        :param html (str): HTML content.
+        :return (bs): BeautifulSoup object of the page.
+        :raises StockNotFoundError: If the HTML content is not from a stock.
         """
 
-        soup = bs(html, 'html.parser')
+        with timed('parse'):
+            soup = bs(html, 'html.parser')
 
         if soup.find('table',
                      {'class': 'table table-default table-sort table-resultados-trimestrais'}):
-            raise ValueError('The HTML content is not from a stock.')
+            raise StockNotFoundError('The HTML content is not from a stock.')
 
-        # Extract the identification of the stock.
-        stock_identification = self.__extraction_stock_identification(soup)
+        return soup
 
-        # Extract the financial summary of the stock.
-        financial_summary = self.__extraction_financial_summary(soup)
+    def collect_section(self, document: bs, section: str) -> Dict:
+        """Collect a raw section from the parsed page.
 
-        # Extract the price of the stock.
-        price = self.__extraction_price(soup)
+        :param document (bs): BeautifulSoup object returned by parse_document.
+        :param section (str): Name of the raw section, e.g. 'balance_sheet'.
+        :return: dict: Dictionary with the collected section.
+        :raises ValueError: If the section is unknown.
+        """
 
-        # Extract the detailed information of the stock.
-        detailed_information = self.__extraction_detailed_information(soup)
+        extractions = {
+            'identification': self.__extraction_stock_identification,
+            'financial_summary': self.__extraction_financial_summary,
+            'price': self.__extraction_price,
+            'detailed_information': self.__extraction_detailed_information,
+            'oscillations': self.__extraction_oscillations,
+            'valuation_indicators': self.__extraction_valuation_indicators,
+            'profitability_indicators': self.__extraction_profitability_indicators,
+            'indebtedness_indicators': self.__extraction_indebtedness_indicators,
+            'balance_sheet': self.__extraction_balance_sheet,
+            'income_statement': self.__extraction_income_statement
+        }
 
-        # Extract the oscillations of the stock.
-        oscillations = self.__extraction_oscillations(soup)
+        if section not in extractions:
+            raise ValueError(f'Unknown section: {section}.')
 
-        # Extract the stock valuation indicators.
-        valuation_indicators = self.__extraction_valuation_indicators(soup)
+        return extractions[section](document)
 
-        # Extract the stock profitability indicators.
-        profitability_indicators = self.__extraction_profitability_indicators(
-            soup)
+    @instrumented('collect')
+    def collect_all_information(self, html: str, sections: Iterable[str] = None) -> Dict:
+        """Collect information from the html.
 
-        # Extract the stock indebtedness indicators.
-        indebtedness_indicators = self.__extraction_indebtedness_indicators(
-            soup)
+        param: html (str): HTML content.
+        param: sections (Iterable[str]): Raw sections to collect. Defaults to every section.
 
-        # Extract the stock balance sheet.
-        balance_sheet = self.__extraction_balance_sheet(soup)
+        :return: dict: Dictionary with the collected information.
+        """
 
-        # Extract the stock income statement.
-        income_statement = self.__extraction_income_statement(soup)
+        soup = self.parse_document(html)
 
-        return {
-            'identification': stock_identification,
-            'financial_summary': financial_summary,
-            'price': price,
-            'detailed_information': detailed_information,
-            'oscillations': oscillations,
-            'valuation_indicators': valuation_indicators,
-            'profitability_indicators': profitability_indicators,
-            'indebtedness_indicators': indebtedness_indicators,
-            'balance_sheet': balance_sheet,
-            'income_statement': income_statement
-        }
+        return {section: self.collect_section(soup, section)
+                for section in (RAW_SECTIONS if sections is None else sections)}
 
-    def collect_list_of_companies(self, html: str) -> List[Dict]:
-        """Collect list of companies from Fundamentus website.
+    @staticmethod
+    def __processing_listing_tables(html: str) -> List[bs]:
+        """Parse the listing page, finding its tables.
 
-         param: html (str): HTML content.
-        :return: list: list of companies collected.
+        :param html (str): HTML content.
+        :return (List[bs]): The table of the companies, then of the property funds.
         """
 
-        soup = bs(html, 'html.parser')
-        tables = soup.find_all('table', {
+        with timed('parse'):
+            soup = bs(html, 'html.parser')
+
+        return soup.find_all('table', {
             'class':
             'table table-default table-sort table-resultados-trimestrais'
         })
-        companies = tables[0].find_all('tr')
+
+    @staticmethod
+    def __processing_companies(table: bs) -> List[Dict]:
+        """Process the table of the companies.
+
+        :param table (bs): BeautifulSoup object of the table.
+        :return (List[Dict]): list of companies collected.
+        """
+
+        companies = table.find_all('tr')
 
         companies_list = []
         for company in companies[1:]:
@@ -928,19 +944,15 @@ class HtmlCollector(HtmlCollectorInterface):
 
         return companies_list
 
-    def collect_list_of_property_funds(self, html: str) -> List[Dict]:
-        """Collect list of companies from Fundamentus website.
+    @staticmethod
+    def __processing_property_funds(table: bs) -> List[Dict]:
+        """Process the table of the property funds.
 
-         param: html (str): HTML content.
-        :return: list: list of companies collected.
+        :param table (bs): BeautifulSoup object of the table.
+        :return (List[Dict]): list of property funds collected.
         """
 
-        soup = bs(html, 'html.parser')
-        tables = soup.find_all('table', {
-            'class':
-            'table table-default table-sort table-resultados-trimestrais'
-        })
-        funds = tables[1].find_all('tr')
+        funds = table.find_all('tr')
 
         funds_list = []
         for fund in funds[1:]:
@@ -954,3 +966,93 @@ class HtmlCollector(HtmlCollectorInterface):
             })
 
         return funds_list
+
+    @instrumented('collect')
+    def collect_list_of_companies(self, html: str) -> List[Dict]:
+        """Collect list of companies from Fundamentus website.
+
+         param: html (str): HTML content.
+        :return: list: list of companies collected.
+        """
+
+        return self.__processing_companies(self.__processing_listing_tables(html)[0])
+
+    @instrumented('collect')
+    def collect_list_of_property_funds(self, html: str) -> List[Dict]:
+        """Collect list of companies from Fundamentus website.
+
+         param: html (str): HTML content.
+        :return: list: list of companies collected.
+        """
+
+        return self.__processing_property_funds(self.__processing_listing_tables(html)[1])
+
+    @instrumented('collect')
+    def collect_listings(self, html: str) -> Dict[str, List[Dict]]:
+        """Collect the lists of companies and of property funds, parsing the page once.
+
+        param: html (str): HTML content.
+        :return: dict: list of companies and list of property funds collected.
+        """
+
+        companies, property_funds = self.__processing_listing_tables(html)[:2]
+
+        return {'companies': self.__processing_companies(companies),
+                'property_funds': self.__processing_property_funds(property_funds)}
+
+    @staticmethod
+    def __processing_results_header(header: bs) -> List[str]:
+        """Process a header of the market results table.
+
+        :param header (bs): BeautifulSoup object of the header cell.
+        :return (List[str]): The title and the tooltip of the column.
+        """
+
+        title = ' '.join(header.text.split())
+        tip = header if header.get('title') else header.find(title=True)
+
+        return [title, tip['title'] if tip is not None else '']
+
+    @instrumented('collect')
+    def collect_market_results(self, html: str) -> List[Dict]:
+        """Collect the indicators of every stock from the market results page.
+
+        Each known column is collected in the raw section and key of the same
+        indicator in the stock detail page, as [title, tooltip, value].
+
+        param: html (str): HTML content.
+        :return: list: raw information of each stock, in the order of the table.
+        :raises ValueError: If the HTML content is not the market results.
+        """
+
+        with timed('parse'):
+            soup = bs(html, 'html.parser')
+        table = soup.find('table', {'id': 'resultado'})
+
+        if table is None:
+            raise ValueError('The HTML content is not the market results.')
+
+        columns = [self.__processing_results_header(header)
+                   for header in table.find('thead').find_all('th')]
+        ticker_column = [title for title, _ in columns].index(TICKER_COLUMN)
+
+        results = []
+        for row in table.find('tbody').find_all('tr'):
+            cells = row.find_all('td')
+            name = cells[ticker_column].find(title=True)
+
+            stock = {
+                'identification': {
+                    'symbol': [cells[ticker_column].text.strip()],
+                    'name': [name['title'] if name is not None else '']
+                }
+            }
+
+            for (title, tooltip), cell in zip(columns, cells):
+                if title in RESULTS_COLUMNS:
+                    section, key = RESULTS_COLUMNS[title]
+                    stock.setdefault(section, {})[key] = [title, tooltip, cell.text]
+
+            results.append(stock)
+
+        return results
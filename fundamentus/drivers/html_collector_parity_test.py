@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: html_collector_parity_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Html Collector Parity Test
+
+Every parser engine must collect exactly the same information as the HtmlCollector.
+"""
+
+import pytest
+
+from .html_collector import HtmlCollector
+from .mocks.companies_list import COMPANIES_LIST_MOCK
+from .mocks.html_collector import HTML_COLLECTOR_MOCK
+
+ENGINES = [
+    ('single_pass_html_collector', 'SinglePassHtmlCollector', None),
+    ('lxml_html_collector', 'LxmlHtmlCollector', 'lxml'),
+    ('selectolax_html_collector', 'SelectolaxHtmlCollector', 'selectolax'),
+]
+
+
+@pytest.fixture(name='collector', params=ENGINES, ids=[engine[1] for engine in ENGINES])
+def fixture_collector(request) -> HtmlCollector:
+    """Build each parser engine, skipping the ones not installed.
+
+    :param pytest.FixtureRequest request: The engine to build.
+    """
+
+    module_name, class_name, dependency = request.param
+
+    if dependency is not None:
+        pytest.importorskip(dependency)
+
+    module = __import__(f'fundamentus.drivers.{module_name}', fromlist=[class_name])
+
+    return getattr(module, class_name)()
+
+
+def test_collect_all_information_parity(collector) -> None:
+    """Test collect all information returns the same as the HtmlCollector.
+
+    :param HtmlCollector collector: The parser engine.
+    """
+
+    expected = HtmlCollector().collect_all_information(HTML_COLLECTOR_MOCK['content'])
+    collect_information = collector.collect_all_information(HTML_COLLECTOR_MOCK['content'])
+
+    assert repr(collect_information) == repr(expected)
+
+
+def test_collect_sections_parity(collector) -> None:
+    """Test collect a subset of the sections returns the same as the HtmlCollector.
+
+    :param HtmlCollector collector: The parser engine.
+    """
+
+    sections = ['price', 'balance_sheet']
+    expected = HtmlCollector().collect_all_information(HTML_COLLECTOR_MOCK['content'])
+    collect_information = collector.collect_all_information(HTML_COLLECTOR_MOCK['content'],
+                                                            sections)
+
+    assert list(collect_information) == sections
+    assert repr(collect_information) == repr({section: expected[section]
+                                              for section in sections})
+
+
+def test_collect_all_information_from_listing(collector) -> None:
+    """Test collect all information from a page that is not from a stock.
+
+    :param HtmlCollector collector: The parser engine.
+    """
+
+    with pytest.raises(ValueError):
+        collector.collect_all_information(COMPANIES_LIST_MOCK['content'])
+
+
+def test_collect_list_of_companies_parity(collector) -> None:
+    """Test collect list of companies returns the same as the HtmlCollector.
+
+    :param HtmlCollector collector: The parser engine.
+    """
+
+    expected = HtmlCollector().collect_list_of_companies(COMPANIES_LIST_MOCK['content'])
+
+    assert collector.collect_list_of_companies(COMPANIES_LIST_MOCK['content']) == expected
@@ -18,9 +18,12 @@
 
 """Html Collector Test"""
 
+import pytest
+
 from .html_collector import HtmlCollector
 from .mocks.companies_list import COMPANIES_LIST_MOCK
 from .mocks.html_collector import HTML_COLLECTOR_MOCK
+from .mocks.market_results import MARKET_RESULTS_MOCK
 
 
 def test_collect_all_information() -> None:
@@ -68,3 +71,43 @@ def test_collect_list_of_property_funds() -> None:
 
     assert isinstance(collect_list_of_property_funds, list)
     assert isinstance(collect_list_of_property_funds[0], dict)
+
+
+def test_collect_listings() -> None:
+    """Test collect both listings at once."""
+
+    collector = HtmlCollector()
+    listings = collector.collect_listings(COMPANIES_LIST_MOCK['content'])
+
+    assert listings == {
+        'companies': collector.collect_list_of_companies(COMPANIES_LIST_MOCK['content']),
+        'property_funds': collector.collect_list_of_property_funds(
+            COMPANIES_LIST_MOCK['content'])
+    }
+
+
+def test_collect_market_results() -> None:
+    """Test collect market results."""
+
+    collector = HtmlCollector()
+    market_results = collector.collect_market_results(MARKET_RESULTS_MOCK['content'])
+
+    assert [stock['identification']['symbol'][0]
+            for stock in market_results] == ['AALR3', 'ABCB4', 'MGLU3', 'PETR4']
+
+    stock = market_results[2]
+    assert stock['identification']['name'] == ['MAGAZ LUIZA']
+    assert stock['price']['price'] == ['Cotação',
+                                       'Cotação de fechamento da ação no último pregão',
+                                       '8,79']
+    assert stock['valuation_indicators']['price_divided_by_profit_title'][2] == '-12,35'
+    assert stock['balance_sheet']['equity'][2] == '10.937.800.000,00'
+
+
+def test_collect_market_results_exception() -> None:
+    """Test collect market results from a page without the results."""
+
+    collector = HtmlCollector()
+
+    with pytest.raises(ValueError):
+        collector.collect_market_results(COMPANIES_LIST_MOCK['content'])
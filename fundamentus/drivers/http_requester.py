@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: http_requester.py
-#  Version: 0.0.5
+#  Version: 0.0.11
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -17,32 +17,67 @@
 # ------------------------------------------------------------------------------
 """HTTP Requester - This module is responsible for making HTTP requests."""
 
+import time
+
 import requests
-import requests_cache
 
+from fundamentus.cache.response_cache import ResponseCache, get_default_cache
 from fundamentus.contracts.request_contract import RequestContract
+from fundamentus.metrics.instrumentation import increment, observe, timed
+from fundamentus.utilities.config import THROTTLE_STATUS_CODES
 from fundamentus.utilities.random_user_agent import get_random_user_agent
+from .http_session import get_shared_session
 from .interfaces.http_requester import HttpRequesterInterface
+from .interfaces.rate_limiter import RateLimiterInterface
 
 
 # pylint: disable=too-few-public-methods
 class HttpRequester(HttpRequesterInterface):
     """Represents a complete HTTP request."""
 
-    def __init__(self, url: str, params: dict) -> None:
+    def __init__(self, url: str, params: dict, session: requests.Session = None,
+                 headers: dict = None, cache: ResponseCache = None,
+                 rate_limiter: RateLimiterInterface = None) -> None:
         """Initialize the class.
 
         :param url: str: URL to make the request.
         :param params: dict: Parameters to make the request.
+        :param session: requests.Session: Session used to send the request.
+                        Defaults to the pooled session shared by every requester.
+        :param headers: dict: Extra headers of the request, e.g. conditional headers.
+        :param cache: ResponseCache: Cache of the responses.
+                      Defaults to the cache shared by every requester.
+        :param rate_limiter: RateLimiterInterface: Limit on the rate of the requests sent,
+                             told about each response. Responses served from the cache
+                             are not limited.
         """
 
         self.__url = url
         self.__params = params
-        self.__headers = {"User-Agent": get_random_user_agent()}
+        self.__headers = {"User-Agent": get_random_user_agent(), **(headers or {})}
+        self.__session = session
+        self.__cache = cache
+        self.__rate_limiter = rate_limiter
         self.__fundamentus_request = RequestContract
 
     @staticmethod
-    def __send_http_request(prepared_request: requests.PreparedRequest) -> requests.Response:
+    def __reported_status(response: requests.Response) -> int:
+        """Status code reported to the rate limiter.
+
+        A throttled status retried by the session is reported, even if a retry succeeded.
+
+        :param response: requests.Response: Response of the request.
+        :return: int: The status code.
+        """
+
+        retries = getattr(response.raw, 'retries', None)
+        for attempt in getattr(retries, 'history', None) or ():
+            if attempt.status in THROTTLE_STATUS_CODES:
+                return attempt.status
+
+        return response.status_code
+
+    def __send_http_request(self, prepared_request: requests.PreparedRequest) -> requests.Response:
         """Send the HTTP request.
 
         :param prepared_request: requests.PreparedRequest: Prepared request.
@@ -50,17 +85,42 @@ class HttpRequester(HttpRequesterInterface):
         :raises HTTPError: If the request fails.
         """
 
-        # Cache is expired after 12 hours (43200 seconds).
-        requests_cache.install_cache(cache_name='fundamentus_cache',
-                                     backend='sqlite',
-                                     expire_after=43200)
-
-        with requests.Session() as session:
-            response = session.send(prepared_request)
-
-            response.raise_for_status()
-
-            return response
+        cache = self.__cache or get_default_cache()
+
+        with timed('response_cache_lookup'):
+            response = cache.get(prepared_request)
+
+        if response is not None:
+            increment('response_cache_hit')
+        else:
+            increment('response_cache_miss')
+
+            acquired = False
+            started = time.perf_counter()
+            status_code = None
+            try:
+                if self.__rate_limiter is not None:
+                    self.__rate_limiter.acquire()
+                    acquired = True
+                    started = time.perf_counter()
+
+                session = self.__session or get_shared_session()
+                response = session.send(prepared_request)
+                status_code = self.__reported_status(response)
+            finally:
+                # A failed acquire has already given its slot back.
+                if acquired:
+                    self.__rate_limiter.release(status_code, time.perf_counter() - started)
+            # The elapsed time stops when the headers are parsed, the rest is the body.
+            observe('request', response.elapsed.total_seconds())
+            observe('download', time.perf_counter() - started - response.elapsed.total_seconds())
+            increment('bytes_downloaded', len(response.content))
+
+            cache.set(prepared_request, response)
+
+        response.raise_for_status()
+
+        return response
 
     def make_request(self) -> RequestContract:
         """Make request to the url and return the response.
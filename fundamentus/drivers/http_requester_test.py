@@ -21,7 +21,10 @@
 import pytest
 from requests.exceptions import RequestException
 
+from fundamentus.cache.response_cache import ResponseCache
+
 from .http_requester import HttpRequester
+from .token_bucket_rate_limiter import TokenBucketRateLimiter
 from .mocks.http_requester import REQUESTER_MOCK
 
 
@@ -67,3 +70,32 @@ def test_make_request_error(requests_mock) -> None:
         requester.make_request()
     except RequestException as error:
         assert error is not None
+
+
+def test_make_request_reports_to_rate_limiter(requests_mock) -> None:
+    """Test the rate limiter is acquired and told the status of the response.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    class RecordingRateLimiter(TokenBucketRateLimiter):
+        """A rate limiter recording the reported responses."""
+
+        def __init__(self) -> None:
+            super().__init__(rate=100, capacity=10)
+            self.releases = []
+
+        def release(self, status_code, seconds) -> None:
+            self.releases.append(status_code)
+
+    url = 'https://www.fundamentus.com.br/detalhes.php'
+    requests_mock.get(url=url, status_code=429, text='Too Many Requests')
+
+    rate_limiter = RecordingRateLimiter()
+    requester = HttpRequester(url=url, params={'papel': 'THROTTLED3'},
+                              cache=ResponseCache(None), rate_limiter=rate_limiter)
+
+    with pytest.raises(RequestException):
+        requester.make_request()
+
+    assert rate_limiter.releases == [429]
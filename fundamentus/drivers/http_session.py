@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: http_session.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""HTTP Session.
+
+This module keeps the HTTP sessions shared by every requester, so the TCP and TLS
+handshakes with the Fundamentus website are paid once per connection of the pool
+instead of once per request. The responses are cached by the requester, on the
+backends of `fundamentus.cache`.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from fundamentus.utilities.config import (BACKOFF_FACTOR, MAX_RETRIES,
+                                          POOL_CONNECTIONS, POOL_MAXSIZE,
+                                          RETRY_STATUS_CODES)
+
+
+@dataclass(frozen=True)
+class SessionConfig:
+    """Configuration of a shared HTTP session.
+
+    Attributes:
+        pool_connections (int): Number of connection pools (one per host) to cache.
+        pool_maxsize (int): Maximum number of connections kept alive per host.
+        keep_alive (bool): Whether the connections are reused between requests.
+        max_retries (int): Number of retries for failed requests.
+        backoff_factor (float): Factor of the exponential backoff between retries.
+        retry_status_codes (Tuple[int, ...]): Status codes that trigger a retry.
+    """
+
+    pool_connections: int = POOL_CONNECTIONS
+    pool_maxsize: int = POOL_MAXSIZE
+    keep_alive: bool = True
+    max_retries: int = MAX_RETRIES
+    backoff_factor: float = BACKOFF_FACTOR
+    retry_status_codes: Tuple[int, ...] = RETRY_STATUS_CODES
+
+
+__SESSIONS: Dict[SessionConfig, requests.Session] = {}
+__SESSIONS_LOCK = threading.Lock()
+
+
+def build_session(config: SessionConfig) -> requests.Session:
+    """Build a new HTTP session from the given configuration.
+
+    :param config: SessionConfig: Configuration of the session.
+    :return: requests.Session: The configured session.
+    """
+
+    session = requests.Session()
+
+    retries = Retry(total=config.max_retries,
+                    backoff_factor=config.backoff_factor,
+                    status_forcelist=config.retry_status_codes,
+                    allowed_methods=frozenset(['GET', 'HEAD']),
+                    respect_retry_after_header=True,
+                    # Let raise_for_status report the last response after the retries.
+                    raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=config.pool_connections,
+                          pool_maxsize=config.pool_maxsize,
+                          max_retries=retries)
+
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    if not config.keep_alive:
+        session.headers['Connection'] = 'close'
+
+    return session
+
+
+def get_shared_session(config: SessionConfig = None) -> requests.Session:
+    """Return the session shared by every requester with the same configuration.
+
+    The session is created on first use and reused afterwards. It is safe to call
+    from many threads at once.
+
+    :param config: SessionConfig: Configuration of the session. Defaults to SessionConfig().
+    :return: requests.Session: The shared session.
+    """
+
+    config = config or SessionConfig()
+
+    with __SESSIONS_LOCK:
+        session = __SESSIONS.get(config)
+        if session is None:
+            session = __SESSIONS[config] = build_session(config)
+
+    return session
+
+
+def close_shared_sessions() -> None:
+    """Close every shared session and release its connections."""
+
+    with __SESSIONS_LOCK:
+        for session in __SESSIONS.values():
+            session.close()
+
+        __SESSIONS.clear()
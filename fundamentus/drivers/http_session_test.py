@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: http_session_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""HTTP Session Test."""
+
+import requests
+
+from fundamentus.cache.response_cache import ResponseCache
+
+from .http_requester import HttpRequester
+from .http_session import (SessionConfig, build_session, close_shared_sessions,
+                           get_shared_session)
+from .mocks.http_requester import REQUESTER_MOCK
+
+
+def test_build_session() -> None:
+    """Test build_session function."""
+
+    config = SessionConfig(pool_maxsize=4, max_retries=2, keep_alive=False)
+    session = build_session(config)
+
+    adapter = session.get_adapter('https://www.fundamentus.com.br')
+
+    assert adapter._pool_maxsize == 4  # pylint: disable=protected-access
+    assert adapter.max_retries.total == 2
+    assert 429 in adapter.max_retries.status_forcelist
+    assert session.headers['Connection'] == 'close'
+
+
+def test_get_shared_session() -> None:
+    """Test get_shared_session function."""
+
+    config = SessionConfig(pool_maxsize=8)
+
+    try:
+        session = get_shared_session(config)
+
+        assert get_shared_session(config) is session
+        assert get_shared_session(SessionConfig(pool_maxsize=8, max_retries=0)) is not session
+        assert get_shared_session() is get_shared_session(SessionConfig())
+    finally:
+        close_shared_sessions()
+
+    assert get_shared_session(config) is not session
+
+
+def test_make_request_with_session(requests_mock) -> None:
+    """Test make_request method reusing the given session.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    url = 'https://www.fundamentus.com.br/detalhes.php'
+
+    requests_mock.get(url=url,
+                      status_code=REQUESTER_MOCK['status_code'],
+                      text=REQUESTER_MOCK['content'])
+
+    with requests.Session() as session:
+        for ticker in ('MGLU3', 'VALE3'):
+            response = HttpRequester(url=url, params={'papel': ticker}, session=session,
+                                     cache=ResponseCache(None)).make_request()
+
+            assert response.status_code == REQUESTER_MOCK['status_code']
+
+    assert requests_mock.call_count == 2
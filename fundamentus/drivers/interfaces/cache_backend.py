@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: cache_backend.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Cache Backend Interface."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CacheBackendInterface(ABC):
+    """Represents a key-value store whose entries expire."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value stored under the key, or None if missing or expired."""
+
+        raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store the value under the key for ttl seconds."""
+
+        raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Evict the entry stored under the key, if any."""
+
+        raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Evict every entry."""
+
+        raise NotImplementedError("You should implement this method.")
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: http_requester.py
-#  Version: 0.0.2
+#  Version: 0.0.3
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -19,7 +19,7 @@
 """Html Collector Interface."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List
 
 
 # pylint: disable=too-few-public-methods
@@ -27,8 +27,21 @@ class HtmlCollectorInterface(ABC):
     """Represents a complete HTML collector."""
 
     @abstractmethod
-    def collect_all_information(self, html: str) -> Dict:
-        """Collect all information from single stock from Fundamentus website."""
+    def collect_all_information(self, html: str, sections: Iterable[str] = None) -> Dict:
+        """Collect all information, or the given raw sections, from single stock
+        from Fundamentus website."""
+
+        raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    def parse_document(self, html: str) -> Any:
+        """Parse the HTML of a single stock, for the sections to be collected later."""
+
+        raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    def collect_section(self, document: Any, section: str) -> Dict:
+        """Collect a raw section from a document returned by parse_document."""
 
         raise NotImplementedError("You should implement this method.")
 
@@ -43,3 +56,15 @@ class HtmlCollectorInterface(ABC):
         """Collect list of companies from Fundamentus website."""
 
         raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    def collect_listings(self, html: str) -> Dict[str, List[Dict]]:
+        """Collect the lists of companies and of property funds, parsing the page once."""
+
+        raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    def collect_market_results(self, html: str) -> List[Dict]:
+        """Collect the indicators of every stock from the market results page."""
+
+        raise NotImplementedError("You should implement this method.")
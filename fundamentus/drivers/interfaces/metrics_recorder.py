@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: metrics_recorder.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Metrics Recorder Interface."""
+
+from abc import ABC, abstractmethod
+
+
+class MetricsRecorderInterface(ABC):
+    """Represents a sink of the timings and counters of the pipeline."""
+
+    @abstractmethod
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record the duration of a stage."""
+
+        raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    def increment(self, name: str, value: float = 1) -> None:
+        """Increment a counter."""
+
+        raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set the current value of a gauge."""
+
+        raise NotImplementedError("You should implement this method.")
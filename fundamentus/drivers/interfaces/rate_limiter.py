@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: rate_limiter.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Rate Limiter Interface."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class RateLimiterInterface(ABC):
+    """Represents a limit on the rate of the requests sent to the website.
+
+    Every acquire is followed by a release, once the response is received.
+    """
+
+    @abstractmethod
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+
+        raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+
+        raise NotImplementedError("You should implement this method.")
+
+    @abstractmethod
+    def release(self, status_code: Optional[int], seconds: float) -> None:
+        """Report the status code of the response, None if the request failed,
+        and how long it took."""
+
+        raise NotImplementedError("You should implement this method.")
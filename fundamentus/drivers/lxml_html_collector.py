@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: lxml_html_collector.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""LXML HTML Collector.
+
+This module collects the stock page with the libxml2 parser, which builds the
+document tree in C and is much faster than the `html.parser` backend of
+BeautifulSoup. It requires the optional `lxml` dependency.
+
+"""
+
+from .single_pass_html_collector import HtmlDocumentIndex, SinglePassHtmlCollector
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:  # pragma: no cover
+    etree = lxml_html = None
+
+
+# pylint: disable=too-few-public-methods
+class LxmlHtmlCollector(SinglePassHtmlCollector):
+    """Represents a HTML collector backed by lxml."""
+
+    def __init__(self) -> None:
+        """Initialize the class.
+
+        :raises ImportError: If lxml is not installed.
+        """
+
+        if lxml_html is None:
+            raise ImportError('LxmlHtmlCollector requires lxml: pip install pyfundamentus[lxml]')
+
+    def _index_document(self, html: str) -> HtmlDocumentIndex:
+        """Parse the HTML with lxml and index it in a single traversal.
+
+        :param html (str): HTML content.
+        :return (HtmlDocumentIndex): Index of the document.
+        """
+
+        index = HtmlDocumentIndex()
+
+        for event, element in etree.iterwalk(lxml_html.document_fromstring(html),
+                                             events=('start', 'end')):
+            # Comments and processing instructions are not elements.
+            if not isinstance(element.tag, str):
+                continue
+
+            if event == 'start':
+                index.start_element(element.tag,
+                                    (element.get('class') or '').split(),
+                                    element.attrib,
+                                    element.text_content)
+            else:
+                index.end_element()
+
+        return index
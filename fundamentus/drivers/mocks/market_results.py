@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: market_results.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+__STATUS_CODE = 200
+
+__MARKET_RESULTS = """<!doctype html>
+<html lang="pt-BR">
+
+<head>
+    <title>Fundamentus - Invista Consciente - Indicadores Financeiros e Fundamentalistas - </title>
+</head>
+
+<body>
+
+    <div class="main">
+        <div class="container">
+            <table id="resultado" class="resultado">
+                <thead>
+                <tr>
+                    <th><span class="tips" title="Código de negociação da ação">Papel</span></th>
+                    <th><span class="tips" title="Cotação de fechamento da ação no último pregão">Cotação</span></th>
+                    <th><span class="tips" title="Preço da ação dividido pelo lucro por ação">P/L</span></th>
+                    <th><span class="tips" title="Preço da ação dividido pelo valor patrimonial por ação">P/VP</span></th>
+                    <th><span class="tips" title="Price Sales Ratio: preço da ação dividido pela receita líquida por ação">PSR</span></th>
+                    <th><span class="tips" title="Dividend Yield: dividendo pago por ação dividido pelo preço da ação">Div.Yield</span></th>
+                    <th><span class="tips" title="Preço da ação dividido pelos ativos totais por ação">P/Ativo</span></th>
+                    <th><span class="tips" title="Preço da ação dividido pelo capital de giro por ação">P/Cap.Giro</span></th>
+                    <th><span class="tips" title="Preço da ação dividido pelo EBIT por ação">P/EBIT</span></th>
+                    <th><span class="tips" title="Preço da ação dividido pelos ativos circulantes líquidos por ação">P/Ativ Circ.Liq</span></th>
+                    <th><span class="tips" title="Valor da firma dividido pelo EBIT">EV/EBIT</span></th>
+                    <th><span class="tips" title="Valor da firma dividido pelo EBITDA">EV/EBITDA</span></th>
+                    <th><span class="tips" title="EBIT dividido pela receita líquida">Mrg Ebit</span></th>
+                    <th><span class="tips" title="Lucro líquido dividido pela receita líquida">Mrg. Líq.</span></th>
+                    <th><span class="tips" title="Ativo circulante dividido pelo passivo circulante">Liq. Corr.</span></th>
+                    <th><span class="tips" title="Retorno sobre o capital investido">ROIC</span></th>
+                    <th><span class="tips" title="Retorno sobre o patrimônio líquido">ROE</span></th>
+                    <th><span class="tips" title="Volume médio de negociações da ação nos últimos 2 meses">Liq.2meses</span></th>
+                    <th><span class="tips" title="Patrimônio líquido">Patrim. Líq</span></th>
+                    <th><span class="tips" title="Dívida bruta dividida pelo patrimônio líquido">Dív.Brut/ Patrim.</span></th>
+                    <th><span class="tips" title="Crescimento da receita líquida nos últimos 5 anos">Cresc. Rec.5a</span></th>
+                </tr>
+                </thead>
+                <tbody>
+                <tr>
+                    <td><span class="tips" title="ALLIAR"><a href="detalhes.php?papel=AALR3">AALR3</a></span></td>
+                    <td>19,00</td>
+                    <td>-68,69</td>
+                    <td>1,61</td>
+                    <td>1,35</td>
+                    <td>0,00%</td>
+                    <td>0,577</td>
+                    <td>7,12</td>
+                    <td>13,37</td>
+                    <td>-1,98</td>
+                    <td>16,38</td>
+                    <td>7,53</td>
+                    <td>10,08%</td>
+                    <td>-1,96%</td>
+                    <td>1,86</td>
+                    <td>5,53%</td>
+                    <td>-2,35%</td>
+                    <td>2.567.450,00</td>
+                    <td>1.393.340.000,00</td>
+                    <td>0,71</td>
+                    <td>5,83%</td>
+                </tr>
+                <tr>
+                    <td><span class="tips" title="ABC Brasil"><a href="detalhes.php?papel=ABCB4">ABCB4</a></span></td>
+                    <td>20,26</td>
+                    <td>6,51</td>
+                    <td>0,91</td>
+                    <td>0,00</td>
+                    <td>7,41%</td>
+                    <td>0,000</td>
+                    <td>0,00</td>
+                    <td>0,00</td>
+                    <td>0,00</td>
+                    <td>0,00</td>
+                    <td>0,00</td>
+                    <td>0,00%</td>
+                    <td>0,00%</td>
+                    <td>0,00</td>
+                    <td>0,00%</td>
+                    <td>13,92%</td>
+                    <td>22.401.100,00</td>
+                    <td>4.942.330.000,00</td>
+                    <td>0,00</td>
+                    <td>-</td>
+                </tr>
+                <tr>
+                    <td><span class="tips" title="MAGAZ LUIZA"><a href="detalhes.php?papel=MGLU3">MGLU3</a></span></td>
+                    <td>8,79</td>
+                    <td>-12,35</td>
+                    <td>1,07</td>
+                    <td>0,39</td>
+                    <td>0,00%</td>
+                    <td>0,249</td>
+                    <td>1,72</td>
+                    <td>9,38</td>
+                    <td>-2,26</td>
+                    <td>5,37</td>
+                    <td>3,57</td>
+                    <td>4,20%</td>
+                    <td>-3,15%</td>
+                    <td>1,35</td>
+                    <td>4,25%</td>
+                    <td>-8,69%</td>
+                    <td>1.054.630.000,00</td>
+                    <td>10.937.800.000,00</td>
+                    <td>0,89</td>
+                    <td>14,62%</td>
+                </tr>
+                <tr>
+                    <td><span class="tips" title="PETROBRAS"><a href="detalhes.php?papel=PETR4">PETR4</a></span></td>
+                    <td>36,28</td>
+                    <td>3,98</td>
+                    <td>1,20</td>
+                    <td>0,97</td>
+                    <td>18,29%</td>
+                    <td>0,449</td>
+                    <td>-14,08</td>
+                    <td>2,25</td>
+                    <td>-0,71</td>
+                    <td>2,84</td>
+                    <td>2,27</td>
+                    <td>43,13%</td>
+                    <td>24,27%</td>
+                    <td>0,84</td>
+                    <td>25,14%</td>
+                    <td>30,26%</td>
+                    <td>1.716.440.000,00</td>
+                    <td>393.000.000.000,00</td>
+                    <td>0,74</td>
+                    <td>21,75%</td>
+                </tr>
+                </tbody>
+            </table>
+        </div>
+    </div>
+</body>
+
+</html>
+"""
+
+MARKET_RESULTS_MOCK = {
+    'status_code': __STATUS_CODE,
+    'content': __MARKET_RESULTS
+}
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: selectolax_html_collector.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Selectolax HTML Collector.
+
+This module collects the stock page with the Lexbor HTML5 parser exposed by
+selectolax, the fastest of the available engines. It requires the optional
+`selectolax` dependency.
+
+"""
+
+from .single_pass_html_collector import HtmlDocumentIndex, SinglePassHtmlCollector
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover
+    LexborHTMLParser = None
+
+
+# pylint: disable=too-few-public-methods
+class SelectolaxHtmlCollector(SinglePassHtmlCollector):
+    """Represents a HTML collector backed by selectolax."""
+
+    def __init__(self) -> None:
+        """Initialize the class.
+
+        :raises ImportError: If selectolax is not installed.
+        """
+
+        if LexborHTMLParser is None:
+            raise ImportError('SelectolaxHtmlCollector requires selectolax: '
+                              'pip install pyfundamentus[selectolax]')
+
+    def _index_document(self, html: str) -> HtmlDocumentIndex:
+        """Parse the HTML with selectolax and index it in a single traversal.
+
+        :param html (str): HTML content.
+        :return (HtmlDocumentIndex): Index of the document.
+        """
+
+        index = HtmlDocumentIndex()
+
+        stack = [iter([LexborHTMLParser(html).root])]
+        while stack:
+            for node in stack[-1]:
+                # Comments are reported with a tag starting with a dash.
+                if node.tag.startswith('-'):
+                    continue
+
+                attributes = node.attributes
+                index.start_element(node.tag,
+                                    (attributes.get('class') or '').split(),
+                                    attributes,
+                                    node.text)
+                stack.append(node.iter(include_text=False))
+                break
+            else:
+                stack.pop()
+                if stack:
+                    index.end_element()
+
+        return index
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: shared_token_bucket_rate_limiter.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Shared Token Bucket Rate Limiter.
+
+The TokenBucketRateLimiter keeps its tokens in memory, so each process sending
+requests has its own bucket. This module keeps the tokens, and the rate, in a
+SQLite file: every process opening the same file takes its tokens from the same
+bucket, and a rate changed by one process applies to all of them.
+"""
+
+import sqlite3
+import time
+from contextlib import closing
+from typing import Callable, Tuple
+
+from fundamentus.utilities.config import CRAWL_BURST, CRAWL_RATE
+from .token_bucket_rate_limiter import TokenBucketRateLimiter
+
+__SCHEMA = """
+CREATE TABLE IF NOT EXISTS bucket (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    rate REAL NOT NULL
+)
+"""
+
+
+def _create_bucket(path: str, rate: float, capacity: int) -> None:
+    """Create the bucket, full, unless another process created it already.
+
+    :param path: str: Path of the database.
+    :param rate: float: Tokens added per second.
+    :param capacity: int: Maximum number of tokens in the bucket.
+    """
+
+    with closing(sqlite3.connect(path, timeout=30)) as connection:
+        connection.execute('PRAGMA journal_mode=WAL')
+        with connection:
+            connection.execute(__SCHEMA)
+            connection.execute('INSERT OR IGNORE INTO bucket VALUES (0, ?, ?, ?)',
+                               (float(capacity), time.time(), rate))
+
+
+class SharedTokenBucketRateLimiter(TokenBucketRateLimiter):
+    """Represents a token bucket shared by the processes opening the same file."""
+
+    def __init__(self, path: str, rate: float = CRAWL_RATE, capacity: int = CRAWL_BURST) -> None:
+        """Initialize the class, creating the bucket if it does not exist.
+
+        :param path: str: Path of the database holding the bucket.
+        :param rate: float: Tokens added per second, if the bucket is created.
+                     An existing bucket keeps its rate.
+        :param capacity: int: Maximum number of tokens in the bucket.
+        :raises ValueError: If the rate or the capacity is not positive.
+        """
+
+        super().__init__(rate, capacity)
+
+        self.__path = path
+
+        _create_bucket(path, rate, capacity)
+
+    def __connect(self) -> sqlite3.Connection:
+        """Open a connection to the database.
+
+        A connection is opened per operation, so the bucket can be shared
+        between threads and processes.
+
+        :return: sqlite3.Connection: Connection to the database.
+        """
+
+        # Transactions are started explicitly, to take the write lock up front.
+        return sqlite3.connect(self.__path, timeout=30, isolation_level=None)
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second, shared by every process."""
+
+        with closing(self.__connect()) as connection:
+            rate, = connection.execute('SELECT rate FROM bucket WHERE id = 0').fetchone()
+
+        return rate
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        """Change the tokens added per second, for every process.
+
+        :param rate: float: Tokens added per second.
+        """
+
+        self.__update(lambda tokens, current_rate: (tokens, rate))
+
+    def __update(self, change: Callable[[float, float], Tuple[float, float]]
+                 ) -> Tuple[float, float]:
+        """Refill the bucket and change it, in a single transaction.
+
+        :param change: Callable[[float, float], Tuple[float, float]]: Receives the
+                       tokens and the rate, and returns their new values.
+        :return: Tuple[float, float]: The tokens left in the bucket, and the rate.
+        """
+
+        with closing(self.__connect()) as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                tokens, updated_at, rate = connection.execute(
+                    'SELECT tokens, updated_at, rate FROM bucket WHERE id = 0').fetchone()
+
+                now = time.time()
+                tokens = min(self.capacity, tokens + max(0.0, now - updated_at) * rate)
+                tokens, rate = change(tokens, rate)
+
+                connection.execute('UPDATE bucket SET tokens = ?, updated_at = ?, rate = ? '
+                                   'WHERE id = 0', (tokens, now, rate))
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+
+        return tokens, rate
+
+    def _reserve(self) -> float:
+        """Take a token from the shared bucket, possibly ahead of time.
+
+        :return: float: Seconds to wait before the token is available.
+        """
+
+        tokens, rate = self.__update(lambda tokens, rate: (tokens - 1, rate))
+
+        return max(0.0, -tokens / rate)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: shared_token_bucket_rate_limiter_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Shared Token Bucket Rate Limiter Test."""
+
+import time
+
+from .shared_token_bucket_rate_limiter import SharedTokenBucketRateLimiter
+
+
+def test_bucket_is_shared(tmp_path) -> None:
+    """Test two limiters opening the same file take their tokens from the same bucket.
+
+    :param pathlib.Path tmp_path: Temporary directory.
+    """
+
+    path = str(tmp_path / 'bucket.sqlite')
+    first = SharedTokenBucketRateLimiter(path, rate=20, capacity=2)
+    # The existing bucket keeps its rate.
+    second = SharedTokenBucketRateLimiter(path, rate=1000, capacity=2)
+
+    assert second.rate == 20
+
+    started = time.monotonic()
+    first.acquire()
+    second.acquire()
+    # The bucket is empty: the third token takes 1/20 s.
+    first.acquire()
+
+    assert time.monotonic() - started >= 0.04
+
+
+def test_rate_is_shared(tmp_path) -> None:
+    """Test a rate changed through a limiter applies to the others.
+
+    :param pathlib.Path tmp_path: Temporary directory.
+    """
+
+    path = str(tmp_path / 'bucket.sqlite')
+    first = SharedTokenBucketRateLimiter(path, rate=2)
+    second = SharedTokenBucketRateLimiter(path)
+
+    first.rate = 0.5
+
+    assert second.rate == 0.5
@@ -0,0 +1,452 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: single_pass_html_collector.py
+#  Version: 0.0.4
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Single Pass HTML Collector.
+
+The HtmlCollector looks every section up with its own `find_all` call, walking the
+whole document again for each frame and each span. This module walks the document
+once, indexing the frames, the data cells and their spans as they are met, and then
+builds the raw information from that index.
+
+"""
+
+from typing import Callable, Dict, List, Mapping, Sequence
+
+from bs4 import BeautifulSoup as bs
+from bs4.element import Tag
+
+from fundamentus.exceptions.stock_not_found_error import StockNotFoundError
+from fundamentus.metrics.instrumentation import timed
+from .html_collector import HtmlCollector
+
+# Class attributes matched as a whole, as BeautifulSoup does for multi-class values.
+GRID_CELL_CLASS = 'col-6 col-sm-4 col-md-2'
+DETAILED_INFORMATION_CLASS = 'col col-xl-auto vpalpa2-estilo'
+LISTING_TABLE_CLASS = 'table table-default table-sort table-resultados-trimestrais'
+
+# Spans indexed by the collector.
+SPAN_CLASSES = ('data-title', 'data-tooltip', 'data-value', 'data-text', 'dt-title', 'dt-value')
+
+FINANCIAL_SUMMARY_KEYS = ('market_valuation', 'enterprise_valuation', 'number_of_shares',
+                          'last_financial_statement', 'sector', 'subsector')
+PRICE_KEYS = ('price', 'date')
+DETAILED_INFORMATION_KEYS = ('stock_type', 'traded_volume_per_day',
+                             'equity_value_per_share', 'earnings_per_share')
+OSCILLATIONS_KEYS = ('variation_day', 'variation_month', 'variation_30_days',
+                     'variation_12_months', 'variation_2022', 'variation_2021',
+                     'variation_2020', 'variation_2019', 'variation_2018', 'variation_2017')
+VALUATION_INDICATORS_KEYS = ('price_divided_by_profit_title', 'price_divided_by_asset_value',
+                             'price_divided_by_ebit', 'price_divided_by_net_revenue',
+                             'price_divided_by_total_assets',
+                             'price_divided_by_net_current_assets', 'dividend_yield',
+                             'enterprise_value_by_ebitda', 'enterprise_value_by_ebit',
+                             'price_by_working_capital')
+PROFITABILITY_INDICATORS_KEYS = ('return_on_equity', 'return_on_invested_capital',
+                                 'ebit_divided_by_total_assets',
+                                 'net_revenue_growth_last_5_years',
+                                 'net_revenue_divided_by_total_assets',
+                                 'gross_profit_divided_by_net_revenue',
+                                 'ebit_divided_by_net_revenue',
+                                 'net_income_divided_by_net_revenue')
+INDEBTEDNESS_INDICATORS_KEYS = ('current_liquidity', 'gross_debt_by_equity',
+                                'net_debt_by_equity', 'net_debt_by_ebitda',
+                                'equity_by_total_assets')
+INCOME_STATEMENT_KEYS = ('revenue', 'ebit', 'net_income')
+
+
+# pylint: disable=too-few-public-methods
+class HtmlSpan:
+    """Represents an indexed span: its text and its tooltip attributes."""
+
+    __slots__ = ('text', 'title', 'original_title')
+
+    def __init__(self, text: str, title: str, original_title: str) -> None:
+        """Initialize the class.
+
+        :param text: str: Text of the span.
+        :param title: str: The title attribute of the span.
+        :param original_title: str: The data-original-title attribute of the span.
+        """
+
+        self.text = text
+        self.title = title
+        self.original_title = original_title
+
+
+class HtmlCell:
+    """Represents a data cell: the first span of each class found inside it."""
+
+    __slots__ = ('spans', 'cells')
+
+    def __init__(self) -> None:
+        """Initialize the class."""
+
+        self.spans: Dict[str, HtmlSpan] = {}
+        self.cells: List['HtmlCell'] = []
+
+    @property
+    def title(self) -> str:
+        """Text of the data-title span."""
+
+        return self.spans['data-title'].text
+
+    @property
+    def tooltip(self) -> str:
+        """Title of the data-tooltip span, falling back to data-original-title."""
+
+        span = self.spans['data-tooltip']
+
+        return span.original_title if span.title == '' else span.title
+
+    @property
+    def value(self) -> str:
+        """Text of the data-value span."""
+
+        return self.spans['data-value'].text
+
+    @property
+    def text(self) -> str:
+        """Text of the data-text span."""
+
+        return self.spans['data-text'].text
+
+
+class HtmlScope:
+    """Represents a section of the page and everything indexed inside it."""
+
+    __slots__ = ('data', 'grid', 'columns', 'spans')
+
+    def __init__(self) -> None:
+        """Initialize the class."""
+
+        self.data: List[HtmlCell] = []
+        self.grid: List[HtmlCell] = []
+        self.columns: List['HtmlScope'] = []
+        self.spans: Dict[str, List[HtmlSpan]] = {}
+
+
+class HtmlDocumentIndex:
+    """Index of a stock page, fed with the elements of the document in order.
+
+    The parser engine walks the document once, calling `start_element` when it enters
+    an element and `end_element` when it leaves it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the class."""
+
+        self.symbol: str = None
+        self.name: str = None
+        self.is_listing = False
+        self.frames: List[HtmlScope] = []
+        self.price: HtmlScope = None
+        self.detailed_information: HtmlScope = None
+        self.oscillations: HtmlScope = None
+
+        self.__elements = []
+        self.__open_scopes: List[HtmlScope] = []
+        self.__open_cells: List[HtmlCell] = []
+
+    def __start_div(self, classes: Sequence[str]) -> tuple:
+        """Index a div element.
+
+        :param classes: Sequence[str]: Classes of the element.
+        :return: tuple: The scope and the cell opened by the element, if any.
+        """
+
+        class_attribute = ' '.join(classes)
+        scope = cell = None
+
+        if 'col-sm' in classes:
+            scope = HtmlScope()
+            for open_scope in self.__open_scopes:
+                open_scope.columns.append(scope)
+
+        if 'frame' in classes:
+            scope = scope or HtmlScope()
+            self.frames.append(scope)
+
+        if 'frame-cotacao' in classes and self.price is None:
+            scope = self.price = scope or HtmlScope()
+
+        if class_attribute == DETAILED_INFORMATION_CLASS and self.detailed_information is None:
+            scope = self.detailed_information = scope or HtmlScope()
+
+        if 'oscilacoes' in classes and self.oscillations is None:
+            scope = self.oscillations = scope or HtmlScope()
+
+        is_data = 'data' in classes
+        is_grid = class_attribute == GRID_CELL_CLASS
+        if is_data or is_grid:
+            cell = HtmlCell()
+            for open_cell in self.__open_cells:
+                open_cell.cells.append(cell)
+            for open_scope in self.__open_scopes:
+                if is_data:
+                    open_scope.data.append(cell)
+                if is_grid:
+                    open_scope.grid.append(cell)
+
+        if scope is not None:
+            self.__open_scopes.append(scope)
+        if cell is not None:
+            self.__open_cells.append(cell)
+
+        return scope, cell
+
+    def __index_span(self, classes: Sequence[str],
+                     attributes: Mapping, get_text: Callable[[], str]) -> None:
+        """Index a span element.
+
+        :param classes: Sequence[str]: Classes of the element.
+        :param attributes: Mapping: Attributes of the element.
+        :param get_text: Callable[[], str]: Returns the text of the element.
+        """
+
+        if 'acao-nome' in classes and self.name is None:
+            self.name = get_text()
+
+        span = None
+        for span_class in SPAN_CLASSES:
+            if span_class not in classes:
+                continue
+
+            if span is None:
+                span = HtmlSpan(text=get_text(),
+                                title=attributes.get('title'),
+                                original_title=attributes.get('data-original-title'))
+
+            for open_scope in self.__open_scopes:
+                open_scope.spans.setdefault(span_class, []).append(span)
+            for open_cell in self.__open_cells:
+                open_cell.spans.setdefault(span_class, span)
+
+    def start_element(self, tag: str, classes: Sequence[str],
+                      attributes: Mapping, get_text: Callable[[], str]) -> None:
+        """Enter an element of the document.
+
+        :param tag: str: Name of the element.
+        :param classes: Sequence[str]: Classes of the element.
+        :param attributes: Mapping: Attributes of the element.
+        :param get_text: Callable[[], str]: Returns the text of the element,
+                         called only for the elements that are indexed.
+        """
+
+        opened = None
+
+        if tag == 'div' and classes:
+            opened = self.__start_div(classes)
+        elif tag == 'span' and classes:
+            self.__index_span(classes, attributes, get_text)
+        elif tag == 'h1' and 'acao-papel' in classes and self.symbol is None:
+            self.symbol = get_text()
+        elif tag == 'table' and ' '.join(classes) == LISTING_TABLE_CLASS:
+            self.is_listing = True
+
+        self.__elements.append(opened)
+
+    def end_element(self) -> None:
+        """Leave the current element of the document."""
+
+        opened = self.__elements.pop()
+
+        if opened is not None:
+            scope, cell = opened
+            if scope is not None:
+                self.__open_scopes.pop()
+            if cell is not None:
+                self.__open_cells.pop()
+
+
+def index_soup(soup: bs, index: HtmlDocumentIndex) -> HtmlDocumentIndex:
+    """Feed the index with the elements of a BeautifulSoup document.
+
+    :param soup (bs): BeautifulSoup object.
+    :param index (HtmlDocumentIndex): Index to feed.
+    :return (HtmlDocumentIndex): The fed index.
+    """
+
+    stack = [iter(soup.contents)]
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, Tag):
+                index.start_element(node.name, node.get('class') or (), node.attrs, node.get_text)
+                stack.append(iter(node.contents))
+                break
+        else:
+            stack.pop()
+            if stack:
+                index.end_element()
+
+    return index
+
+
+class SinglePassHtmlCollector(HtmlCollector):
+    """Represents a HTML collector that walks the stock page only once.
+
+    It returns the same information as the HtmlCollector. The lists of companies and
+    property funds are collected by the HtmlCollector.
+    """
+
+    def _index_document(self, html: str) -> HtmlDocumentIndex:
+        """Parse the HTML and index it in a single traversal.
+
+        Other parser engines override this method.
+
+        :param html (str): HTML content.
+        :return (HtmlDocumentIndex): Index of the document.
+        """
+
+        return index_soup(bs(html, 'html.parser'), HtmlDocumentIndex())
+
+    @staticmethod
+    def __entries(keys: Sequence[str], cells: List[HtmlCell]) -> Dict[str, List[str]]:
+        """Build the title, tooltip and value of each key from the cells, in order.
+
+        :param keys (Sequence[str]): Keys of the information.
+        :param cells (List[HtmlCell]): Cells holding the information.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        return {key: [cells[position].title, cells[position].tooltip, cells[position].value]
+                for position, key in enumerate(keys)}
+
+    @staticmethod
+    def __balance_sheet(frame: HtmlScope) -> Dict:
+        """Build the balance sheet of the stock.
+
+        Banks have a credit portfolio and deposits instead of current assets, cash
+        and debts, so their columns do not have three cells each.
+
+        :param frame (HtmlScope): Frame of the balance sheet.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        column_left = frame.columns[0].data
+        column_right = frame.columns[1].data
+
+        def entry(cell: HtmlCell) -> List[str]:
+            return [cell.title, cell.tooltip, cell.value]
+
+        if len(column_left) == 3 and len(column_right) == 3:
+            return {
+                'total_assets': entry(column_left[0]),
+                'current_assets': entry(column_left[1]),
+                'cash': entry(column_left[2]),
+                'gross_debt': entry(column_right[0]),
+                'net_debt': entry(column_right[1]),
+                'equity': entry(column_right[2])
+            }
+
+        if len(column_left) == 3 or len(column_right) == 3:
+            raise ValueError('The balance sheet layout is not supported.')
+
+        return {
+            'total_assets': entry(column_left[0]),
+            'credit_portfolio': entry(column_left[1]),
+            'deposits': entry(column_right[0]),
+            'equity': entry(column_right[1])
+        }
+
+    @staticmethod
+    def __income_statement(frame: HtmlScope) -> Dict:
+        """Build the income statement of the stock.
+
+        The values alternate between the last twelve and the last three months.
+
+        :param frame (HtmlScope): Frame of the income statement.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        titles = frame.spans['dt-title']
+        tooltips = frame.spans['data-tooltip']
+        values = frame.spans['dt-value']
+
+        twelve_months = {}
+        three_months = {}
+        for position, key in enumerate(INCOME_STATEMENT_KEYS):
+            title, tooltip = titles[position].text, tooltips[position].title
+            twelve_months[key] = [title, tooltip, values[2 * position].text]
+            three_months[key] = [title, tooltip, values[2 * position + 1].text]
+
+        return {'twelve_months': twelve_months, 'three_months': three_months}
+
+    def parse_document(self, html: str) -> HtmlDocumentIndex:
+        """Parse and index the html of a stock, for its sections to be collected.
+
+        :param html (str): HTML content.
+        :return (HtmlDocumentIndex): Index of the document.
+        :raises StockNotFoundError: If the HTML content is not from a stock.
+        """
+
+        with timed('parse'):
+            index = self._index_document(html)
+
+        if index.is_listing:
+            raise StockNotFoundError('The HTML content is not from a stock.')
+
+        return index
+
+    def __detailed_information(self, index: HtmlDocumentIndex) -> Dict:
+        """Build the detailed information of the stock.
+
+        :param index (HtmlDocumentIndex): Index of the document.
+        :return (dict): Dictionary with the processed information.
+        """
+
+        detailed_cells = index.detailed_information.data
+        detailed_information = self.__entries(DETAILED_INFORMATION_KEYS, detailed_cells)
+        lowest_value, highest_value = detailed_cells[4].cells[:2]
+        detailed_information['variation_52_weeks'] = {
+            'lowest_value': [lowest_value.tooltip, lowest_value.value],
+            'highest_value': [highest_value.tooltip, highest_value.value]
+        }
+
+        return detailed_information
+
+    def collect_section(self, document: HtmlDocumentIndex, section: str) -> Dict:
+        """Collect a raw section from the index of the page.
+
+        :param document (HtmlDocumentIndex): Index returned by parse_document.
+        :param section (str): Name of the raw section, e.g. 'balance_sheet'.
+        :return: dict: Dictionary with the collected section.
+        :raises ValueError: If the section is unknown.
+        """
+
+        builders = {
+            'identification': lambda index: {'symbol': [index.symbol], 'name': [index.name]},
+            'financial_summary': lambda index: self.__entries(FINANCIAL_SUMMARY_KEYS,
+                                                              index.frames[0].data),
+            'price': lambda index: self.__entries(PRICE_KEYS, index.price.data),
+            'detailed_information': self.__detailed_information,
+            'oscillations': lambda index: {key: [index.oscillations.data[position].text,
+                                                 index.oscillations.data[position].value]
+                                           for position, key in enumerate(OSCILLATIONS_KEYS)},
+            'valuation_indicators': lambda index: self.__entries(VALUATION_INDICATORS_KEYS,
+                                                                 index.frames[4].grid),
+            'profitability_indicators': lambda index: self.__entries(
+                PROFITABILITY_INDICATORS_KEYS, index.frames[5].grid),
+            'indebtedness_indicators': lambda index: self.__entries(
+                INDEBTEDNESS_INDICATORS_KEYS, index.frames[6].grid),
+            'balance_sheet': lambda index: self.__balance_sheet(index.frames[7]),
+            'income_statement': lambda index: self.__income_statement(index.frames[8])
+        }
+
+        if section not in builders:
+            raise ValueError(f'Unknown section: {section}.')
+
+        return builders[section](document)
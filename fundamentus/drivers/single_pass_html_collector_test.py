@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: single_pass_html_collector_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Single Pass Html Collector Test"""
+
+import pytest
+
+from .html_collector import HtmlCollector
+from .mocks.companies_list import COMPANIES_LIST_MOCK
+from .mocks.html_collector import HTML_COLLECTOR_MOCK
+from .single_pass_html_collector import SinglePassHtmlCollector
+
+
+def test_collect_all_information() -> None:
+    """Test collect all information returns the same as the HtmlCollector."""
+
+    collector = SinglePassHtmlCollector()
+    collect_information = collector.collect_all_information(
+        HTML_COLLECTOR_MOCK['content'])
+
+    assert collect_information == HtmlCollector().collect_all_information(
+        HTML_COLLECTOR_MOCK['content'])
+    assert list(collect_information.keys()) == [
+        'identification', 'financial_summary', 'price', 'detailed_information',
+        'oscillations', 'valuation_indicators', 'profitability_indicators',
+        'indebtedness_indicators', 'balance_sheet', 'income_statement'
+    ]
+
+
+def test_collect_all_information_from_listing() -> None:
+    """Test collect all information from a page that is not from a stock."""
+
+    collector = SinglePassHtmlCollector()
+
+    with pytest.raises(ValueError):
+        collector.collect_all_information(COMPANIES_LIST_MOCK['content'])
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: token_bucket_rate_limiter.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Token Bucket Rate Limiter.
+
+The bucket holds up to `capacity` tokens and is refilled at `rate` tokens per second.
+Each request takes a token, waiting for one when the bucket is empty, so bursts of
+up to `capacity` requests are sent at once and the sustained rate never exceeds `rate`.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from fundamentus.utilities.config import CRAWL_BURST, CRAWL_RATE
+from .interfaces.rate_limiter import RateLimiterInterface
+
+
+class TokenBucketRateLimiter(RateLimiterInterface):
+    """Represents a token bucket shared by the threads sending the requests."""
+
+    def __init__(self, rate: float = CRAWL_RATE, capacity: int = CRAWL_BURST) -> None:
+        """Initialize the class, with a full bucket.
+
+        :param rate: float: Tokens added per second.
+        :param capacity: int: Maximum number of tokens in the bucket.
+        :raises ValueError: If the rate or the capacity is not positive.
+        """
+
+        if rate <= 0 or capacity <= 0:
+            raise ValueError('The rate and the capacity must be positive.')
+
+        self.__rate = rate
+        self.__capacity = capacity
+        self.__tokens = float(capacity)
+        self.__updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of tokens in the bucket."""
+
+        return self.__capacity
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+
+        return self.__rate
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        """Change the tokens added per second, from now on.
+
+        :param rate: float: Tokens added per second.
+        """
+
+        with self.__lock:
+            self.__refill(time.monotonic())
+            self.__rate = rate
+
+    def __refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update.
+
+        :param now: float: Current time of the monotonic clock.
+        """
+
+        self.__tokens = min(self.__capacity,
+                            self.__tokens + (now - self.__updated_at) * self.__rate)
+        self.__updated_at = now
+
+    def _reserve(self) -> float:
+        """Take a token, possibly ahead of time.
+
+        The tokens may go negative: each waiting thread reserves its own token, so
+        they are released one by one, at the rate of the bucket. Buckets shared
+        through other stores override this method.
+
+        :return: float: Seconds to wait before the token is available.
+        """
+
+        with self.__lock:
+            self.__refill(time.monotonic())
+            self.__tokens -= 1
+
+            return max(0.0, -self.__tokens / self.__rate)
+
+    def acquire(self) -> None:
+        """Block until a token is available, and take it."""
+
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait until a token is available, and take it, without blocking the event loop."""
+
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def release(self, status_code: Optional[int], seconds: float) -> None:
+        """Ignore the response: the rate of the bucket does not adapt to it.
+
+        :param status_code: Optional[int]: Status code of the response.
+        :param seconds: float: Duration of the request.
+        """
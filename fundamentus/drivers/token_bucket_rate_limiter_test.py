@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: token_bucket_rate_limiter_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Token Bucket Rate Limiter Test."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from .token_bucket_rate_limiter import TokenBucketRateLimiter
+
+
+def test_burst_is_not_delayed() -> None:
+    """Test a burst up to the capacity is sent at once."""
+
+    rate_limiter = TokenBucketRateLimiter(rate=1, capacity=5)
+
+    started = time.monotonic()
+    for _ in range(5):
+        rate_limiter.acquire()
+
+    assert time.monotonic() - started < 0.5
+
+
+def test_sustained_rate_is_limited() -> None:
+    """Test the threads past the burst are released at the rate of the bucket."""
+
+    rate_limiter = TokenBucketRateLimiter(rate=50, capacity=1)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=4) as thread_pool:
+        list(thread_pool.map(lambda _: rate_limiter.acquire(), range(11)))
+
+    # The first token is in the bucket, the other ten take 1/50 s each.
+    assert time.monotonic() - started >= 0.18
+
+
+def test_invalid_rate() -> None:
+    """Test the rate and the capacity must be positive."""
+
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=0)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: async_fundamentus_pipeline.py
+#  Version: 0.0.4
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""
+Python Fundamentus Async API
+
+This module provides the asyncio counterpart of the FundamentusPipeline. The HTTP
+requests never block the event loop, which allows a single process to keep hundreds
+of requests in flight and keeps API servers responsive while scraping.
+"""
+
+import asyncio
+from typing import Iterable, List
+
+import httpx
+
+from fundamentus.cache.parsed_result_cache import (ParsedResultCache,
+                                                   get_default_parsed_cache)
+from fundamentus.contracts.batch_contract import BatchContract
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.async_http_requester import AsyncHttpRequester
+from fundamentus.drivers.html_collector import HtmlCollector
+from fundamentus.drivers.interfaces.html_collector import \
+    HtmlCollectorInterface
+from fundamentus.drivers.interfaces.rate_limiter import RateLimiterInterface
+from fundamentus.main.fundamentus_pipeline import _collect_and_transform
+from fundamentus.stages.extraction.async_extractor_html_information import \
+    AsyncExtractorHtmlInformation as AsyncExtractor
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation as Transformer
+
+from fundamentus.utilities.config import URL, INTERFACE, MAX_CONCURRENCY
+
+
+class AsyncFundamentusPipeline:
+    """
+    An asynchronous pipeline for accessing and processing financial information
+    of companies listed on Bovespa.
+
+    It mirrors the FundamentusPipeline interface, but every public method is a
+    coroutine that must be awaited.
+
+    Attributes:
+        ticker (str): The ticker symbol of the company.
+        url (str): The base URL for the HTTP requests.
+        interface (str): The interface for the HTTP requests.
+        client (httpx.AsyncClient): An optional client shared between pipelines.
+        collector (HtmlCollectorInterface): The collector of the HTML information.
+        parsed_cache (ParsedResultCache): The cache of the transformed pages.
+        rate_limiter (RateLimiterInterface): An optional limit on the rate of the requests.
+
+    Methods:
+        get_all_information: Returns detailed financial information of companies.
+        list_all_companies: Lists all companies with available data.
+        list_all_property_funds: Lists all real estate investment funds
+                                 with available data.
+        gather_many: Retrieves the financial information of many companies
+                     concurrently.
+    """
+
+    def __init__(self,
+                 ticker: str = None,
+                 url: str = URL,
+                 interface: str = INTERFACE,
+                 client: httpx.AsyncClient = None,
+                 collector: HtmlCollectorInterface = None,
+                 parsed_cache: ParsedResultCache = None,
+                 rate_limiter: RateLimiterInterface = None) -> None:
+        """Initializes the AsyncFundamentusPipeline object.
+
+        Args:
+            ticker (str): The ticker symbol of the company.
+            url (str): The base URL for the HTTP requests.
+            interface (str): The interface for the HTTP requests.
+            client (httpx.AsyncClient): An optional client shared between pipelines,
+                                        reusing its connection pool.
+            collector (HtmlCollectorInterface): The collector of the HTML information.
+                                                Defaults to the HtmlCollector.
+            parsed_cache (ParsedResultCache): The cache of the transformed pages, keyed
+                                              by the hash of their HTML. Defaults to the
+                                              in-memory cache shared by every pipeline.
+            rate_limiter (RateLimiterInterface): An optional limit on the rate of the
+                                                 requests, shared between pipelines.
+        """
+
+        self.__collector = collector or HtmlCollector()
+        # An asynchronous HTML information extractor.
+        self.__extractor = AsyncExtractor(requester=AsyncHttpRequester(url=url,
+                                                                       params={'papel': ticker,
+                                                                               'interface': interface},
+                                                                       client=client,
+                                                                       rate_limiter=rate_limiter),
+                                          collector=self.__collector)
+        # A raw information transformer.
+        self.__transformer = Transformer()
+        # A cache of the transformed pages, skipping the parsing of a page seen before.
+        self.__parsed_cache = parsed_cache or get_default_parsed_cache()
+
+    async def get_all_information(self) -> TransformContract:
+        """Retrieves detailed financial information of listed companies.
+
+        Returns:
+            TransformContract: A contract containing the transformed financial data.
+        """
+
+        html = await self.__extractor.fetch_html()
+
+        # Hashing, parsing and transforming are CPU bound, so they run off the loop.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.__parsed_cache.get_or_build,
+                                          'all_information', html,
+                                          lambda html: _collect_and_transform(html,
+                                                                              self.__collector))
+
+    async def list_all_companies(self) -> TransformContract:
+        """Lists all companies with available data.
+
+        Returns:
+            TransformContract: A contract containing the transformed list of companies.
+        """
+
+        extract_contract = await self.__extractor.extract_companies()
+
+        return self.__transformer.transform_companies(extract_contract)
+
+    async def list_all_property_funds(self) -> TransformContract:
+        """Lists all real estate investment funds with available data.
+
+        Returns:
+            TransformContract: A contract containing the transformed list
+                               of real estate investment funds.
+        """
+
+        extract_contract = await self.__extractor.extract_property_funds()
+
+        return self.__transformer.transform_property_funds(extract_contract)
+
+    @classmethod
+    async def gather_many(cls,
+                          tickers: Iterable[str],
+                          concurrency: int = MAX_CONCURRENCY,
+                          url: str = URL,
+                          interface: str = INTERFACE,
+                          client: httpx.AsyncClient = None,
+                          collector: HtmlCollectorInterface = None,
+                          parsed_cache: ParsedResultCache = None,
+                          rate_limiter: RateLimiterInterface = None) -> List[BatchContract]:
+        """Retrieves the financial information of many companies concurrently.
+
+        At most `concurrency` tickers are in flight at the same time, all of them
+        sharing a single connection pool. A failing ticker is reported in its own
+        contract instead of aborting the batch.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols of the companies.
+            concurrency (int): The maximum number of tickers processed at once.
+            url (str): The base URL for the HTTP requests.
+            interface (str): The interface for the HTTP requests.
+            client (httpx.AsyncClient): An optional client to share. When omitted,
+                                        a client sized for `concurrency` is opened.
+            collector (HtmlCollectorInterface): The collector of the HTML information.
+                                                Defaults to the HtmlCollector.
+            parsed_cache (ParsedResultCache): The cache of the transformed pages.
+                                              Defaults to the shared in-memory cache.
+            rate_limiter (RateLimiterInterface): An optional limit on the rate of the
+                                                 requests, shared by the tasks.
+
+        Returns:
+            List[BatchContract]: One contract per ticker, in the order given.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process(ticker: str, shared_client: httpx.AsyncClient) -> BatchContract:
+            async with semaphore:
+                try:
+                    pipeline = cls(ticker, url=url, interface=interface,
+                                   client=shared_client, collector=collector,
+                                   parsed_cache=parsed_cache, rate_limiter=rate_limiter)
+                    return BatchContract(ticker=ticker,
+                                         transform_contract=await pipeline.get_all_information(),
+                                         error=None)
+                except Exception as exception:  # pylint: disable=broad-except
+                    return BatchContract(ticker=ticker,
+                                         transform_contract=None,
+                                         error=exception)
+
+        if client is not None:
+            return list(await asyncio.gather(*(process(ticker, client) for ticker in tickers)))
+
+        limits = httpx.Limits(max_connections=concurrency,
+                              max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(limits=limits) as shared_client:
+            return list(await asyncio.gather(*(process(ticker, shared_client)
+                                               for ticker in tickers)))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: async_fundamentus_pipeline_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Test the AsyncFundamentusPipeline."""
+
+import asyncio
+
+import httpx
+
+from fundamentus.contracts.batch_contract import BatchContract
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.mocks.companies_list import COMPANIES_LIST_MOCK
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.exceptions.extract_exception import ExtractException
+
+from .async_fundamentus_pipeline import AsyncFundamentusPipeline
+
+
+def stock_page_handler(request: httpx.Request) -> httpx.Response:
+    """Answer every request with the stock page, except for the XPTO3 ticker."""
+
+    if request.url.params.get('papel') == 'XPTO3':
+        return httpx.Response(status_code=200, text='Extract Exception')
+
+    return httpx.Response(status_code=HTML_COLLECTOR_MOCK['status_code'],
+                          text=HTML_COLLECTOR_MOCK['content'])
+
+
+def test_get_all_information() -> None:
+    """Test the get_all_information coroutine."""
+
+    async def get_all_information():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(stock_page_handler)) as client:
+            return await AsyncFundamentusPipeline('MGLU3', client=client).get_all_information()
+
+    response = asyncio.run(get_all_information())
+
+    assert isinstance(response, TransformContract)
+    assert isinstance(response.transformed_information['price_information'], dict)
+    assert isinstance(response.transformed_information['income_statement'], dict)
+
+
+def test_list_all_companies() -> None:
+    """Test the list_all_companies coroutine."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code=COMPANIES_LIST_MOCK['status_code'],
+                              text=COMPANIES_LIST_MOCK['content'])
+
+    async def list_all_companies():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await AsyncFundamentusPipeline(client=client).list_all_companies()
+
+    response = asyncio.run(list_all_companies())
+
+    assert isinstance(response, TransformContract)
+    assert isinstance(response.transformed_information, list)
+    assert isinstance(response.transformed_information[0], dict)
+
+
+def test_gather_many() -> None:
+    """Test the gather_many coroutine."""
+
+    async def gather_many():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(stock_page_handler)) as client:
+            return await AsyncFundamentusPipeline.gather_many(['MGLU3', 'XPTO3', 'WEGE3'],
+                                                              concurrency=2,
+                                                              client=client)
+
+    results = asyncio.run(gather_many())
+
+    assert [result.ticker for result in results] == ['MGLU3', 'XPTO3', 'WEGE3']
+    assert all(isinstance(result, BatchContract) for result in results)
+    assert isinstance(results[0].transform_contract, TransformContract)
+    assert isinstance(results[1].error, ExtractException)
+    assert results[1].transform_contract is None
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: batch_processing.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""
+Python Fundamentus Batch Processing
+
+This module runs the tickers of a batch on a pool of threads. The items are consumed
+lazily and only a window of twice the number of threads is in flight, so a batch of
+the whole market keeps a bounded number of results in memory while the caller
+consumes them, and a failing ticker is reported in its own contract instead of
+aborting the batch.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Tuple
+
+from fundamentus.contracts.batch_contract import BatchContract
+from fundamentus.contracts.transform_contract import TransformContract
+
+
+def process_batch(process: Callable[[Any], TransformContract],
+                  items: Iterable[Any],
+                  max_workers: int,
+                  ticker: Callable[[Any], str] = None) -> Iterator[Tuple[Any, BatchContract]]:
+    """Processes the items of a batch concurrently, yielding each one as it completes.
+
+    Items completed together are yielded in the order they were submitted. The
+    pending items are dropped if the caller stops iterating early.
+
+    Args:
+        process (Callable[[Any], TransformContract]): Processes an item.
+        items (Iterable[Any]): The items of the batch, possibly a generator.
+        max_workers (int): The number of threads.
+        ticker (Callable[[Any], str]): Returns the ticker symbol of an item.
+                                       Defaults to the item itself.
+
+    Yields:
+        Tuple[Any, BatchContract]: The item and a contract with its ticker and either
+                                   its transformed financial data or the error raised
+                                   while processing it.
+    """
+
+    items = iter(items)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as thread_pool:
+        # Keep the workers busy while holding a bounded number of results.
+        futures = {thread_pool.submit(process, item): item
+                   for item in islice(items, 2 * max_workers)}
+
+        try:
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                for future in [future for future in futures if future in done]:
+                    item = futures.pop(future)
+                    for next_item in islice(items, 1):
+                        futures[thread_pool.submit(process, next_item)] = next_item
+
+                    symbol = item if ticker is None else ticker(item)
+
+                    try:
+                        contract = BatchContract(ticker=symbol,
+                                                 transform_contract=future.result(),
+                                                 error=None)
+                    except Exception as exception:  # pylint: disable=broad-except
+                        contract = BatchContract(ticker=symbol,
+                                                 transform_contract=None,
+                                                 error=exception)
+
+                    yield item, contract
+        finally:
+            # Drop the pending items if the caller stops iterating early.
+            for future in futures:
+                future.cancel()
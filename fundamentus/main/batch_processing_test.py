@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: batch_processing_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Test of the batch processing."""
+
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.exceptions.extract_exception import ExtractException
+
+from .batch_processing import process_batch
+
+
+def test_process_batch() -> None:
+    """Test processing a batch with a successful and a failed item."""
+
+    def process(item: dict) -> TransformContract:
+        if item['ticker'] == 'XPTO3':
+            raise ExtractException('Extract Exception')
+        return TransformContract(transformed_information=item)
+
+    items = [{'ticker': 'VALE3'}, {'ticker': 'XPTO3'}]
+    results = dict((item['ticker'], contract)
+                   for item, contract in process_batch(process, items, 2,
+                                                       ticker=lambda item: item['ticker']))
+
+    assert results['VALE3'].ticker == 'VALE3'
+    assert results['VALE3'].transform_contract.transformed_information == {'ticker': 'VALE3'}
+    assert results['VALE3'].error is None
+    assert results['XPTO3'].transform_contract is None
+    assert isinstance(results['XPTO3'].error, ExtractException)
+
+
+def test_process_batch_window() -> None:
+    """Test that only a bounded window of items is consumed ahead of the caller."""
+
+    consumed = []
+
+    def tickers():
+        for index in range(100):
+            consumed.append(index)
+            yield f'TICK{index}'
+
+    results = process_batch(lambda ticker: TransformContract(transformed_information={}),
+                            tickers(), 2)
+    ticker, contract = next(results)
+
+    # Only a window of twice max_workers tickers, plus the refill, is in flight.
+    assert contract.ticker == ticker
+    assert len(consumed) <= 2 * 2 + 1
+
+    results.close()
+    assert len(consumed) <= 2 * 2 + 1
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: batch_results.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""
+Python Fundamentus Batch Results
+
+This module provides the results of a batch of tickers, which can be iterated
+contract by contract or converted into a single columnar table with one row per
+ticker and one typed column per indicator of `utilities/indicator_names.py`.
+The titles and tooltips are stored once, as metadata of each column.
+"""
+
+from datetime import datetime as dt
+from importlib import import_module
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from fundamentus.contracts.batch_contract import BatchContract
+from fundamentus.utilities.indicator_names import (DATE_INDICATORS,
+                                                   INDICATOR_PATH,
+                                                   TEXT_INDICATORS)
+
+
+def _import_optional(module_name: str, extra: str):
+    """Imports an optional dependency.
+
+    Args:
+        module_name (str): The name of the module.
+        extra (str): The extra of the package that installs the module.
+
+    Returns:
+        module: The imported module.
+
+    Raises:
+        ImportError: If the module is not installed.
+    """
+
+    try:
+        return import_module(module_name)
+    except ImportError as exception:
+        raise ImportError(f'{module_name} is required for the columnar output: '
+                          f'pip install pyfundamentus[{extra}]') from exception
+
+
+class BatchResults:
+    """
+    The results of a batch of tickers.
+
+    Iterating yields one BatchContract per ticker, as soon as it completes. The
+    results can be iterated only once; the columnar conversions consume them.
+
+    Attributes:
+        errors (Dict[str, Exception]): The error of each failed ticker, filled
+                                       while the results are consumed.
+
+    Methods:
+        to_arrow: Builds a pyarrow Table with one row per ticker.
+        to_pandas: Builds a pandas DataFrame indexed by ticker.
+    """
+
+    def __init__(self, contracts: Iterable[BatchContract]) -> None:
+        """Initializes the BatchResults object.
+
+        Args:
+            contracts (Iterable[BatchContract]): The contracts of the batch.
+        """
+
+        self.__contracts = contracts
+        self.errors: Dict[str, Exception] = {}
+
+    def __iter__(self) -> Iterator[BatchContract]:
+        """Iterates over the contracts of the batch.
+
+        Yields:
+            BatchContract: A contract with the ticker and either its transformed
+                           financial data or the error raised while processing it.
+        """
+
+        for contract in self.__contracts:
+            if contract.error is not None:
+                self.errors[contract.ticker] = contract.error
+
+            yield contract
+
+    @staticmethod
+    def __to_column_value(key: str, value):
+        """Converts a transformed value to the type of its column.
+
+        Args:
+            key (str): The indicator name.
+            value: The transformed value.
+
+        Returns:
+            The value as a str, a date or a float.
+        """
+
+        if key in TEXT_INDICATORS:
+            return value
+
+        if key in DATE_INDICATORS:
+            try:
+                return dt.strptime(value, '%d/%m/%Y').date()
+            except ValueError:
+                return None
+
+        return float(value)
+
+    def __build_columns(self) -> Tuple[Dict[str, List], Dict[str, Tuple[str, str]]]:
+        """Consumes the batch into one list of values per column.
+
+        The failed tickers are left out of the columns and kept in `errors`.
+
+        Returns:
+            Tuple[Dict[str, List], Dict[str, Tuple[str, str]]]: The values of each column,
+            and the title and tooltip of each indicator.
+        """
+
+        columns = {'ticker': []}
+        columns.update({key: [] for key in INDICATOR_PATH})
+        descriptions = {}
+
+        for contract in self:
+            if contract.error is not None:
+                continue
+
+            columns['ticker'].append(contract.ticker)
+            information = contract.transform_contract.transformed_information
+
+            for key, path in INDICATOR_PATH.items():
+                item = information
+                for part in path:
+                    item = item.get(part) if item is not None else None
+
+                if item is None:
+                    columns[key].append(None)
+                    continue
+
+                columns[key].append(self.__to_column_value(key, item.value))
+                if key not in descriptions:
+                    descriptions[key] = (item.title, item.tooltip)
+
+        return columns, descriptions
+
+    def to_arrow(self):
+        """Builds a columnar table with one row per ticker.
+
+        Numbers are stored as float64, dates as date32 and text as string. The
+        title and tooltip of each indicator are stored in the metadata of its field.
+
+        Returns:
+            pyarrow.Table: The table of the batch.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+
+        pyarrow = _import_optional('pyarrow', 'arrow')
+
+        columns, descriptions = self.__build_columns()
+
+        fields = [pyarrow.field('ticker', pyarrow.string())]
+        for key in INDICATOR_PATH:
+            if key in TEXT_INDICATORS:
+                column_type = pyarrow.string()
+            elif key in DATE_INDICATORS:
+                column_type = pyarrow.date32()
+            else:
+                column_type = pyarrow.float64()
+
+            title, tooltip = descriptions.get(key, ('', ''))
+            fields.append(pyarrow.field(key, column_type,
+                                        metadata={'title': title, 'tooltip': tooltip}))
+
+        schema = pyarrow.schema(fields)
+        arrays = [pyarrow.array(columns[field.name], type=field.type) for field in schema]
+
+        return pyarrow.Table.from_arrays(arrays, schema=schema)
+
+    def to_pandas(self):
+        """Builds a DataFrame with one row per ticker, indexed by ticker.
+
+        Numbers are stored as float64, dates as datetime64 and text as object. The
+        title and tooltip of each indicator are stored in `DataFrame.attrs['fields']`.
+
+        Returns:
+            pandas.DataFrame: The DataFrame of the batch.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+
+        pandas = _import_optional('pandas', 'pandas')
+
+        columns, descriptions = self.__build_columns()
+
+        data = {}
+        for key in INDICATOR_PATH:
+            if key in TEXT_INDICATORS:
+                data[key] = pandas.Series(columns[key], dtype='object')
+            elif key in DATE_INDICATORS:
+                data[key] = pandas.to_datetime(pandas.Series(columns[key], dtype='object'))
+            else:
+                data[key] = pandas.Series(columns[key], dtype='float64')
+
+        data_frame = pandas.DataFrame(data)
+        data_frame.index = pandas.Index(columns['ticker'], name='ticker')
+        data_frame.attrs['fields'] = {key: {'title': title, 'tooltip': tooltip}
+                                      for key, (title, tooltip) in descriptions.items()}
+
+        return data_frame
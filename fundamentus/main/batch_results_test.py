@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: batch_results_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Test of the batch results."""
+
+import datetime
+
+import pytest
+
+from fundamentus.contracts.batch_contract import BatchContract
+from fundamentus.contracts.mocks.extract_contract import EXTRACT_CONTRACT_MOCK
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation
+from fundamentus.utilities.indicator_names import INDICATOR_PATH
+
+from .batch_results import BatchResults
+
+
+def batch_contracts() -> list:
+    """Build the contracts of a batch with a successful and a failed ticker."""
+
+    transform_contract = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+
+    return [BatchContract(ticker='VALE3', transform_contract=transform_contract, error=None),
+            BatchContract(ticker='XPTO3', transform_contract=None,
+                          error=ExtractException('Extract Exception'))]
+
+
+def test_iterate_batch_results() -> None:
+    """Test iterating the batch results."""
+
+    results = BatchResults(batch_contracts())
+
+    assert [contract.ticker for contract in results] == ['VALE3', 'XPTO3']
+    assert isinstance(results.errors['XPTO3'], ExtractException)
+
+
+def test_to_arrow() -> None:
+    """Test the conversion of the batch results to an Arrow table."""
+
+    pyarrow = pytest.importorskip('pyarrow')
+
+    results = BatchResults(batch_contracts())
+    table = results.to_arrow()
+
+    assert table.num_rows == 1
+    assert table.column_names == ['ticker'] + list(INDICATOR_PATH)
+    assert table.schema.field('cotacao').type == pyarrow.float64()
+    assert table.schema.field('cotacao').metadata[b'title'] == 'Cotação'.encode()
+    assert table.column('cotacao').to_pylist() == [68.45]
+    assert table.column('ultima_cotação').to_pylist() == [datetime.date(2022, 9, 21)]
+    assert table.column('setor').to_pylist() == ['Mineração']
+    assert table.column('carteira_de_credito').to_pylist() == [None]
+    assert list(results.errors) == ['XPTO3']
+
+
+def test_to_pandas() -> None:
+    """Test the conversion of the batch results to a pandas DataFrame."""
+
+    pytest.importorskip('pandas')
+
+    data_frame = BatchResults(batch_contracts()).to_pandas()
+
+    assert list(data_frame.index) == ['VALE3']
+    assert data_frame.loc['VALE3', 'dividend_yield'] == pytest.approx(0.243)
+    assert data_frame['dividend_yield'].dtype == 'float64'
+    assert data_frame.attrs['fields']['dividend_yield']['title'] == 'Dividend Yield'
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: fundamentus_pipeline.py
-#  Version: 0.0.5
+#  Version: 0.1.9
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -25,15 +25,66 @@ Using this API, investors and analysts can quickly obtain detailed data to assis
 investment decision-making.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime as dt
+from typing import Callable, Iterable, Iterator, Tuple
+
+from fundamentus.cache.memoizer import Memoizer
+from fundamentus.cache.parsed_result_cache import (ParsedResultCache,
+                                                   get_default_parsed_cache)
+from fundamentus.cache.response_cache import ResponseCache
+from fundamentus.cache.section_cache import SectionCache
+from fundamentus.contracts.batch_contract import BatchContract
+from fundamentus.contracts.extract_contract import ExtractContract
+from fundamentus.contracts.listings_contract import ListingsContract
 from fundamentus.contracts.transform_contract import TransformContract
 from fundamentus.drivers.html_collector import HtmlCollector
 from fundamentus.drivers.http_requester import HttpRequester
+from fundamentus.drivers.interfaces.html_collector import \
+    HtmlCollectorInterface
+from fundamentus.drivers.interfaces.http_requester import \
+    HttpRequesterInterface
+from fundamentus.drivers.interfaces.rate_limiter import RateLimiterInterface
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.main.batch_processing import process_batch
+from fundamentus.main.batch_results import BatchResults
+from fundamentus.main.lazy_information import LazyInformation
+from fundamentus.metrics.instrumentation import timed
 from fundamentus.stages.extraction.extractor_html_information import \
     ExtractorHtmlInformation as Extractor
 from fundamentus.stages.transformation.transform_raw_information import \
     TransformRawInformation as Transformer
 
-from fundamentus.utilities.config import URL, INTERFACE
+from fundamentus.utilities.config import (CACHE_TTL, INTERFACE, MAX_WORKERS,
+                                          RESULTS_URL, URL)
+from fundamentus.utilities.sections import SECTIONS, select_sections
+
+
+def _collect_and_transform(html: str, collector: HtmlCollectorInterface) -> TransformContract:
+    """Collects and transforms the HTML of a single stock detail page.
+
+    Defined at module level so it can be shipped to a worker process.
+
+    Args:
+        html (str): The HTML content of the stock detail page.
+        collector (HtmlCollectorInterface): The collector of the HTML information.
+
+    Returns:
+        TransformContract: A contract containing the transformed financial data.
+
+    Raises:
+        ExtractException: If the collection of the HTML fails.
+    """
+
+    try:
+        raw_information = collector.collect_all_information(html)
+    except Exception as exception:
+        raise ExtractException(exception) from exception
+
+    extract_contract = ExtractContract(raw_information=raw_information,
+                                       extraction_date=dt.today().toordinal())
+
+    return Transformer().transform_all_information(extract_contract)
 
 
 class FundamentusPipeline:
@@ -50,45 +101,244 @@ class FundamentusPipeline:
         ticker (str): The ticker symbol of the company.
         url (str): The base URL for the HTTP requests.
         interface (str): The interface for the HTTP requests.
+        collector (HtmlCollectorInterface): The collector of the HTML information.
+        requester (HttpRequesterInterface): The requester of the HTML page.
+        parsed_cache (ParsedResultCache): The cache of the transformed pages.
+        memoizer (Memoizer): An optional memo of the results, shared between pipelines.
+        rate_limiter (RateLimiterInterface): An optional limit on the rate of the requests.
+        results_requester (HttpRequesterInterface): The requester of the market results.
+        section_cache (SectionCache): An optional cache of each transformed section.
 
     Methods:
         get_all_information: Returns detailed financial information of companies.
+        get_market_snapshot: Returns the main indicators of every listed stock at once.
         list_all_companies: Lists all companies with available data.
         list_all_property_funds: Lists all real estate investment funds
                                     with available data.
+        list_all_listings: Lists both, from a single request and parse.
+        get_many: Retrieves the financial information of many companies
+                  concurrently.
+        iter_all_information: Yields the financial information of many companies
+                              as each one completes.
     """
 
-    def __init__(self, ticker: str = None, url: str = URL, interface: str = INTERFACE) -> None:
+    def __init__(self,
+                 ticker: str = None,
+                 url: str = URL,
+                 interface: str = INTERFACE,
+                 collector: HtmlCollectorInterface = None,
+                 requester: HttpRequesterInterface = None,
+                 parsed_cache: ParsedResultCache = None,
+                 memoizer: Memoizer = None,
+                 rate_limiter: RateLimiterInterface = None,
+                 results_requester: HttpRequesterInterface = None,
+                 section_cache: SectionCache = None) -> None:
         """Initializes the FundamentusPipeline object.
 
         Args:
             ticker (str): The ticker symbol of the company.
             url (str): The base URL for the HTTP requests.
             interface (str): The interface for the HTTP requests.
+            collector (HtmlCollectorInterface): The collector of the HTML information.
+                                                Defaults to the HtmlCollector.
+            requester (HttpRequesterInterface): The requester of the HTML page, e.g. an
+                                                ArchiveHttpRequester replaying archived
+                                                pages. Defaults to an HttpRequester.
+            parsed_cache (ParsedResultCache): The cache of the transformed pages, keyed
+                                              by the hash of their HTML. Defaults to the
+                                              in-memory cache shared by every pipeline.
+            memoizer (Memoizer): An optional memo of the results, keyed by ticker, URL
+                                 and interface. Share it between pipelines to answer
+                                 repeated lookups without requesting or parsing.
+                                 The memoized results must not be modified.
+            rate_limiter (RateLimiterInterface): An optional limit on the rate of the
+                                                 requests, shared between pipelines, e.g.
+                                                 an AdaptiveRateLimiter. Ignored when a
+                                                 requester is given.
+            results_requester (HttpRequesterInterface): The requester of the market
+                                                        results page. Defaults to an
+                                                        HttpRequester of RESULTS_URL.
+            section_cache (SectionCache): An optional cache of the transformed sections,
+                                          each one kept for its own time to live. The
+                                          detail page is only requested when a section
+                                          needed expired, and its response is then not
+                                          cached, so the expired sections are refreshed.
         """
 
+        self.__memo_key = (url, interface, ticker.upper() if ticker else None)
+        requester = requester or HttpRequester(url=url,
+                                               params={'papel': ticker,
+                                                       'interface': interface},
+                                               cache=(ResponseCache(None)
+                                                      if section_cache is not None
+                                                      else None),
+                                               rate_limiter=rate_limiter)
+        self.__collector = collector or HtmlCollector()
         # A HTML information extractor.
-        self.__extractor = Extractor(requester=HttpRequester(url=url,
-                                                             params={'papel': ticker,
-                                                                     'interface': interface}),
-                                     collector=HtmlCollector())
+        self.__extractor = Extractor(requester=requester, collector=self.__collector)
+        # A HTML information extractor of the market results, a page for every stock.
+        self.__results_extractor = Extractor(
+            requester=results_requester or HttpRequester(url=RESULTS_URL, params={},
+                                                         rate_limiter=rate_limiter),
+            collector=self.__collector)
         # A raw information transformer.
         self.__transformer = Transformer()
+        # A cache of the transformed pages, skipping the parsing of a page seen before.
+        self.__parsed_cache = parsed_cache or get_default_parsed_cache()
+        # An optional memo of the results, in front of every cache.
+        self.__memoizer = memoizer
+        # An optional cache of the transformed sections, replacing the response cache.
+        self.__section_cache = section_cache
+
+    def __fetch_and_transform(self, kind: str,
+                              extract: Callable[[str], ExtractContract],
+                              transform: Callable[[ExtractContract], TransformContract],
+                              cache_parsed: bool = True,
+                              extractor: Extractor = None,
+                              parsed_ttl: float = None) -> TransformContract:
+        """Fetches a page and transforms it, going through the memo and the caches.
+
+        Args:
+            kind (str): The kind of the result, e.g. 'all_information' or 'listings'.
+            extract (Callable[[str], ExtractContract]): Collects the HTML.
+            transform (Callable[[ExtractContract], TransformContract]): Transforms the
+                                                                         collected HTML.
+            cache_parsed (bool): Whether the result goes through the parsed cache.
+            extractor (Extractor): The extractor fetching the page. Defaults to the
+                                   extractor of the pipeline's URL.
+            parsed_ttl (float): Seconds the result is kept by the parsed cache.
+                                Defaults to the time to live of the parsed cache.
+
+        Returns:
+            TransformContract: A contract containing the transformed data.
+        """
+
+        extractor = extractor or self.__extractor
+
+        def compute() -> TransformContract:
+            html = extractor.fetch_html()
+
+            if not cache_parsed:
+                return transform(extract(html))
+
+            return self.__parsed_cache.get_or_build(kind, html,
+                                                    lambda html: transform(extract(html)),
+                                                    parsed_ttl)
+
+        with timed('pipeline'):
+            if self.__memoizer is None:
+                return compute()
+
+            return self.__memoizer.get_or_compute((kind, *self.__memo_key), compute)
 
-    def get_all_information(self) -> TransformContract:
+    def __get_cached_sections(self, selected: Tuple[str, ...]) -> TransformContract:
+        """Assembles the sections from the section cache, requesting the page when one expired.
+
+        When the page is requested, every selected section is collected and cached again.
+
+        Args:
+            selected (Tuple[str, ...]): The sections to retrieve, in the order of the page.
+
+        Returns:
+            TransformContract: A contract containing the transformed financial data.
+        """
+
+        kind = f'all_information:{",".join(selected)}'
+
+        def compute() -> TransformContract:
+            information = self.__section_cache.get(self.__memo_key, selected)
+
+            if len(information) < len(selected):
+                html = self.__extractor.fetch_html()
+                information = self.__parsed_cache.get_or_build(
+                    kind, html,
+                    lambda html: self.__transformer.transform_all_information(
+                        self.__extractor.extract_all_information(
+                            html, [SECTIONS[section] for section in selected]),
+                        selected)).transformed_information
+
+                self.__section_cache.set(self.__memo_key, information)
+
+            return TransformContract(transformed_information={
+                section: information[section] for section in selected})
+
+        with timed('pipeline'):
+            if self.__memoizer is None:
+                return compute()
+
+            return self.__memoizer.get_or_compute((f'sections:{kind}', *self.__memo_key),
+                                                  compute)
+
+    def get_all_information(self, sections: Iterable[str] = None,
+                            lazy: bool = False) -> TransformContract:
         """Retrieves detailed financial information of listed companies.
 
         This method extracts and transforms financial data of companies,
         including indicators such as net profit, net revenue, among others,
         providing a comprehensive view of the companies' financial and economic state.
 
+        Args:
+            sections (Iterable[str]): The sections to retrieve, e.g. ['price_information',
+                                      'valuation_indicators']. The other sections are
+                                      neither collected nor transformed. Defaults to
+                                      every section of `utilities/sections.py`.
+            lazy (bool): Whether each section is collected and transformed only when
+                         first accessed. The page is parsed up front, and the result
+                         skips the parsed cache, which would build every section.
+                         Ignored with a section cache, which only collects the
+                         sections when one of them expired.
+
         Returns:
             TransformContract: A contract containing the transformed financial data.
+                               When lazy, its information is a LazyInformation.
+
+        Raises:
+            ValueError: If a section is unknown.
         """
 
-        extract_contract = self.__extractor.extract_all_information()
+        selected = select_sections(sections)
+
+        if self.__section_cache is not None:
+            return self.__get_cached_sections(selected)
+
+        if lazy:
+            return self.__fetch_and_transform(
+                f'lazy_information:{",".join(selected)}',
+                self.__extractor.extract_document,
+                lambda document: TransformContract(transformed_information=LazyInformation(
+                    document, self.__collector, selected, self.__transformer)),
+                cache_parsed=False)
+
+        if sections is None:
+            return self.__fetch_and_transform('all_information',
+                                              self.__extractor.extract_all_information,
+                                              self.__transformer.transform_all_information)
+
+        return self.__fetch_and_transform(
+            f'all_information:{",".join(selected)}',
+            lambda html: self.__extractor.extract_all_information(
+                html, [SECTIONS[section] for section in selected]),
+            lambda extract_contract: self.__transformer.transform_all_information(
+                extract_contract, selected))
 
-        return self.__transformer.transform_all_information(extract_contract)
+    def get_market_snapshot(self) -> TransformContract:
+        """Retrieves the main indicators of every listed stock at once.
+
+        The market results page holds the price, the valuation, profitability and
+        indebtedness indicators, the traded volume and the equity of every stock in a
+        single table, so a single request replaces a detail page request per ticker.
+
+        Returns:
+            TransformContract: A contract whose information maps each ticker to its
+                               indicators, under the same sections and keys as in
+                               `get_all_information`. Only the indicators shown in the
+                               market results are present.
+        """
+
+        return self.__fetch_and_transform('market_snapshot',
+                                          self.__results_extractor.extract_market_results,
+                                          self.__transformer.transform_market_snapshot,
+                                          extractor=self.__results_extractor)
 
     def list_all_companies(self) -> TransformContract:
         """Lists all companies with available data.
@@ -100,9 +350,7 @@ class FundamentusPipeline:
             TransformContract: A contract containing the transformed list of companies.
         """
 
-        extract_contract = self.__extractor.extract_companies()
-
-        return self.__transformer.transform_companies(extract_contract)
+        return self.list_all_listings().companies
 
     def list_all_property_funds(self) -> TransformContract:
         """Lists all real estate investment funds with available data.
@@ -116,6 +364,164 @@ class FundamentusPipeline:
                                of real estate investment funds.
         """
 
-        extract_contract = self.__extractor.extract_property_funds()
+        return self.list_all_listings().property_funds
+
+    def list_all_listings(self) -> ListingsContract:
+        """Lists all companies and all real estate investment funds at once.
+
+        Both lists are on the same page, so it is requested and parsed a single time.
+        The parsed lists are cached as long as the page itself, so the calls of
+        `list_all_companies` and `list_all_property_funds` share them too.
+
+        Returns:
+            ListingsContract: The transformed list of companies and the transformed
+                              list of real estate investment funds.
+        """
+
+        listings = self.__fetch_and_transform('listings',
+                                              self.__extractor.extract_listings,
+                                              self.__transformer.transform_listings,
+                                              parsed_ttl=CACHE_TTL['listing'])
+
+        return ListingsContract(
+            companies=TransformContract(
+                transformed_information=listings.transformed_information['companies']),
+            property_funds=TransformContract(
+                transformed_information=listings.transformed_information['property_funds']))
+
+    @classmethod
+    def get_many(cls,
+                 tickers: Iterable[str],
+                 max_workers: int = MAX_WORKERS,
+                 parse_workers: int = 0,
+                 url: str = URL,
+                 interface: str = INTERFACE,
+                 collector: HtmlCollectorInterface = None,
+                 parsed_cache: ParsedResultCache = None,
+                 rate_limiter: RateLimiterInterface = None) -> BatchResults:
+        """Retrieves the financial information of many companies concurrently.
+
+        The HTTP requests are fanned out across a pool of threads. When
+        `parse_workers` is greater than zero, the collection and transformation
+        of each page run on a pool of processes, keeping the BeautifulSoup
+        parsing off the GIL. Results are yielded as soon as each ticker
+        completes, and a failing ticker is reported in its own contract
+        instead of aborting the batch. The results can also be converted into
+        a single table with `to_arrow` or `to_pandas`.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols of the companies.
+            max_workers (int): The number of threads used for the HTTP requests.
+            parse_workers (int): The number of processes used for parsing.
+                                 Zero parses on the request threads.
+            url (str): The base URL for the HTTP requests.
+            interface (str): The interface for the HTTP requests.
+            collector (HtmlCollectorInterface): The collector of the HTML information.
+                                                Defaults to the HtmlCollector.
+            parsed_cache (ParsedResultCache): The cache of the transformed pages.
+                                              Defaults to the shared in-memory cache.
+            rate_limiter (RateLimiterInterface): An optional limit on the rate of the
+                                                 requests, shared by the threads.
+
+        Returns:
+            BatchResults: The results of the batch, yielding a BatchContract per ticker.
+        """
+
+        return BatchResults(cls.__process_many(tickers, max_workers, parse_workers,
+                                               url, interface, collector or HtmlCollector(),
+                                               parsed_cache or get_default_parsed_cache(),
+                                               rate_limiter))
+
+    @classmethod
+    def iter_all_information(cls,
+                             tickers: Iterable[str],
+                             max_workers: int = MAX_WORKERS,
+                             url: str = URL,
+                             interface: str = INTERFACE,
+                             collector: HtmlCollectorInterface = None,
+                             parsed_cache: ParsedResultCache = None,
+                             rate_limiter: RateLimiterInterface = None
+                             ) -> Iterator[BatchContract]:
+        """Yields the financial information of many companies as each one completes.
+
+        The tickers are consumed lazily and only a window of about twice
+        `max_workers` tickers is in flight, so a scan of the whole market keeps
+        a bounded number of results in memory while the caller consumes them.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols of the companies, possibly
+                                     a generator.
+            max_workers (int): The number of threads used for the HTTP requests.
+            url (str): The base URL for the HTTP requests.
+            interface (str): The interface for the HTTP requests.
+            collector (HtmlCollectorInterface): The collector of the HTML information.
+                                                Defaults to the HtmlCollector.
+            parsed_cache (ParsedResultCache): The cache of the transformed pages.
+                                              Defaults to the shared in-memory cache.
+            rate_limiter (RateLimiterInterface): An optional limit on the rate of the
+                                                 requests, shared by the threads.
+
+        Returns:
+            Iterator[BatchContract]: A contract per ticker, with either its transformed
+                                     financial data or the error raised while processing it.
+        """
+
+        return cls.__process_many(tickers, max_workers, 0, url, interface,
+                                  collector or HtmlCollector(),
+                                  parsed_cache or get_default_parsed_cache(),
+                                  rate_limiter)
+
+    @classmethod
+    def __process_many(cls,
+                       tickers: Iterable[str],
+                       max_workers: int,
+                       parse_workers: int,
+                       url: str,
+                       interface: str,
+                       collector: HtmlCollectorInterface,
+                       parsed_cache: ParsedResultCache,
+                       rate_limiter: RateLimiterInterface) -> Iterator[BatchContract]:
+        """Processes the tickers of get_many and iter_all_information, as they complete.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols of the companies.
+            max_workers (int): The number of threads used for the HTTP requests.
+            parse_workers (int): The number of processes used for parsing.
+            url (str): The base URL for the HTTP requests.
+            interface (str): The interface for the HTTP requests.
+            collector (HtmlCollectorInterface): The collector of the HTML information.
+            parsed_cache (ParsedResultCache): The cache of the transformed pages.
+            rate_limiter (RateLimiterInterface): The limit on the rate of the requests, if any.
+
+        Yields:
+            BatchContract: A contract with the ticker and either its transformed
+                           financial data or the error raised while processing it.
+        """
+
+        process_pool = ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 0 else None
+
+        def process(ticker: str) -> TransformContract:
+            if process_pool is None:
+                return cls(ticker, url=url, interface=interface, collector=collector,
+                           parsed_cache=parsed_cache,
+                           rate_limiter=rate_limiter).get_all_information()
+
+            try:
+                requester = HttpRequester(url=url,
+                                          params={'papel': ticker, 'interface': interface},
+                                          rate_limiter=rate_limiter)
+                html = requester.make_request().response.text
+            except Exception as exception:
+                raise ExtractException(exception) from exception
+
+            # Only the pages missing from the cache are shipped to a worker process.
+            return parsed_cache.get_or_build(
+                'all_information', html,
+                lambda html: process_pool.submit(_collect_and_transform, html, collector).result())
 
-        return self.__transformer.transform_property_funds(extract_contract)
+        try:
+            for _, contract in process_batch(process, tickers, max_workers):
+                yield contract
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown()
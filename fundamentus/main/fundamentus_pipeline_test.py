@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: fundamentus_pipeline.py
-#  Version: 0.0.6
+#  Version: 0.0.7
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -17,12 +17,24 @@
 # ------------------------------------------------------------------------------
 """Test the FundamentusPipeline."""
 
+from decimal import Decimal
+
+import pytest
+
+from fundamentus.cache.memory_cache_backend import MemoryCacheBackend
+from fundamentus.cache.parsed_result_cache import ParsedResultCache
+from fundamentus.cache.section_cache import SectionCache
+from fundamentus.contracts.batch_contract import BatchContract
 from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.html_collector import HtmlCollector
 from fundamentus.drivers.mocks.companies_list import COMPANIES_LIST_MOCK
 from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
-from fundamentus.utilities.config import URL
+from fundamentus.drivers.mocks.market_results import MARKET_RESULTS_MOCK
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.utilities.config import RESULTS_URL, URL
 
 from .fundamentus_pipeline import FundamentusPipeline
+from .lazy_information import LazyInformation
 
 
 def test_get_all_information(requests_mock) -> None:
@@ -56,6 +68,88 @@ def test_get_all_information(requests_mock) -> None:
                       dict)
 
 
+def test_get_all_information_sections(requests_mock) -> None:
+    """Test the get_all_information method with a subset of the sections."""
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    main_pipeline = FundamentusPipeline('MGLU3')
+    expected = main_pipeline.get_all_information().transformed_information
+    response = main_pipeline.get_all_information(
+        sections=['valuation_indicators', 'price_information'])
+
+    # The sections keep the order of the page.
+    assert list(response.transformed_information) == ['price_information',
+                                                      'valuation_indicators']
+    assert response.transformed_information['valuation_indicators'] == \
+        expected['valuation_indicators']
+
+    with pytest.raises(ValueError):
+        main_pipeline.get_all_information(sections=['prices'])
+
+
+def test_get_all_information_lazy(requests_mock) -> None:
+    """Test the get_all_information method building the sections on first access."""
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    main_pipeline = FundamentusPipeline('MGLU3')
+    expected = main_pipeline.get_all_information().transformed_information
+    response = main_pipeline.get_all_information(lazy=True)
+    information = response.transformed_information
+
+    assert isinstance(information, LazyInformation)
+    assert information.built_sections == ()
+    assert information['balance_sheet'] == expected['balance_sheet']
+    assert information.built_sections == ('balance_sheet',)
+
+
+def test_get_all_information_section_cache(requests_mock) -> None:
+    """Test the page is only requested when a section needed expired."""
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    section_cache = SectionCache(MemoryCacheBackend(),
+                                 ttl=lambda section: 0 if section == 'price_information' else 60)
+    main_pipeline = FundamentusPipeline('MGLU3', section_cache=section_cache)
+
+    expected = main_pipeline.get_all_information().transformed_information
+    balance_sheet = main_pipeline.get_all_information(sections=['balance_sheet'])
+
+    assert requests_mock.call_count == 1
+    assert balance_sheet.transformed_information == {
+        'balance_sheet': expected['balance_sheet']}
+
+    # The price expired, so the page is requested again.
+    response = main_pipeline.get_all_information()
+
+    assert requests_mock.call_count == 2
+    assert response.transformed_information == expected
+
+
+def test_get_market_snapshot(requests_mock) -> None:
+    """Test the get_market_snapshot method."""
+
+    requests_mock.get(RESULTS_URL,
+                      status_code=MARKET_RESULTS_MOCK['status_code'],
+                      text=MARKET_RESULTS_MOCK['content'])
+
+    main_pipeline = FundamentusPipeline()
+    response = main_pipeline.get_market_snapshot()
+
+    assert isinstance(response, TransformContract)
+    assert list(response.transformed_information) == ['AALR3', 'ABCB4', 'MGLU3', 'PETR4']
+    assert response.transformed_information['MGLU3']['valuation_indicators'][
+        'price_divided_by_asset_value'].value == Decimal('1.07')
+    assert requests_mock.call_count == 1
+
+
 def test_list_all_companies(requests_mock) -> None:
     """Test the list_all_companies method."""
 
@@ -89,3 +183,87 @@ def test_list_all_property_funds(requests_mock) -> None:
     assert isinstance(response, TransformContract)
     assert isinstance(response.transformed_information, list)
     assert isinstance(response.transformed_information[0], dict)
+
+
+def test_list_all_listings(requests_mock) -> None:
+    """Test both listings are collected from a single parse of the page."""
+
+    class CountingHtmlCollector(HtmlCollector):
+        """Counts how many listing pages are collected."""
+
+        calls = 0
+
+        def collect_listings(self, html: str) -> dict:
+            """Count the page and collect it."""
+
+            CountingHtmlCollector.calls += 1
+            return super().collect_listings(html)
+
+    requests_mock.get(URL,
+                      status_code=COMPANIES_LIST_MOCK['status_code'],
+                      text=COMPANIES_LIST_MOCK['content'])
+
+    main_pipeline = FundamentusPipeline(collector=CountingHtmlCollector(),
+                                        parsed_cache=ParsedResultCache(MemoryCacheBackend()))
+    companies, property_funds = main_pipeline.list_all_listings()
+
+    assert companies == main_pipeline.list_all_companies()
+    assert property_funds == main_pipeline.list_all_property_funds()
+    assert companies.transformed_information[0]['code'] == 'AALR3'
+    assert property_funds.transformed_information[-1]['code'] == 'BCIA11'
+    assert CountingHtmlCollector.calls == 1
+
+
+def test_get_many(requests_mock) -> None:
+    """Test the get_many method."""
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+    # A ticker whose page is not a stock page must fail on its own.
+    requests_mock.get(f'{URL}?papel=XPTO3',
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text='Extract Exception')
+
+    results = list(FundamentusPipeline.get_many(['MGLU3', 'WEGE3', 'XPTO3'],
+                                                max_workers=2))
+
+    assert len(results) == 3
+    assert all(isinstance(result, BatchContract) for result in results)
+
+    failures = [result for result in results if result.error is not None]
+    successes = [result for result in results if result.error is None]
+
+    assert [failure.ticker for failure in failures] == ['XPTO3']
+    assert isinstance(failures[0].error, ExtractException)
+    assert failures[0].transform_contract is None
+
+    assert sorted(success.ticker for success in successes) == ['MGLU3', 'WEGE3']
+    for success in successes:
+        assert isinstance(success.transform_contract, TransformContract)
+        assert isinstance(
+            success.transform_contract.transformed_information['price_information'], dict)
+
+
+def test_iter_all_information(requests_mock) -> None:
+    """Test that iter_all_information consumes the tickers lazily."""
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    consumed = []
+
+    def tickers():
+        for index in range(20):
+            consumed.append(index)
+            yield f'TEST{index}'
+
+    results = FundamentusPipeline.iter_all_information(tickers(), max_workers=1)
+    first = next(results)
+
+    # Only a window of twice max_workers tickers, plus the refill, is in flight.
+    assert len(consumed) <= 3
+    assert first.error is None
+
+    assert len([first, *results]) == 20
@@ -0,0 +1,454 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: hybrid_pipeline.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""
+Python Fundamentus Hybrid Refresh API
+
+This module provides a pipeline that keeps the whole detail page of each ticker, as
+transformed by a deep crawl, and refreshes it from the market results page: a single
+request updates the price and the price derived indicators of every ticker, and the
+detail page of a ticker is fetched again only when it publishes a new financial
+statement.
+
+The market results do not show the date of the last financial statement, so a new
+statement is told by the indicators of the statements shown there: the margins,
+ROE, ROIC, the growth of the revenue, the liquidity, the debt and the equity. When
+they move, the detail page is fetched, with its new `last_financial_statement`.
+
+A patched detail page shows the date of the last session as the date of its price,
+and its market and enterprise valuations follow the new price.
+"""
+
+import threading
+from collections import Counter
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from fundamentus.cache.response_cache import ResponseCache
+from fundamentus.contracts.batch_contract import BatchContract
+from fundamentus.contracts.information_contract import InformationItem
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.html_collector import HtmlCollector
+from fundamentus.drivers.http_requester import HttpRequester
+from fundamentus.drivers.interfaces.html_collector import \
+    HtmlCollectorInterface
+from fundamentus.drivers.interfaces.rate_limiter import RateLimiterInterface
+from fundamentus.main.batch_processing import process_batch
+from fundamentus.main.batch_results import BatchResults
+from fundamentus.main.fundamentus_pipeline import FundamentusPipeline
+
+from fundamentus.utilities.config import (INTERFACE, MAX_WORKERS, RESULTS_URL,
+                                          URL)
+from fundamentus.utilities.trading_calendar import TradingCalendar
+
+# Sections whose indicators of the market results change with the price.
+_PRICE_SECTIONS = ('price_information', 'detailed_information', 'valuation_indicators')
+
+# Format of the dates shown on the detail page.
+_DATE_FORMAT = '%d/%m/%Y'
+
+# Sections whose indicators of the market results only change with a new statement.
+_STATEMENT_SECTIONS = ('profitability_indicators', 'indebtedness_indicators', 'balance_sheet')
+
+
+def _value(information: Dict, section: str, key: str) -> Any:
+    """Returns the value of an indicator of the transformed information, if present.
+
+    Args:
+        information (Dict): The transformed information of a ticker.
+        section (str): The section of the indicator.
+        key (str): The key of the indicator.
+
+    Returns:
+        Any: The value of the indicator, or None if it is missing.
+    """
+
+    item = information.get(section, {}).get(key)
+
+    return item.value if item is not None else None
+
+
+class HybridFundamentusPipeline:
+    """
+    A pipeline refreshing the detail pages of a deep crawl from the market results.
+
+    The detail pages of each ticker are kept in memory, so the same pipeline object
+    should be reused between refreshes.
+
+    Attributes:
+        url (str): The base URL for the HTTP requests.
+        interface (str): The interface for the HTTP requests.
+        collector (HtmlCollectorInterface): The collector of the HTML information.
+        rate_limiter (RateLimiterInterface): An optional limit on the rate of the requests.
+        statistics (Counter): How many tickers were 'patched' from the market results,
+                              'fetched' for the first time, or fetched again with a
+                              'new_statement' or with the same one ('refetched').
+
+    Methods:
+        load: Keeps the detail pages of a deep crawl.
+        refresh: Refreshes the tickers from the market results.
+        forget: Drops the detail pages of the given tickers, or of every ticker.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self,
+                 url: str = URL,
+                 interface: str = INTERFACE,
+                 collector: HtmlCollectorInterface = None,
+                 rate_limiter: RateLimiterInterface = None,
+                 calendar: TradingCalendar = None,
+                 clock: Callable[[], datetime] = None) -> None:
+        """Initializes the HybridFundamentusPipeline object.
+
+        Args:
+            url (str): The base URL for the HTTP requests.
+            interface (str): The interface for the HTTP requests.
+            collector (HtmlCollectorInterface): The collector of the HTML information.
+                                                Defaults to the HtmlCollector.
+            rate_limiter (RateLimiterInterface): An optional limit on the rate of the
+                                                 requests. The responses are never
+                                                 cached, as a refresh needs the current
+                                                 pages.
+            calendar (TradingCalendar): The trading sessions, telling the date of the
+                                        prices of the market results. Defaults to the
+                                        sessions of B3.
+            clock (Callable[[], datetime]): Returns the current time. Defaults to the
+                                            clock of the calendar.
+        """
+
+        self.__url = url
+        self.__interface = interface
+        self.__collector = collector or HtmlCollector()
+        self.__rate_limiter = rate_limiter
+        self.__cache = ResponseCache(None)
+        self.__calendar = calendar or TradingCalendar()
+        self.__clock = clock or self.__calendar.now
+
+        # The transformed detail page of each ticker, patched by the refreshes.
+        self.__snapshots: Dict[str, Dict] = {}
+        # The statement indicators of each ticker in the last market results.
+        self.__statements: Dict[str, Dict] = {}
+        self.__lock = threading.Lock()
+        self.statistics = Counter()
+
+    def __pipeline(self, ticker: str = None) -> FundamentusPipeline:
+        """Builds a pipeline requesting the current pages.
+
+        Args:
+            ticker (str): The ticker symbol of the company, if any.
+
+        Returns:
+            FundamentusPipeline: The pipeline.
+        """
+
+        requester = HttpRequester(url=self.__url,
+                                  params={'papel': ticker, 'interface': self.__interface},
+                                  cache=self.__cache,
+                                  rate_limiter=self.__rate_limiter)
+        results_requester = HttpRequester(url=RESULTS_URL,
+                                          params={},
+                                          cache=self.__cache,
+                                          rate_limiter=self.__rate_limiter)
+
+        return FundamentusPipeline(ticker,
+                                   url=self.__url,
+                                   interface=self.__interface,
+                                   collector=self.__collector,
+                                   requester=requester,
+                                   results_requester=results_requester)
+
+    def __count(self, outcome: str) -> None:
+        """Counts the outcome of a refresh.
+
+        Args:
+            outcome (str): The outcome of the refresh.
+        """
+
+        with self.__lock:
+            self.statistics[outcome] += 1
+
+    @property
+    def tickers(self) -> List[str]:
+        """The tickers whose detail page is kept."""
+
+        with self.__lock:
+            return list(self.__snapshots)
+
+    def load(self, results: Iterable[BatchContract]) -> None:
+        """Keeps the detail pages of a deep crawl, replacing the ones kept before.
+
+        Args:
+            results (Iterable[BatchContract]): The results of the crawl, e.g. of
+                                               `ListingCrawler.crawl` or of
+                                               `FundamentusPipeline.get_many`.
+                                               The failed tickers are skipped.
+        """
+
+        for contract in results:
+            if contract.error is not None:
+                continue
+
+            # A lazy result is built whole, as every section is kept.
+            information = dict(contract.transform_contract.transformed_information)
+
+            with self.__lock:
+                self.__snapshots[contract.ticker.upper()] = information
+                self.__statements.pop(contract.ticker.upper(), None)
+
+    @staticmethod
+    def __statements_of(stock: Dict) -> Dict:
+        """Returns the statement indicators of a ticker in the market results.
+
+        Args:
+            stock (Dict): The transformed market results of the ticker.
+
+        Returns:
+            Dict: The value of each statement indicator, by section and key.
+        """
+
+        return {section: {key: item.value for key, item in stock.get(section, {}).items()}
+                for section in _STATEMENT_SECTIONS}
+
+    def __has_new_statement(self, ticker: str, information: Dict, stock: Dict) -> bool:
+        """Tells whether a ticker published a new statement since its detail page.
+
+        Args:
+            ticker (str): The ticker symbol of the company.
+            information (Dict): The detail page kept for the ticker.
+            stock (Dict): The transformed market results of the ticker.
+
+        Returns:
+            bool: Whether the detail page should be fetched again.
+        """
+
+        with self.__lock:
+            statements = self.__statements.get(ticker)
+
+        if statements is None:
+            # Right after a deep crawl, the market results were never seen. Only the
+            # equity is shown with the same precision in both pages.
+            return (_value(stock, 'balance_sheet', 'equity')
+                    != _value(information, 'balance_sheet', 'equity'))
+
+        return self.__statements_of(stock) != statements
+
+    @staticmethod
+    def __replace_value(section: Dict, key: str, value: Any) -> None:
+        """Replaces the value of an indicator, keeping its title and tooltip.
+
+        Args:
+            section (Dict): The section of the indicator, modified in place.
+            key (str): The key of the indicator.
+            value (Any): The new value.
+        """
+
+        section[key] = InformationItem(title=section[key].title,
+                                       tooltip=section[key].tooltip,
+                                       value=value)
+
+    @classmethod
+    def __patch_valuations(cls, patched: Dict, information: Dict) -> None:
+        """Updates the market and enterprise valuations from the patched price.
+
+        The market valuation is the price times the number of shares. The net debt
+        only changes with a new statement, so the enterprise valuation moves as much
+        as the market valuation.
+
+        Args:
+            patched (Dict): The patched detail page, modified in place.
+            information (Dict): The detail page kept for the ticker.
+        """
+
+        price = _value(patched, 'price_information', 'price')
+        shares = _value(information, 'financial_summary', 'number_of_shares')
+        market_valuation = _value(information, 'financial_summary', 'market_valuation')
+
+        if price is None or shares is None or market_valuation is None:
+            return
+
+        summary = patched['financial_summary'] = dict(information['financial_summary'])
+        new_market_valuation = (price * shares).quantize(Decimal(1))
+        cls.__replace_value(summary, 'market_valuation', new_market_valuation)
+
+        enterprise_valuation = _value(information, 'financial_summary', 'enterprise_valuation')
+        if enterprise_valuation is not None:
+            cls.__replace_value(summary, 'enterprise_valuation',
+                                enterprise_valuation + new_market_valuation - market_valuation)
+
+    @classmethod
+    def __patch(cls, information: Dict, stock: Dict, session: date) -> Dict:
+        """Updates the price derived indicators of a detail page from the market results.
+
+        The titles and tooltips of the detail page are kept. The detail page kept
+        before is not modified.
+
+        Args:
+            information (Dict): The detail page kept for the ticker.
+            stock (Dict): The transformed market results of the ticker.
+            session (date): The day of the session of the prices of the market results.
+
+        Returns:
+            Dict: The patched detail page.
+        """
+
+        patched = dict(information)
+
+        for section in _PRICE_SECTIONS:
+            if section not in information or section not in stock:
+                continue
+
+            patched[section] = dict(information[section])
+            for key, item in stock[section].items():
+                if key in patched[section]:
+                    cls.__replace_value(patched[section], key, item.value)
+
+        if 'date' in patched.get('price_information', {}):
+            cls.__replace_value(patched['price_information'], 'date',
+                                session.strftime(_DATE_FORMAT))
+
+        if 'financial_summary' in information:
+            cls.__patch_valuations(patched, information)
+
+        return patched
+
+    def refresh(self, tickers: Iterable[str] = None,
+                max_workers: int = MAX_WORKERS) -> BatchResults:
+        """Refreshes the tickers from the market results.
+
+        The market results are requested once, up front. Each ticker listed there is
+        patched from them, unless it published a new statement; the detail page of
+        the other tickers, and of the tickers not kept yet, is fetched.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols of the companies.
+                                     Defaults to every ticker kept.
+            max_workers (int): The number of threads used for the detail pages.
+
+        Returns:
+            BatchResults: The results of the refresh, yielding a BatchContract per
+                          ticker: the patched tickers first, then the fetched ones as
+                          they complete.
+
+        Raises:
+            ExtractException: If the request or the collection of the market results fails.
+            TransformException: If the transformation of the market results fails.
+        """
+
+        market = self.__pipeline().get_market_snapshot().transformed_information
+
+        if tickers is None:
+            tickers = self.tickers
+        else:
+            tickers = [ticker.upper() for ticker in tickers]
+
+        return BatchResults(self.__process(tickers, market, max_workers))
+
+    def __fetch(self, ticker: str, stock: Dict) -> TransformContract:
+        """Fetches the detail page of a ticker, keeping it for the next refreshes.
+
+        Args:
+            ticker (str): The ticker symbol of the company.
+            stock (Dict): The transformed market results of the ticker, if listed there.
+
+        Returns:
+            TransformContract: A contract containing the transformed financial data.
+        """
+
+        transform_contract = self.__pipeline(ticker).get_all_information()
+        information = dict(transform_contract.transformed_information)
+
+        with self.__lock:
+            previous = self.__snapshots.get(ticker)
+            self.__snapshots[ticker] = information
+
+            if stock is not None:
+                self.__statements[ticker] = self.__statements_of(stock)
+            else:
+                self.__statements.pop(ticker, None)
+
+        if previous is None:
+            self.__count('fetched')
+        elif (_value(previous, 'financial_summary', 'last_financial_statement')
+              != _value(information, 'financial_summary', 'last_financial_statement')):
+            self.__count('new_statement')
+        else:
+            self.__count('refetched')
+
+        return transform_contract
+
+    def __process(self, tickers: List[str], market: Dict[str, Dict],
+                  max_workers: int) -> Iterator[BatchContract]:
+        """Refreshes the tickers of refresh, yielding each one as it completes.
+
+        Args:
+            tickers (List[str]): The ticker symbols of the companies.
+            market (Dict[str, Dict]): The transformed market results, by ticker.
+            max_workers (int): The number of threads used for the detail pages.
+
+        Yields:
+            BatchContract: A contract with the ticker and either its transformed
+                           financial data or the error raised while processing it.
+        """
+
+        pending = []
+        session = self.__calendar.last_session(self.__clock())
+
+        for ticker in tickers:
+            with self.__lock:
+                information = self.__snapshots.get(ticker)
+            stock = market.get(ticker)
+
+            if (information is None or stock is None
+                    or self.__has_new_statement(ticker, information, stock)):
+                pending.append(ticker)
+                continue
+
+            patched = self.__patch(information, stock, session)
+            with self.__lock:
+                self.__snapshots[ticker] = patched
+                self.__statements[ticker] = self.__statements_of(stock)
+
+            self.__count('patched')
+            yield BatchContract(ticker=ticker,
+                                transform_contract=TransformContract(
+                                    transformed_information=patched),
+                                error=None)
+
+        if not pending:
+            return
+
+        for _, contract in process_batch(lambda ticker: self.__fetch(ticker, market.get(ticker)),
+                                         pending, max_workers):
+            yield contract
+
+    def forget(self, tickers: Iterable[str] = None) -> None:
+        """Drops the detail pages of the given tickers, so they are fetched next time.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols to forget. Defaults to every ticker.
+        """
+
+        with self.__lock:
+            if tickers is None:
+                self.__snapshots.clear()
+                self.__statements.clear()
+            else:
+                for ticker in tickers:
+                    self.__snapshots.pop(ticker.upper(), None)
+                    self.__statements.pop(ticker.upper(), None)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: hybrid_pipeline_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Test of the hybrid refresh pipeline."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.drivers.mocks.market_results import MARKET_RESULTS_MOCK
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.utilities.config import RESULTS_URL, URL
+
+from .fundamentus_pipeline import FundamentusPipeline
+from .hybrid_pipeline import HybridFundamentusPipeline
+
+# The market results after MGLU3 published a new statement, moving its ROE.
+NEW_STATEMENT_RESULTS = MARKET_RESULTS_MOCK['content'].replace('<td>-8,69%</td>',
+                                                               '<td>-7,10%</td>')
+
+
+def test_refresh_patches_the_prices(requests_mock) -> None:
+    """Test a refresh only updates the price derived indicators, with one request."""
+
+    requests_mock.get(URL, text=HTML_COLLECTOR_MOCK['content'])
+    requests_mock.get(RESULTS_URL, text=MARKET_RESULTS_MOCK['content'])
+
+    crawl = FundamentusPipeline('MGLU3').get_all_information().transformed_information
+    pipeline = HybridFundamentusPipeline()
+    pipeline.load(FundamentusPipeline.get_many(['MGLU3']))
+
+    requests_mock.reset_mock()
+    result, = pipeline.refresh()
+    information = result.transform_contract.transformed_information
+
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.url == RESULTS_URL
+    assert pipeline.statistics == {'patched': 1}
+
+    assert information['price_information']['price'].value == Decimal('8.79')
+    assert information['price_information']['price'].title == \
+        crawl['price_information']['price'].title
+    assert information['valuation_indicators']['price_divided_by_asset_value'].value == \
+        Decimal('1.07')
+    assert information['balance_sheet'] == crawl['balance_sheet']
+    assert information['income_statement'] == crawl['income_statement']
+
+    # The detail page of the crawl is left as it was.
+    assert crawl['price_information']['price'].value == Decimal('4.56')
+
+
+def test_refresh_patches_the_date_and_valuations(requests_mock) -> None:
+    """Test a patched page dates its price to the last session, and values it."""
+
+    requests_mock.get(URL, text=HTML_COLLECTOR_MOCK['content'])
+    requests_mock.get(RESULTS_URL, text=MARKET_RESULTS_MOCK['content'])
+
+    crawl = FundamentusPipeline('MGLU3').get_all_information().transformed_information
+
+    # A Saturday: the prices are the ones of Friday.
+    saturday = datetime(2026, 3, 14, 12, tzinfo=timezone(timedelta(hours=-3)))
+    pipeline = HybridFundamentusPipeline(clock=lambda: saturday)
+    pipeline.load(FundamentusPipeline.get_many(['MGLU3']))
+
+    result, = pipeline.refresh()
+    information = result.transform_contract.transformed_information
+    summary, crawl_summary = information['financial_summary'], crawl['financial_summary']
+
+    assert information['price_information']['date'].value == '13/03/2026'
+    assert information['price_information']['date'].title == \
+        crawl['price_information']['date'].title
+
+    market_valuation = Decimal('8.79') * crawl_summary['number_of_shares'].value
+    assert summary['market_valuation'].value == market_valuation
+    assert summary['enterprise_valuation'].value == \
+        crawl_summary['enterprise_valuation'].value + market_valuation - \
+        crawl_summary['market_valuation'].value
+    assert summary['number_of_shares'] == crawl_summary['number_of_shares']
+
+
+def test_refresh_fetches_new_statements(requests_mock) -> None:
+    """Test the detail page is fetched again when the statement indicators move."""
+
+    requests_mock.get(URL, text=HTML_COLLECTOR_MOCK['content'])
+    requests_mock.get(RESULTS_URL, text=MARKET_RESULTS_MOCK['content'])
+
+    pipeline = HybridFundamentusPipeline()
+    pipeline.load(FundamentusPipeline.get_many(['MGLU3']))
+    list(pipeline.refresh())
+
+    requests_mock.get(RESULTS_URL, text=NEW_STATEMENT_RESULTS)
+    requests_mock.get(URL, text=HTML_COLLECTOR_MOCK['content'].replace('30/06/2022',
+                                                                       '30/09/2022'))
+    result, = pipeline.refresh()
+    information = result.transform_contract.transformed_information
+
+    assert information['financial_summary']['last_financial_statement'].value == '30/09/2022'
+    assert pipeline.statistics == {'patched': 1, 'new_statement': 1}
+
+    # The new statement indicators are the reference of the next refreshes.
+    list(pipeline.refresh())
+
+    assert pipeline.statistics == {'patched': 2, 'new_statement': 1}
+
+
+def test_refresh_fetches_unknown_tickers(requests_mock) -> None:
+    """Test the tickers not kept are fetched, reporting failures per ticker."""
+
+    requests_mock.get(URL, text=HTML_COLLECTOR_MOCK['content'])
+    requests_mock.get(f'{URL}?papel=XPTO3', text='Extract Exception')
+    requests_mock.get(RESULTS_URL, text=MARKET_RESULTS_MOCK['content'])
+
+    pipeline = HybridFundamentusPipeline()
+    results = {result.ticker: result for result in pipeline.refresh(['mglu3', 'XPTO3'])}
+
+    assert results['MGLU3'].error is None
+    assert isinstance(results['XPTO3'].error, ExtractException)
+    assert pipeline.statistics == {'fetched': 1}
+    assert pipeline.tickers == ['MGLU3']
+
+    pipeline.forget(['MGLU3'])
+
+    assert not pipeline.tickers
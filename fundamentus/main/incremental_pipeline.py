@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: incremental_pipeline.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""
+Python Fundamentus Incremental API
+
+This module provides a pipeline that refreshes tickers incrementally. It remembers
+the last page of each ticker and only collects and transforms a page again when its
+content changed: the request is made conditional with the ETag and Last-Modified
+validators of the previous response and, when the server ignores them, the SHA-256
+of the body is compared with the previous one.
+"""
+
+import hashlib
+import threading
+from collections import Counter
+from datetime import datetime as dt
+from typing import Dict, Iterable, Iterator
+
+import requests
+
+from fundamentus.cache.response_cache import ResponseCache
+from fundamentus.contracts.batch_contract import BatchContract
+from fundamentus.contracts.extract_contract import ExtractContract
+from fundamentus.contracts.refresh_contract import RefreshContract
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.html_collector import HtmlCollector
+from fundamentus.drivers.http_requester import HttpRequester
+from fundamentus.drivers.http_session import get_shared_session
+from fundamentus.drivers.interfaces.html_collector import \
+    HtmlCollectorInterface
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.main.batch_processing import process_batch
+from fundamentus.main.batch_results import BatchResults
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation as Transformer
+
+from fundamentus.utilities.config import URL, INTERFACE, MAX_WORKERS
+
+
+class IncrementalFundamentusPipeline:
+    """
+    A pipeline that only re-collects and re-transforms the tickers whose page changed.
+
+    The state of each ticker is kept in memory, so the same pipeline object should
+    be reused between refreshes.
+
+    Attributes:
+        url (str): The base URL for the HTTP requests.
+        interface (str): The interface for the HTTP requests.
+        collector (HtmlCollectorInterface): The collector of the HTML information.
+        session (requests.Session): The session used for the HTTP requests.
+        statistics (Counter): How many refreshes were answered with 'not_modified',
+                              'unchanged' or 'changed' pages.
+
+    Methods:
+        get_all_information: Returns the financial information of a company.
+        get_many: Refreshes the financial information of many companies concurrently.
+        forget: Drops the state of the given tickers, or of every ticker.
+    """
+
+    def __init__(self,
+                 url: str = URL,
+                 interface: str = INTERFACE,
+                 collector: HtmlCollectorInterface = None,
+                 session: requests.Session = None) -> None:
+        """Initializes the IncrementalFundamentusPipeline object.
+
+        Args:
+            url (str): The base URL for the HTTP requests.
+            interface (str): The interface for the HTTP requests.
+            collector (HtmlCollectorInterface): The collector of the HTML information.
+                                                Defaults to the HtmlCollector.
+            session (requests.Session): The session used for the HTTP requests.
+                                        Defaults to the shared session. The responses are
+                                        never cached, as the pipeline validates the pages itself.
+        """
+
+        self.__url = url
+        self.__interface = interface
+        self.__collector = collector or HtmlCollector()
+        self.__session = session or get_shared_session()
+        self.__cache = ResponseCache(None)
+        self.__transformer = Transformer()
+
+        self.__contracts: Dict[str, RefreshContract] = {}
+        self.__lock = threading.Lock()
+        self.statistics = Counter()
+
+    @staticmethod
+    def __conditional_headers(previous: RefreshContract) -> Dict[str, str]:
+        """Builds the conditional headers from the validators of the previous page.
+
+        Args:
+            previous (RefreshContract): The previous version of the page, if any.
+
+        Returns:
+            Dict[str, str]: The conditional headers.
+        """
+
+        headers = {}
+
+        if previous is not None and previous.etag:
+            headers['If-None-Match'] = previous.etag
+        if previous is not None and previous.last_modified:
+            headers['If-Modified-Since'] = previous.last_modified
+
+        return headers
+
+    def __count(self, outcome: str) -> None:
+        """Counts the outcome of a refresh.
+
+        Args:
+            outcome (str): The outcome of the refresh.
+        """
+
+        with self.__lock:
+            self.statistics[outcome] += 1
+
+    def get_all_information(self, ticker: str) -> TransformContract:
+        """Retrieves the financial information of a company, reusing it if unchanged.
+
+        Args:
+            ticker (str): The ticker symbol of the company.
+
+        Returns:
+            TransformContract: A contract containing the transformed financial data.
+
+        Raises:
+            ExtractException: If the request or the collection of the page fails.
+            TransformException: If the transformation of the page fails.
+        """
+
+        with self.__lock:
+            previous = self.__contracts.get(ticker)
+
+        try:
+            requester = HttpRequester(url=self.__url,
+                                      params={'papel': ticker, 'interface': self.__interface},
+                                      session=self.__session,
+                                      headers=self.__conditional_headers(previous),
+                                      cache=self.__cache)
+            response = requester.make_request().response
+        except Exception as exception:
+            raise ExtractException(exception) from exception
+
+        if previous is not None and response.status_code == 304:
+            self.__count('not_modified')
+            return previous.transform_contract
+
+        sha256 = hashlib.sha256(response.content).hexdigest()
+
+        if previous is not None and previous.sha256 == sha256:
+            self.__count('unchanged')
+            transform_contract = previous.transform_contract
+        else:
+            try:
+                raw_information = self.__collector.collect_all_information(response.text)
+            except Exception as exception:
+                raise ExtractException(exception) from exception
+
+            extract_contract = ExtractContract(raw_information=raw_information,
+                                               extraction_date=dt.today().toordinal())
+            transform_contract = self.__transformer.transform_all_information(extract_contract)
+            self.__count('changed')
+
+        with self.__lock:
+            self.__contracts[ticker] = RefreshContract(
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                sha256=sha256,
+                transform_contract=transform_contract)
+
+        return transform_contract
+
+    def get_many(self, tickers: Iterable[str], max_workers: int = MAX_WORKERS) -> BatchResults:
+        """Refreshes the financial information of many companies concurrently.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols of the companies.
+            max_workers (int): The number of threads used for the HTTP requests.
+
+        Returns:
+            BatchResults: The results of the batch, yielding a BatchContract per ticker.
+        """
+
+        return BatchResults(self.__process_many(tickers, max_workers))
+
+    def __process_many(self, tickers: Iterable[str], max_workers: int) -> Iterator[BatchContract]:
+        """Refreshes the tickers of get_many, yielding each one as it completes.
+
+        Only a window of about twice `max_workers` tickers is in flight at a time.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols of the companies.
+            max_workers (int): The number of threads used for the HTTP requests.
+
+        Yields:
+            BatchContract: A contract with the ticker and either its transformed
+                           financial data or the error raised while processing it.
+        """
+
+        for _, contract in process_batch(self.get_all_information, tickers, max_workers):
+            yield contract
+
+    def forget(self, tickers: Iterable[str] = None) -> None:
+        """Drops the state of the given tickers, so they are fully refreshed next time.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols to forget. Defaults to every ticker.
+        """
+
+        with self.__lock:
+            if tickers is None:
+                self.__contracts.clear()
+            else:
+                for ticker in tickers:
+                    self.__contracts.pop(ticker, None)
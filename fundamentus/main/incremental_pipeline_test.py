@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: incremental_pipeline_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Test of the incremental pipeline."""
+
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.utilities.config import URL
+
+from .incremental_pipeline import IncrementalFundamentusPipeline
+
+# A page with the same information, but a different content.
+CHANGED_PAGE = HTML_COLLECTOR_MOCK['content'] + '<!-- changed -->'
+
+
+def test_refresh_skips_unchanged_pages(requests_mock) -> None:
+    """Test an unchanged page is not collected again."""
+
+    pipeline = IncrementalFundamentusPipeline()
+
+    requests_mock.get(URL, text=HTML_COLLECTOR_MOCK['content'])
+    first = pipeline.get_all_information('MGLU3')
+    second = pipeline.get_all_information('MGLU3')
+
+    requests_mock.get(URL, text=CHANGED_PAGE)
+    third = pipeline.get_all_information('MGLU3')
+
+    assert isinstance(first, TransformContract)
+    assert second is first
+    assert third is not first and third == first
+    assert pipeline.statistics == {'changed': 2, 'unchanged': 1}
+
+
+def test_refresh_uses_conditional_requests(requests_mock) -> None:
+    """Test the validators of the previous response are sent back."""
+
+    pipeline = IncrementalFundamentusPipeline()
+
+    requests_mock.get(URL, text=HTML_COLLECTOR_MOCK['content'], headers={'ETag': '"v1"'})
+    first = pipeline.get_all_information('MGLU3')
+
+    requests_mock.get(URL, status_code=304, text='')
+    second = pipeline.get_all_information('MGLU3')
+
+    assert requests_mock.last_request.headers['If-None-Match'] == '"v1"'
+    assert second is first
+    assert pipeline.statistics == {'changed': 1, 'not_modified': 1}
+
+
+def test_get_many(requests_mock) -> None:
+    """Test refreshing many tickers, reporting failures per ticker."""
+
+    pipeline = IncrementalFundamentusPipeline()
+
+    requests_mock.get(URL, text=HTML_COLLECTOR_MOCK['content'])
+    requests_mock.get(f'{URL}?papel=XPTO3', text='Extract Exception')
+
+    results = {result.ticker: result for result in pipeline.get_many(['MGLU3', 'XPTO3'])}
+    list(pipeline.get_many(['MGLU3']))
+
+    assert isinstance(results['MGLU3'].transform_contract, TransformContract)
+    assert isinstance(results['XPTO3'].error, ExtractException)
+    assert pipeline.statistics == {'changed': 1, 'unchanged': 1}
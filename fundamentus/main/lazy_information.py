@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: lazy_information.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""
+Python Fundamentus Lazy Information
+
+This module provides the transformed information of a stock detail page whose
+sections are collected and transformed only when first accessed. The page is parsed
+once, up front; reading a single section, e.g. the price, skips the collection and
+the transformation of the balance sheet, the income statement and the rest.
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+from fundamentus.drivers.interfaces.html_collector import \
+    HtmlCollectorInterface
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.metrics.instrumentation import timed
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation as Transformer
+from fundamentus.utilities.sections import SECTIONS
+
+
+class LazyInformation(Mapping):
+    """
+    The transformed information of a stock, built section by section on first access.
+
+    It is a read-only mapping with the same keys as the transformed information of
+    `FundamentusPipeline.get_all_information`. Each section is built once, and the
+    parsed page is released when every section is built. It can be shared between
+    threads. Pickling it builds the missing sections and stores a plain dict.
+
+    Attributes:
+        built_sections (Tuple[str, ...]): The sections already collected and transformed.
+    """
+
+    def __init__(self,
+                 document: Any,
+                 collector: HtmlCollectorInterface,
+                 sections: Iterable[str],
+                 transformer: Transformer = None) -> None:
+        """Initializes the LazyInformation object.
+
+        Args:
+            document (Any): The page parsed by `collector.parse_document`.
+            collector (HtmlCollectorInterface): The collector that parsed the page.
+            sections (Iterable[str]): The sections that can be accessed.
+            transformer (Transformer): The transformer of the sections.
+                                       Defaults to a new TransformRawInformation.
+        """
+
+        self.__document = document
+        self.__collector = collector
+        self.__sections = tuple(sections)
+        self.__transformer = transformer or Transformer()
+
+        self.__values: Dict[str, Any] = {}
+        self.__lock = threading.Lock()
+
+    def __build(self, section: str) -> Any:
+        """Collects and transforms a section of the page.
+
+        Args:
+            section (str): The name of the section.
+
+        Returns:
+            Any: The transformed section.
+
+        Raises:
+            ExtractException: If the collection of the section fails.
+            TransformException: If the transformation of the section fails.
+        """
+
+        try:
+            with timed('collect'):
+                raw_section = self.__collector.collect_section(self.__document,
+                                                               SECTIONS[section])
+        except Exception as exception:
+            raise ExtractException(exception) from exception
+
+        return self.__transformer.transform_section(section, raw_section)
+
+    def __getitem__(self, section: str) -> Any:
+        """Returns a section, building it on first access.
+
+        Args:
+            section (str): The name of the section, e.g. 'price_information'.
+
+        Returns:
+            Any: The transformed section.
+
+        Raises:
+            KeyError: If the section is unknown or was not selected.
+        """
+
+        if section not in self.__sections:
+            raise KeyError(section)
+
+        with self.__lock:
+            if section not in self.__values:
+                self.__values[section] = self.__build(section)
+
+                # Every section is built: the parsed page is no longer needed.
+                if len(self.__values) == len(self.__sections):
+                    self.__document = None
+
+            return self.__values[section]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the names of the sections, without building them."""
+
+        return iter(self.__sections)
+
+    def __len__(self) -> int:
+        """Returns the number of sections."""
+
+        return len(self.__sections)
+
+    def __contains__(self, section: object) -> bool:
+        """Checks a section is available, without building it."""
+
+        return section in self.__sections
+
+    @property
+    def built_sections(self) -> Tuple[str, ...]:
+        """The sections already collected and transformed, in the order of the page."""
+
+        with self.__lock:
+            return tuple(section for section in self.__sections if section in self.__values)
+
+    def __reduce__(self):
+        """Pickles the information as a plain dict, building the missing sections."""
+
+        return dict, (dict(self.items()),)
+
+    def __repr__(self) -> str:
+        return f'LazyInformation(sections={self.__sections!r}, built={self.built_sections!r})'
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: lazy_information_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Test the LazyInformation."""
+
+import pickle
+
+import pytest
+
+from fundamentus.contracts.extract_contract import ExtractContract
+from fundamentus.drivers.html_collector import HtmlCollector
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.stages.transformation.transform_raw_information import \
+    TransformRawInformation
+from fundamentus.utilities.sections import SECTIONS
+
+from .lazy_information import LazyInformation
+
+
+class CountingHtmlCollector(HtmlCollector):
+    """A HtmlCollector counting the sections it collects."""
+
+    def __init__(self) -> None:
+        self.collected = []
+
+    def collect_section(self, document, section):
+        self.collected.append(section)
+
+        return super().collect_section(document, section)
+
+
+def build_lazy_information(sections=tuple(SECTIONS)):
+    """Parse the mocked page and wrap it in a LazyInformation."""
+
+    collector = CountingHtmlCollector()
+    document = collector.parse_document(HTML_COLLECTOR_MOCK['content'])
+
+    return LazyInformation(document, collector, sections), collector
+
+
+def test_sections_are_built_on_first_access() -> None:
+    """Test only the accessed sections are collected, and only once."""
+
+    information, collector = build_lazy_information()
+
+    assert list(information) == list(SECTIONS)
+    assert information.built_sections == ()
+
+    price_information = information['price_information']
+
+    assert information['price_information'] is price_information
+    assert collector.collected == ['price']
+    assert information.built_sections == ('price_information',)
+
+
+def test_sections_match_the_eager_transformation() -> None:
+    """Test the lazy sections are the same as the transformation of the whole page."""
+
+    raw_information = HtmlCollector().collect_all_information(HTML_COLLECTOR_MOCK['content'])
+    expected = TransformRawInformation().transform_all_information(
+        ExtractContract(raw_information=raw_information, extraction_date=0))
+
+    information, _ = build_lazy_information()
+
+    assert dict(information) == expected.transformed_information
+
+
+def test_unselected_section() -> None:
+    """Test a section that was not selected is missing."""
+
+    information, _ = build_lazy_information(('price_information',))
+
+    assert 'balance_sheet' not in information
+    assert information.get('balance_sheet') is None
+    with pytest.raises(KeyError):
+        information['balance_sheet']  # pylint: disable=pointless-statement
+
+
+def test_pickle_builds_a_dict() -> None:
+    """Test pickling builds the missing sections into a plain dict."""
+
+    information, _ = build_lazy_information(('price_information', 'oscillations'))
+
+    restored = pickle.loads(pickle.dumps(information))
+
+    assert isinstance(restored, dict)
+    assert list(restored) == ['price_information', 'oscillations']
+    assert restored == dict(information)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: listing_crawler.py
+#  Version: 0.0.4
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""
+Python Fundamentus Listing Crawler
+
+This module fetches the detail page of every company of the listing, following the
+link of each item. The pages are fetched concurrently, in
+order of priority and under a rate limit, and the outcome of each ticker is recorded
+on disk as soon as it completes: running the crawl again after a crash skips the
+tickers already done.
+
+The property funds are not crawled: their detail page has its own layout, which
+the collector of the stock pages does not parse.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Union
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+from fundamentus.cache.parsed_result_cache import ParsedResultCache
+from fundamentus.contracts.batch_contract import BatchContract
+from fundamentus.contracts.crawl_target_contract import CrawlTarget
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.adaptive_rate_limiter import AdaptiveRateLimiter
+from fundamentus.drivers.crawl_progress import CrawlProgress
+from fundamentus.drivers.http_requester import HttpRequester
+from fundamentus.drivers.interfaces.html_collector import \
+    HtmlCollectorInterface
+from fundamentus.drivers.interfaces.rate_limiter import RateLimiterInterface
+from fundamentus.main.batch_processing import process_batch
+from fundamentus.main.batch_results import BatchResults
+from fundamentus.main.fundamentus_pipeline import FundamentusPipeline
+
+from fundamentus.utilities.config import INTERFACE, MAX_WORKERS
+
+# A listing of companies, as returned by list_all_companies or list_all_listings.
+Listing = Union[TransformContract, Iterable[Dict[str, str]]]
+
+
+class ListingCrawler:
+    """
+    A crawl of the detail pages of the companies listing.
+
+    The fetched pages go through the response cache shared by the pipelines, so the
+    crawl also warms it up for the next `FundamentusPipeline(ticker)` lookups.
+
+    Attributes:
+        progress (CrawlProgress): The outcome of each ticker, persisted to disk.
+
+    Methods:
+        targets: Builds the targets of a crawl from the listings.
+        crawl: Fetches the detail pages of the listings not done yet.
+    """
+
+    def __init__(self,
+                 progress_path: str,
+                 max_workers: int = MAX_WORKERS,
+                 rate_limiter: RateLimiterInterface = None,
+                 interface: str = INTERFACE,
+                 collector: HtmlCollectorInterface = None,
+                 parsed_cache: ParsedResultCache = None,
+                 priority: Callable[[CrawlTarget], Any] = None,
+                 retry_failed: bool = True) -> None:
+        """Initializes the ListingCrawler object.
+
+        Args:
+            progress_path (str): The path of the SQLite file recording the progress.
+                                 Reuse it to resume a crawl.
+            max_workers (int): The number of threads used for the HTTP requests.
+            rate_limiter (RateLimiterInterface): The limit on the rate of the requests,
+                                                 shared by the threads. Defaults to an
+                                                 AdaptiveRateLimiter, backing off when
+                                                 the website throttles the crawl.
+            interface (str): The interface for the HTTP requests.
+            collector (HtmlCollectorInterface): The collector of the HTML information.
+                                                Defaults to the HtmlCollector.
+            parsed_cache (ParsedResultCache): The cache of the transformed pages.
+                                              Defaults to the shared in-memory cache.
+            priority (Callable[[CrawlTarget], Any]): The sort key of the targets, the
+                                                     lowest first. Defaults to the
+                                                     order listed.
+            retry_failed (bool): Whether the tickers that failed before are fetched again.
+        """
+
+        self.progress = CrawlProgress(progress_path)
+
+        self.__max_workers = max_workers
+        self.__rate_limiter = rate_limiter or AdaptiveRateLimiter(max_concurrency=max_workers)
+        self.__interface = interface
+        self.__collector = collector
+        self.__parsed_cache = parsed_cache
+        self.__priority = priority
+        self.__retry_failed = retry_failed
+
+    @staticmethod
+    def targets(companies: Listing) -> List[CrawlTarget]:
+        """Builds the targets of a crawl from the listing of companies.
+
+        A ticker listed more than once is kept only the first time.
+
+        Args:
+            companies (Listing): The listing of companies.
+
+        Returns:
+            List[CrawlTarget]: The targets, in the order listed.
+        """
+
+        if isinstance(companies, TransformContract):
+            companies = companies.transformed_information
+
+        targets = {}
+
+        for item in companies:
+            ticker = item['code'].upper()
+            targets.setdefault(ticker, CrawlTarget(ticker=ticker, kind='company',
+                                                   link=item['link']))
+
+        return list(targets.values())
+
+    def __fetch(self, target: CrawlTarget) -> TransformContract:
+        """Fetches, collects and transforms the detail page of a target.
+
+        Args:
+            target (CrawlTarget): The target.
+
+        Returns:
+            TransformContract: A contract containing the transformed financial data.
+        """
+
+        link = urlsplit(target.link)
+        url = urlunsplit((link.scheme, link.netloc, link.path, '', ''))
+        ticker = parse_qs(link.query).get('papel', [target.ticker])[0]
+
+        requester = HttpRequester(url=url,
+                                  params={'papel': ticker, 'interface': self.__interface},
+                                  rate_limiter=self.__rate_limiter)
+
+        return FundamentusPipeline(ticker,
+                                   url=url,
+                                   interface=self.__interface,
+                                   collector=self.__collector,
+                                   requester=requester,
+                                   parsed_cache=self.__parsed_cache).get_all_information()
+
+    def crawl(self, companies: Listing) -> BatchResults:
+        """Fetches the detail pages of the companies not done yet.
+
+        Args:
+            companies (Listing): The listing of companies, e.g. the result of
+                                 `FundamentusPipeline().list_all_companies()`.
+
+        Returns:
+            BatchResults: The results of the crawl, yielding a BatchContract per ticker
+                          as it completes. The tickers done before are not yielded.
+        """
+
+        skipped = self.progress.done()
+        if not self.__retry_failed:
+            skipped.update(self.progress.failed())
+
+        targets = [target for target in self.targets(companies)
+                   if target.ticker not in skipped]
+
+        if self.__priority is not None:
+            targets.sort(key=self.__priority)
+
+        return BatchResults(self.__process(targets))
+
+    def __process(self, targets: List[CrawlTarget]) -> Iterator[BatchContract]:
+        """Fetches the targets, recording and yielding each one as it completes.
+
+        Only a bounded window of targets is submitted at a time, so the targets are
+        started in order of priority.
+
+        Args:
+            targets (List[CrawlTarget]): The targets, in order of priority.
+
+        Yields:
+            BatchContract: A contract with the ticker and either its transformed
+                           financial data or the error raised while processing it.
+        """
+
+        for target, contract in process_batch(self.__fetch, targets, self.__max_workers,
+                                              ticker=lambda target: target.ticker):
+            self.progress.record(target.ticker, target.kind, contract.error)
+            yield contract
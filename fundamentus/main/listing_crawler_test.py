@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: listing_crawler_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Test the ListingCrawler."""
+
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.mocks.companies_list import COMPANIES_LIST_MOCK
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.drivers.token_bucket_rate_limiter import TokenBucketRateLimiter
+from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.utilities.config import URL
+
+from .fundamentus_pipeline import FundamentusPipeline
+from .listing_crawler import ListingCrawler
+
+COMPANIES = TransformContract(transformed_information=[
+    {'code': 'MGLU3', 'name': 'MAGAZINE LUIZA', 'corporate_name': 'MAGAZINE LUIZA S.A.',
+     'link': f'{URL}?papel=MGLU3'},
+    {'code': 'WEGE3', 'name': 'WEG', 'corporate_name': 'WEG S.A.',
+     'link': f'{URL}?papel=WEGE3'},
+    {'code': 'XPTO3', 'name': 'XPTO', 'corporate_name': 'XPTO S.A.',
+     'link': f'{URL}?papel=XPTO3'},
+    # Listed twice: crawled only once.
+    {'code': 'WEGE3', 'name': 'WEG', 'corporate_name': 'WEG S.A.',
+     'link': f'{URL}?papel=WEGE3'},
+])
+
+
+def test_targets() -> None:
+    """Test the targets are built from the listing, without duplicates."""
+
+    targets = ListingCrawler.targets(COMPANIES)
+
+    assert [(target.ticker, target.kind) for target in targets] == [
+        ('MGLU3', 'company'), ('WEGE3', 'company'), ('XPTO3', 'company')]
+
+
+def test_crawl_resumes_where_it_stopped(requests_mock, tmp_path) -> None:
+    """Test a second crawl only fetches the tickers not done by the first one."""
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+    requests_mock.get(f'{URL}?papel=XPTO3', text='Extract Exception')
+
+    progress_path = str(tmp_path / 'crawl.sqlite')
+
+    crawler = ListingCrawler(progress_path, max_workers=2)
+    results = crawler.crawl(COMPANIES)
+    contracts = {contract.ticker: contract for contract in results}
+
+    assert sorted(contracts) == ['MGLU3', 'WEGE3', 'XPTO3']
+    assert isinstance(results.errors['XPTO3'], ExtractException)
+    assert crawler.progress.counts() == {'done': 2, 'failed': 1}
+
+    # Only the failed ticker is fetched again, unless failures are skipped too.
+    resumed = ListingCrawler(progress_path, max_workers=2)
+
+    assert [contract.ticker for contract in resumed.crawl(COMPANIES)] == ['XPTO3']
+    assert not list(ListingCrawler(progress_path, retry_failed=False).crawl(COMPANIES))
+
+
+def test_crawl_skips_property_funds(requests_mock, tmp_path) -> None:
+    """Test the property funds of the listings page are not crawled."""
+
+    requests_mock.get(URL,
+                      status_code=COMPANIES_LIST_MOCK['status_code'],
+                      text=COMPANIES_LIST_MOCK['content'])
+    companies, property_funds = FundamentusPipeline().list_all_listings()
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    crawler = ListingCrawler(str(tmp_path / 'crawl.sqlite'),
+                             max_workers=4,
+                             rate_limiter=TokenBucketRateLimiter(rate=1000, capacity=100))
+    crawled = {contract.ticker for contract in crawler.crawl(companies)}
+
+    requested = {request.qs['papel'][0].upper() for request in requests_mock.request_history
+                 if 'papel' in request.qs}
+    funds = {fund['code'] for fund in property_funds.transformed_information}
+
+    assert crawled == {company['code'] for company in companies.transformed_information}
+    assert 'ABCP11' in funds
+    assert not crawled & funds
+    assert not requested & funds
+
+
+def test_crawl_in_order_of_priority(requests_mock, tmp_path) -> None:
+    """Test the targets are crawled in order of priority."""
+
+    requests_mock.get(URL,
+                      status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    crawler = ListingCrawler(str(tmp_path / 'crawl.sqlite'),
+                             max_workers=1,
+                             priority=lambda target: target.ticker)
+
+    assert [contract.ticker for contract in crawler.crawl(COMPANIES)] == [
+        'MGLU3', 'WEGE3', 'XPTO3']
+
+    crawler = ListingCrawler(str(tmp_path / 'other.sqlite'),
+                             max_workers=1,
+                             priority=lambda target: target.ticker != 'WEGE3')
+
+    assert [contract.ticker for contract in crawler.crawl(COMPANIES)] == [
+        'WEGE3', 'MGLU3', 'XPTO3']
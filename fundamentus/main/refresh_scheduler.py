@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: refresh_scheduler.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""
+Python Fundamentus Refresh Scheduler
+
+This module runs a refresh in a background thread right after each trading session
+of B3, once its closing prices are published. Used with `prewarm`, it fills the
+response cache with the pages of the day: they are then kept until the next session
+opens, so nothing is requested while the market is closed and the reads of the next
+morning are answered from the cache.
+"""
+
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Iterable, List, Optional
+
+from fundamentus.contracts.batch_contract import BatchContract
+from fundamentus.drivers.interfaces.rate_limiter import RateLimiterInterface
+from fundamentus.main.fundamentus_pipeline import FundamentusPipeline
+from fundamentus.utilities.config import MAX_WORKERS
+from fundamentus.utilities.trading_calendar import TradingCalendar
+
+# Maximum seconds waited at once, so a stop is noticed.
+_MAX_WAIT = 60.0
+
+
+def prewarm(tickers: Iterable[str],
+            max_workers: int = MAX_WORKERS,
+            rate_limiter: RateLimiterInterface = None,
+            market_snapshot: bool = True) -> List[BatchContract]:
+    """Requests the pages of the day, for the caches to keep them until the next session.
+
+    Args:
+        tickers (Iterable[str]): The ticker symbols whose detail page is requested.
+        max_workers (int): The number of threads used for the HTTP requests.
+        rate_limiter (RateLimiterInterface): An optional limit on the rate of the requests.
+        market_snapshot (bool): Whether the market results are requested too.
+
+    Returns:
+        List[BatchContract]: The contracts of the tickers that failed.
+
+    Raises:
+        ExtractException: If the request or the collection of the market results fails.
+        TransformException: If the transformation of the market results fails.
+    """
+
+    if market_snapshot:
+        FundamentusPipeline(rate_limiter=rate_limiter).get_market_snapshot()
+
+    return [contract
+            for contract in FundamentusPipeline.get_many(tickers,
+                                                         max_workers=max_workers,
+                                                         rate_limiter=rate_limiter)
+            if contract.error is not None]
+
+
+class RefreshScheduler:
+    """
+    A background thread running a refresh after each trading session of B3.
+
+    Attributes:
+        statistics (Counter): How many refreshes were run, in 'runs', and how many
+                              of them raised, in 'failures'.
+        last_error (Exception): The error raised by the last failed refresh, if any.
+
+    Methods:
+        next_run: Returns when the next refresh runs.
+        start: Starts the background thread.
+        stop: Stops the background thread.
+    """
+
+    def __init__(self,
+                 refresh: Callable[[], Any],
+                 calendar: TradingCalendar = None,
+                 clock: Callable[[], datetime] = None) -> None:
+        """Initializes the RefreshScheduler object.
+
+        Args:
+            refresh (Callable[[], Any]): The refresh, e.g.
+                                         `lambda: prewarm(['WEGE3', 'PETR4'])`.
+            calendar (TradingCalendar): The trading sessions. Defaults to the
+                                        sessions of B3.
+            clock (Callable[[], datetime]): Returns the current time. Defaults to
+                                            the clock of the calendar.
+        """
+
+        self.__refresh = refresh
+        self.__calendar = calendar or TradingCalendar()
+        self.__clock = clock or self.__calendar.now
+
+        self.__stopped = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.statistics = Counter()
+        self.last_error: Optional[Exception] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is running."""
+
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def next_run(self) -> datetime:
+        """Returns when the next refresh runs.
+
+        Returns:
+            datetime: When the closing prices of the next session are published.
+        """
+
+        return self.__calendar.next_settle(self.__clock())
+
+    def __wait_until(self, run_at: datetime) -> bool:
+        """Waits until a refresh is due, or the scheduler is stopped.
+
+        Args:
+            run_at (datetime): When the refresh is due.
+
+        Returns:
+            bool: Whether the scheduler was stopped.
+        """
+
+        deadline = time.monotonic() + (run_at - self.__clock()).total_seconds()
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return self.__stopped.is_set()
+
+            if self.__stopped.wait(min(remaining, _MAX_WAIT)):
+                return True
+
+    def __run(self) -> None:
+        """Runs the refresh after each session, until the scheduler is stopped."""
+
+        run_at = self.next_run()
+
+        while not self.__wait_until(run_at):
+            try:
+                self.__refresh()
+            except Exception as exception:  # pylint: disable=broad-except
+                self.last_error = exception
+                self.statistics['failures'] += 1
+            finally:
+                self.statistics['runs'] += 1
+
+            run_at = self.__calendar.next_settle(run_at)
+
+    def start(self) -> None:
+        """Starts the background thread, if not running.
+
+        The thread is a daemon, so it does not keep the process alive.
+        """
+
+        if self.running:
+            return
+
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.__run,
+                                         name='fundamentus-refresh-scheduler',
+                                         daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        """Stops the background thread, waiting for a refresh in progress.
+
+        Args:
+            timeout (float): Maximum seconds waited for the thread to end.
+        """
+
+        self.__stopped.set()
+
+        if self.__thread is not None:
+            self.__thread.join(timeout)
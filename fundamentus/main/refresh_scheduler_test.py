@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: refresh_scheduler_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Test of the refresh scheduler."""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.drivers.mocks.market_results import MARKET_RESULTS_MOCK
+from fundamentus.utilities.config import RESULTS_URL, URL
+from fundamentus.utilities.trading_calendar import TradingCalendar
+
+from .refresh_scheduler import RefreshScheduler, prewarm
+
+# A Friday, in the time zone of B3.
+FRIDAY = datetime(2026, 3, 13, tzinfo=timezone(timedelta(hours=-3)))
+
+# The moment the closing prices of that Friday are published.
+SETTLE = FRIDAY.replace(hour=17, minute=30)
+
+
+def test_next_run() -> None:
+    """Test the refresh runs once the closing prices are published."""
+
+    scheduler = RefreshScheduler(print, clock=lambda: FRIDAY.replace(hour=12))
+    assert scheduler.next_run() == SETTLE
+
+    scheduler = RefreshScheduler(print, clock=lambda: SETTLE)
+    assert scheduler.next_run() == SETTLE + timedelta(days=3)
+
+    calendar = TradingCalendar(holidays=[(SETTLE + timedelta(days=3)).date()])
+    scheduler = RefreshScheduler(print, calendar=calendar, clock=lambda: SETTLE)
+    assert scheduler.next_run() == SETTLE + timedelta(days=4)
+
+
+def test_runs_after_the_close() -> None:
+    """Test the refresh runs in the background at the next settle, until stopped."""
+
+    refreshed = threading.Event()
+
+    scheduler = RefreshScheduler(refreshed.set,
+                                 clock=lambda: SETTLE - timedelta(seconds=0.05))
+    scheduler.start()
+
+    try:
+        assert scheduler.running
+        assert refreshed.wait(5)
+    finally:
+        scheduler.stop(timeout=5)
+
+    assert not scheduler.running
+    assert scheduler.statistics == {'runs': 1}
+
+
+def test_failed_refresh() -> None:
+    """Test a failed refresh is recorded and does not stop the scheduler."""
+
+    refreshed = threading.Event()
+
+    def refresh() -> None:
+        refreshed.set()
+        raise ConnectionError('Fundamentus is down.')
+
+    scheduler = RefreshScheduler(refresh, clock=lambda: SETTLE - timedelta(seconds=0.05))
+    scheduler.start()
+
+    try:
+        assert refreshed.wait(5)
+    finally:
+        scheduler.stop(timeout=5)
+
+    assert scheduler.statistics == {'runs': 1, 'failures': 1}
+    assert isinstance(scheduler.last_error, ConnectionError)
+
+
+def test_prewarm(requests_mock) -> None:
+    """Test prewarm returns the tickers whose detail page failed."""
+
+    requests_mock.get(URL, text=HTML_COLLECTOR_MOCK['content'])
+    requests_mock.get(f'{URL}?papel=XPTO3', status_code=404)
+    requests_mock.get(RESULTS_URL, text=MARKET_RESULTS_MOCK['content'])
+
+    failures = prewarm(['MGLU3', 'XPTO3'], max_workers=2)
+
+    assert [contract.ticker for contract in failures] == ['XPTO3']
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: callback_recorder.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Callback Recorder - Forwards the timings and counters of the pipeline to callbacks."""
+
+from typing import Callable
+
+from fundamentus.drivers.interfaces.metrics_recorder import \
+    MetricsRecorderInterface
+
+
+class CallbackRecorder(MetricsRecorderInterface):
+    """Represents a recorder calling the given functions on every event.
+
+    The callbacks run on the thread of the instrumented code, so they should be fast.
+    """
+
+    def __init__(self, on_observe: Callable[[str, float], None] = None,
+                 on_increment: Callable[[str, float], None] = None,
+                 on_gauge: Callable[[str, float], None] = None) -> None:
+        """Initialize the class.
+
+        :param on_observe: Callable[[str, float], None]: Called with the stage and
+                           its duration in seconds.
+        :param on_increment: Callable[[str, float], None]: Called with the counter
+                             and the amount added.
+        :param on_gauge: Callable[[str, float], None]: Called with the gauge and
+                         its current value.
+        """
+
+        self.__on_observe = on_observe
+        self.__on_increment = on_increment
+        self.__on_gauge = on_gauge
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record the duration of a stage.
+
+        :param stage: str: Name of the stage.
+        :param seconds: float: Duration of the stage.
+        """
+
+        if self.__on_observe is not None:
+            self.__on_observe(stage, seconds)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Increment a counter.
+
+        :param name: str: Name of the counter.
+        :param value: float: Amount added to the counter.
+        """
+
+        if self.__on_increment is not None:
+            self.__on_increment(name, value)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set the current value of a gauge.
+
+        :param name: str: Name of the gauge.
+        :param value: float: Current value of the gauge.
+        """
+
+        if self.__on_gauge is not None:
+            self.__on_gauge(name, value)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: instrumentation.py
+#  Version: 0.0.3
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Instrumentation.
+
+This module times the stages of the pipeline and counts its events, reporting them
+to the recorder set with set_recorder. No recorder is set by default, and the
+instrumentation then costs a single global lookup per call.
+
+Stages, observed in seconds:
+
+    pipeline                 A whole get_all_information, list_all_companies or
+                             list_all_property_funds.
+    fetch                    Getting the HTML of a page, cached or not.
+    response_cache_lookup    Looking the response up in the response cache.
+    request                  Sending the request until the headers are received:
+                             DNS, TCP and TLS handshakes and the server time.
+    download                 Receiving the body of the response.
+    collect                  Collecting the raw information from the HTML.
+    parse                    Building the document, a part of collect. The rest of
+                             collect is the field extraction.
+    transform                Cleaning the raw information and converting its numbers.
+
+Counters:
+
+    bytes_downloaded         Bytes of the bodies received from the network.
+    response_cache_hit       Responses served by the response cache.
+    response_cache_miss      Responses requested to the network.
+    parsed_cache_hit         Pages served by the parsed result cache.
+    parsed_cache_miss        Pages collected and transformed.
+    section_cache_hit        Sections served by the section cache.
+    section_cache_miss       Sections missing or expired in the section cache.
+    rate_limit_backoff       Times the adaptive rate limiter backed off.
+
+Gauges:
+
+    rate_limit               Requests per second allowed by the adaptive rate limiter.
+    concurrency_limit        Requests in flight allowed by the adaptive rate limiter.
+"""
+
+import functools
+import time
+from typing import Callable, Optional, TypeVar
+
+from fundamentus.drivers.interfaces.metrics_recorder import \
+    MetricsRecorderInterface
+
+F = TypeVar('F', bound=Callable)
+
+__RECORDER: Optional[MetricsRecorderInterface] = None
+
+
+def set_recorder(recorder: Optional[MetricsRecorderInterface]) -> None:
+    """Set the recorder of the instrumentation.
+
+    :param recorder: MetricsRecorderInterface: The recorder. None disables the
+                     instrumentation.
+    """
+
+    global __RECORDER  # pylint: disable=global-statement
+
+    __RECORDER = recorder
+
+
+def get_recorder() -> Optional[MetricsRecorderInterface]:
+    """Return the recorder of the instrumentation.
+
+    :return: Optional[MetricsRecorderInterface]: The recorder, None if disabled.
+    """
+
+    return __RECORDER
+
+
+def observe(stage: str, seconds: float) -> None:
+    """Record the duration of a stage, if a recorder is set.
+
+    :param stage: str: Name of the stage.
+    :param seconds: float: Duration of the stage.
+    """
+
+    recorder = __RECORDER
+    if recorder is not None:
+        recorder.observe(stage, seconds)
+
+
+def increment(name: str, value: float = 1) -> None:
+    """Increment a counter, if a recorder is set.
+
+    :param name: str: Name of the counter.
+    :param value: float: Amount added to the counter.
+    """
+
+    recorder = __RECORDER
+    if recorder is not None:
+        recorder.increment(name, value)
+
+
+def set_gauge(name: str, value: float) -> None:
+    """Set the current value of a gauge, if a recorder is set.
+
+    :param name: str: Name of the gauge.
+    :param value: float: Current value of the gauge.
+    """
+
+    recorder = __RECORDER
+    if recorder is not None:
+        recorder.set_gauge(name, value)
+
+
+class _Timer:
+    """Times a block of code and reports it to the recorder."""
+
+    __slots__ = ('__recorder', '__stage', '__started')
+
+    def __init__(self, recorder: MetricsRecorderInterface, stage: str) -> None:
+        self.__recorder = recorder
+        self.__stage = stage
+        self.__started = 0.0
+
+    def __enter__(self) -> '_Timer':
+        self.__started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.__recorder.observe(self.__stage, time.perf_counter() - self.__started)
+
+
+class _NullTimer:
+    """Does nothing, used while the instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullTimer':
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        pass
+
+
+__NULL_TIMER = _NullTimer()
+
+
+def timed(stage: str):
+    """Time a block of code as the given stage.
+
+        with timed('parse'):
+            soup = bs(html, 'html.parser')
+
+    :param stage: str: Name of the stage.
+    :return: A context manager timing the block.
+    """
+
+    recorder = __RECORDER
+    if recorder is None:
+        return __NULL_TIMER
+
+    return _Timer(recorder, stage)
+
+
+def instrumented(stage: str) -> Callable[[F], F]:
+    """Time every call of the decorated function as the given stage.
+
+    :param stage: str: Name of the stage.
+    :return: Callable[[F], F]: The decorator.
+    """
+
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            recorder = __RECORDER
+            if recorder is None:
+                return function(*args, **kwargs)
+
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                recorder.observe(stage, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
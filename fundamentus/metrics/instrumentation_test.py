@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: instrumentation_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Instrumentation Test."""
+
+from collections import Counter
+
+import pytest
+
+from fundamentus.cache.memory_cache_backend import MemoryCacheBackend
+from fundamentus.cache.parsed_result_cache import ParsedResultCache
+from fundamentus.cache.response_cache import ResponseCache
+from fundamentus.drivers.http_requester import HttpRequester
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.main.fundamentus_pipeline import FundamentusPipeline
+from fundamentus.utilities.config import URL
+
+from .callback_recorder import CallbackRecorder
+from .instrumentation import get_recorder, instrumented, set_recorder, timed
+
+
+@pytest.fixture(name='events')
+def fixture_events():
+    """Record the events of the instrumentation while the test runs."""
+
+    stages, counters = Counter(), Counter()
+    set_recorder(CallbackRecorder(on_observe=lambda stage, seconds: stages.update([stage]),
+                                  on_increment=lambda name, value: counters.update({name: value})))
+    try:
+        yield stages, counters
+    finally:
+        set_recorder(None)
+
+
+def test_disabled_by_default() -> None:
+    """Test that nothing is recorded without a recorder."""
+
+    @instrumented('stage')
+    def function(value: int) -> int:
+        """Return the value."""
+
+        return value
+
+    assert get_recorder() is None
+    assert function(1) == 1
+
+    with timed('stage'):
+        pass
+
+
+def test_pipeline_stages(events, requests_mock) -> None:
+    """Test that every stage of a pipeline run is recorded.
+
+    :param requests_mock.Mocker requests_mock: Mock requests.
+    """
+
+    stages, counters = events
+    requests_mock.get(URL, status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    requester = HttpRequester(URL, {'papel': 'MGLU3'},
+                              cache=ResponseCache(MemoryCacheBackend()))
+    parsed_cache = ParsedResultCache(MemoryCacheBackend())
+
+    for _ in range(2):
+        FundamentusPipeline(requester=requester, parsed_cache=parsed_cache).get_all_information()
+
+    assert stages == {'pipeline': 2, 'fetch': 2, 'response_cache_lookup': 2,
+                      'request': 1, 'download': 1, 'collect': 1, 'parse': 1, 'transform': 1}
+    assert counters['bytes_downloaded'] == len(HTML_COLLECTOR_MOCK['content'].encode('utf-8'))
+    assert counters['response_cache_miss'] == 1
+    assert counters['response_cache_hit'] == 1
+    assert counters['parsed_cache_miss'] == 1
+    assert counters['parsed_cache_hit'] == 1
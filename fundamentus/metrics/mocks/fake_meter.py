@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: fake_meter.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""A minimal in-memory stand-in for an OpenTelemetry meter, used by the tests."""
+
+
+class FakeInstrument:
+    """Keeps every value recorded or added to the instrument."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize the class."""
+
+        self.name = name
+        self.values = []
+
+    def record(self, value: float, attributes: dict = None) -> None:
+        """Record a value of a histogram."""
+
+        self.values.append((value, attributes))
+
+    def add(self, value: float, attributes: dict = None) -> None:
+        """Add a value to a counter."""
+
+        self.values.append((value, attributes))
+
+
+class FakeMeter:
+    """Implements the subset of an OpenTelemetry meter used by the OpenTelemetryRecorder."""
+
+    def __init__(self) -> None:
+        """Initialize the class."""
+
+        self.instruments = {}
+
+    def create_histogram(self, name: str, unit: str = '', description: str = '') -> FakeInstrument:
+        """Create a histogram."""
+
+        return self.instruments.setdefault(name, FakeInstrument(name))
+
+    def create_counter(self, name: str, unit: str = '', description: str = '') -> FakeInstrument:
+        """Create a counter."""
+
+        return self.instruments.setdefault(name, FakeInstrument(name))
+
+    def create_up_down_counter(self, name: str, unit: str = '',
+                               description: str = '') -> FakeInstrument:
+        """Create an up-down counter."""
+
+        return self.instruments.setdefault(name, FakeInstrument(name))
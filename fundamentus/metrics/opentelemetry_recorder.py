@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: opentelemetry_recorder.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""OpenTelemetry Recorder - Reports the timings and counters of the pipeline to an OpenTelemetry meter."""
+
+import threading
+
+from fundamentus.drivers.interfaces.metrics_recorder import \
+    MetricsRecorderInterface
+
+
+class OpenTelemetryRecorder(MetricsRecorderInterface):
+    """Represents a recorder reporting to the instruments of an OpenTelemetry meter.
+
+    The durations are recorded on a single histogram, with the stage as attribute,
+    and each counter on its own instrument. The gauges are up-down counters, moved
+    by the difference with their previous value. Any object exposing the
+    `create_histogram`, `create_counter` and `create_up_down_counter` methods of
+    `opentelemetry.metrics.Meter` can be used.
+    """
+
+    def __init__(self, meter, namespace: str = 'fundamentus') -> None:
+        """Initialize the class.
+
+        :param meter: opentelemetry.metrics.Meter: Meter creating the instruments,
+                      e.g. `opentelemetry.metrics.get_meter('fundamentus')`.
+        :param namespace: str: Prefix of the instrument names.
+        """
+
+        self.__meter = meter
+        self.__namespace = namespace
+        self.__histogram = meter.create_histogram(f'{namespace}.stage.duration', unit='s',
+                                                  description='Duration of the stages '
+                                                              'of the pipeline.')
+        self.__counters = {}
+        self.__gauges = {}
+        self.__lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record the duration of a stage.
+
+        :param stage: str: Name of the stage.
+        :param seconds: float: Duration of the stage.
+        """
+
+        self.__histogram.record(seconds, attributes={'stage': stage})
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Increment a counter.
+
+        :param name: str: Name of the counter.
+        :param value: float: Amount added to the counter.
+        """
+
+        counter = self.__counters.get(name)
+        if counter is None:
+            with self.__lock:
+                counter = self.__counters.get(name)
+                if counter is None:
+                    counter = self.__counters[name] = self.__meter.create_counter(
+                        f'{self.__namespace}.{name}')
+
+        counter.add(value)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set the current value of a gauge.
+
+        :param name: str: Name of the gauge.
+        :param value: float: Current value of the gauge.
+        """
+
+        with self.__lock:
+            gauge = self.__gauges.get(name)
+            if gauge is None:
+                gauge = self.__gauges[name] = [self.__meter.create_up_down_counter(
+                    f'{self.__namespace}.{name}'), 0]
+
+            gauge[0].add(value - gauge[1])
+            gauge[1] = value
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: opentelemetry_recorder_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""OpenTelemetry Recorder Test."""
+
+from .mocks.fake_meter import FakeMeter
+from .opentelemetry_recorder import OpenTelemetryRecorder
+
+
+def test_record() -> None:
+    """Test that the durations and counters are reported to the meter."""
+
+    meter = FakeMeter()
+    recorder = OpenTelemetryRecorder(meter)
+
+    recorder.observe('parse', 0.01)
+    recorder.increment('parsed_cache_hit')
+    recorder.increment('parsed_cache_hit')
+
+    assert meter.instruments['fundamentus.stage.duration'].values == [
+        (0.01, {'stage': 'parse'})]
+    assert [value for value, _ in meter.instruments['fundamentus.parsed_cache_hit'].values] == [1, 1]
+
+
+def test_set_gauge() -> None:
+    """Test that a gauge moves its up-down counter by the difference of its values."""
+
+    meter = FakeMeter()
+    recorder = OpenTelemetryRecorder(meter)
+
+    recorder.set_gauge('rate_limit', 4)
+    recorder.set_gauge('rate_limit', 2.5)
+
+    assert [value for value, _ in meter.instruments['fundamentus.rate_limit'].values] == [4, -1.5]
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: prometheus_recorder.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Prometheus Recorder.
+
+Aggregates the timings and counters of the pipeline in memory and renders them in
+the Prometheus text exposition format, without depending on a client library:
+
+    fundamentus_stage_duration_seconds_bucket{stage="parse",le="0.01"} 3
+    fundamentus_stage_duration_seconds_sum{stage="parse"} 0.021
+    fundamentus_stage_duration_seconds_count{stage="parse"} 3
+    fundamentus_bytes_downloaded_total 210174
+    fundamentus_rate_limit 2.5
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Tuple
+
+from fundamentus.drivers.interfaces.metrics_recorder import \
+    MetricsRecorderInterface
+
+# Upper bounds of the duration buckets, in seconds.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Content type of the text exposition format.
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _format_number(value: float) -> str:
+    """Format a number as Prometheus does, without a trailing .0 on integers."""
+
+    return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class PrometheusRecorder(MetricsRecorderInterface):
+    """Represents a recorder exposing histograms, counters and gauges to Prometheus."""
+
+    def __init__(self, namespace: str = 'fundamentus',
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize the class.
+
+        :param namespace: str: Prefix of the metric names.
+        :param buckets: Tuple[float, ...]: Upper bounds of the duration buckets, sorted.
+        """
+
+        self.__namespace = namespace
+        self.__buckets = tuple(buckets)
+        self.__histograms: Dict[str, List] = {}
+        self.__counters: Dict[str, float] = {}
+        self.__gauges: Dict[str, float] = {}
+        self.__lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record the duration of a stage.
+
+        :param stage: str: Name of the stage.
+        :param seconds: float: Duration of the stage.
+        """
+
+        bucket = bisect.bisect_left(self.__buckets, seconds)
+
+        with self.__lock:
+            histogram = self.__histograms.get(stage)
+            if histogram is None:
+                # Counts of each bucket, plus the +Inf bucket, and the sum.
+                histogram = self.__histograms[stage] = [[0] * (len(self.__buckets) + 1), 0.0]
+
+            histogram[0][bucket] += 1
+            histogram[1] += seconds
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Increment a counter.
+
+        :param name: str: Name of the counter.
+        :param value: float: Amount added to the counter.
+        """
+
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set the current value of a gauge.
+
+        :param name: str: Name of the gauge.
+        :param value: float: Current value of the gauge.
+        """
+
+        with self.__lock:
+            self.__gauges[name] = value
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        :return: str: The metrics.
+        """
+
+        with self.__lock:
+            histograms = {stage: (list(counts), total)
+                          for stage, (counts, total) in self.__histograms.items()}
+            counters = dict(self.__counters)
+            gauges = dict(self.__gauges)
+
+        name = f'{self.__namespace}_stage_duration_seconds'
+        lines = [f'# HELP {name} Duration of the stages of the pipeline.',
+                 f'# TYPE {name} histogram']
+
+        for stage, (counts, total) in sorted(histograms.items()):
+            cumulative = 0
+            for upper_bound, count in zip(self.__buckets + (float('inf'),), counts):
+                cumulative += count
+                bound = '+Inf' if upper_bound == float('inf') else repr(upper_bound)
+                lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {_format_number(total)}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {cumulative}')
+
+        for counter, value in sorted(counters.items()):
+            counter_name = f'{self.__namespace}_{counter}_total'
+            lines.append(f'# TYPE {counter_name} counter')
+            lines.append(f'{counter_name} {_format_number(value)}')
+
+        for gauge, value in sorted(gauges.items()):
+            gauge_name = f'{self.__namespace}_{gauge}'
+            lines.append(f'# TYPE {gauge_name} gauge')
+            lines.append(f'{gauge_name} {_format_number(value)}')
+
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: prometheus_recorder_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Prometheus Recorder Test."""
+
+from .prometheus_recorder import PrometheusRecorder
+
+
+def test_render() -> None:
+    """Test the rendering of histograms and counters."""
+
+    recorder = PrometheusRecorder(buckets=(0.01, 0.1))
+    recorder.observe('parse', 0.005)
+    recorder.observe('parse', 0.05)
+    recorder.observe('parse', 1.0)
+    recorder.increment('bytes_downloaded', 1024)
+    recorder.increment('bytes_downloaded', 1024)
+
+    lines = recorder.render().splitlines()
+
+    assert '# TYPE fundamentus_stage_duration_seconds histogram' in lines
+    assert 'fundamentus_stage_duration_seconds_bucket{stage="parse",le="0.01"} 1' in lines
+    assert 'fundamentus_stage_duration_seconds_bucket{stage="parse",le="0.1"} 2' in lines
+    assert 'fundamentus_stage_duration_seconds_bucket{stage="parse",le="+Inf"} 3' in lines
+    assert 'fundamentus_stage_duration_seconds_sum{stage="parse"} 1.055' in lines
+    assert 'fundamentus_stage_duration_seconds_count{stage="parse"} 3' in lines
+    assert 'fundamentus_bytes_downloaded_total 2048' in lines
+
+
+def test_render_gauges() -> None:
+    """Test the rendering of the last value of the gauges."""
+
+    recorder = PrometheusRecorder()
+    recorder.set_gauge('rate_limit', 4)
+    recorder.set_gauge('rate_limit', 2.5)
+
+    lines = recorder.render().splitlines()
+
+    assert '# TYPE fundamentus_rate_limit gauge' in lines
+    assert 'fundamentus_rate_limit 2.5' in lines
@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: app.py
+#  Version: 0.0.4
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""
+Python Fundamentus Service
+
+This module provides an HTTP service over the FundamentusPipeline, built with
+FastAPI (`pip install pyfundamentus[service]`):
+
+    GET /stock/{symbol}           The transformed information of a stock.
+    GET /stocks?symbols=A,B,...   The transformed information of many stocks.
+    GET /stocks/stream            The transformed information of many stocks, or of
+                                  every company, as NDJSON lines sent as each completes.
+    GET /companies                The listing of the companies.
+    GET /property-funds           The listing of the real estate investment funds.
+    GET /metrics                  The timings and counters of the pipeline, in the
+                                  Prometheus text format, when enabled.
+
+The scraping runs on a thread pool, never on the event loop. The encoded bodies
+are memoized, carry an ETag answered with 304 Not Modified when it matches
+If-None-Match, are compressed with gzip and, for the listings, streamed in chunks.
+"""
+
+import asyncio
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+import requests
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.gzip import GZipMiddleware
+
+from fundamentus._version import __version__
+from fundamentus.cache.memoizer import Memoizer
+from fundamentus.contracts.response_body_contract import ResponseBodyContract
+from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.exceptions.stock_not_found_error import StockNotFoundError
+from fundamentus.main.fundamentus_pipeline import FundamentusPipeline
+from fundamentus.metrics.instrumentation import set_recorder
+from fundamentus.metrics.prometheus_recorder import CONTENT_TYPE, PrometheusRecorder
+from fundamentus.service.json_encoding import encode_body, encode_json, make_etag
+from fundamentus.utilities.config import (MAX_WORKERS, MEMOIZER_TTL,
+                                          SERVICE_GZIP_MINIMUM_SIZE,
+                                          SERVICE_MAX_SYMBOLS)
+
+# Tickers of the B3: four letters or digits, one or two digits and an optional letter,
+# e.g. PETR4, TAEE11 or PETR4F.
+SYMBOL_PATTERN = re.compile(r'[A-Z0-9]{4}[0-9]{1,2}[A-Z]?')
+
+
+def _normalize_symbol(symbol: str) -> str:
+    """Validates a ticker symbol and returns it in upper case.
+
+    Args:
+        symbol (str): The ticker symbol.
+
+    Returns:
+        str: The ticker symbol in upper case.
+
+    Raises:
+        HTTPException: 422 if the symbol is not a valid ticker.
+    """
+
+    normalized = symbol.strip().upper()
+    if not SYMBOL_PATTERN.fullmatch(normalized):
+        raise HTTPException(status_code=422, detail=f'Invalid symbol: {symbol}.')
+
+    return normalized
+
+
+def _normalize_symbols(symbols: str, max_symbols: int) -> List[str]:
+    """Validates comma separated ticker symbols, dropping the repeated ones.
+
+    Args:
+        symbols (str): The comma separated ticker symbols.
+        max_symbols (int): The maximum number of symbols.
+
+    Returns:
+        List[str]: The ticker symbols in upper case, in the order given.
+
+    Raises:
+        HTTPException: 422 if a symbol is not a valid ticker, if no symbol is given
+                       or if more than max_symbols are given.
+    """
+
+    normalized = list(dict.fromkeys(_normalize_symbol(symbol)
+                                    for symbol in symbols.split(',') if symbol.strip()))
+    if not normalized:
+        raise HTTPException(status_code=422, detail='No symbols given.')
+    if len(normalized) > max_symbols:
+        raise HTTPException(status_code=422,
+                            detail=f'At most {max_symbols} symbols per request.')
+
+    return normalized
+
+
+def _status_code(exception: Exception) -> int:
+    """Maps an error of the pipeline to the status code of the response.
+
+    Args:
+        exception (Exception): The error raised by the pipeline.
+
+    Returns:
+        int: 404 if the ticker is not found, 502 if the Fundamentus website failed,
+             500 otherwise.
+    """
+
+    cause = exception
+    while cause is not None:
+        if isinstance(cause, StockNotFoundError):
+            return 404
+        if isinstance(cause, requests.RequestException):
+            return 502
+
+        cause = cause.__cause__
+
+    return 500
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Checks whether the If-None-Match header matches the entity tag.
+
+    Args:
+        if_none_match (str): The value of the If-None-Match header, if any.
+        etag (str): The entity tag of the current body.
+
+    Returns:
+        bool: True if the client already holds the current body.
+    """
+
+    if not if_none_match:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(',')]
+
+    return '*' in candidates or etag in [candidate[2:] if candidate.startswith('W/')
+                                        else candidate for candidate in candidates]
+
+
+def _respond(request: Request, body: ResponseBodyContract) -> Response:
+    """Builds the response of an encoded body, honouring If-None-Match.
+
+    Args:
+        request (Request): The request being answered.
+        body (ResponseBodyContract): The encoded body.
+
+    Returns:
+        Response: 304 without body if the client holds the body, otherwise the body,
+                  streamed when it has more than one chunk.
+    """
+
+    headers = {'ETag': body.etag, 'Cache-Control': f'public, max-age={MEMOIZER_TTL}'}
+
+    if _etag_matches(request.headers.get('if-none-match'), body.etag):
+        return Response(status_code=304, headers=headers)
+
+    if len(body.chunks) == 1:
+        return Response(content=body.chunks[0], media_type='application/json',
+                        headers=headers)
+
+    return StreamingResponse(iter(body.chunks), media_type='application/json',
+                             headers=headers)
+
+
+def _ndjson_lines(symbols: Iterable[str], max_workers: int) -> Iterator[bytes]:
+    """Encodes the information of each stock as a JSON line, as soon as it completes.
+
+    Args:
+        symbols (Iterable[str]): The ticker symbols of the stocks.
+        max_workers (int): The number of stocks scraped at once.
+
+    Yields:
+        bytes: A line with the symbol and either its data or its error.
+    """
+
+    for result in FundamentusPipeline.iter_all_information(symbols, max_workers=max_workers):
+        if result.error is not None:
+            line = {'symbol': result.ticker, 'error': str(result.error)}
+        else:
+            line = {'symbol': result.ticker,
+                    'data': result.transform_contract.transformed_information}
+
+        yield encode_json(line) + b'\n'
+
+
+def create_app(memoizer: Memoizer = None,
+               max_symbols: int = SERVICE_MAX_SYMBOLS,
+               max_workers: int = MAX_WORKERS,
+               metrics: PrometheusRecorder = None) -> FastAPI:
+    """Creates the service.
+
+    Args:
+        memoizer (Memoizer): The memo of the encoded bodies. Defaults to a new Memoizer.
+        max_symbols (int): The maximum number of symbols of a batch or stream request.
+        max_workers (int): The maximum number of symbols of a batch scraped at once.
+        metrics (PrometheusRecorder): When given, it is set as the recorder of the
+                                      instrumentation and exposed on /metrics.
+
+    Returns:
+        FastAPI: The application.
+    """
+
+    if memoizer is None:
+        memoizer = Memoizer()
+
+    app = FastAPI(title='Python Fundamentus', version=__version__)
+    app.add_middleware(GZipMiddleware, minimum_size=SERVICE_GZIP_MINIMUM_SIZE)
+    app.state.memoizer = memoizer
+
+    if metrics is not None:
+        set_recorder(metrics)
+
+        @app.get('/metrics')
+        async def metrics_endpoint() -> PlainTextResponse:
+            """Returns the timings and counters of the pipeline."""
+
+            return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
+
+    async def render(key: Tuple[str, ...],
+                     compute: Callable[[], TransformContract]) -> ResponseBodyContract:
+        """Scrapes and encodes a body on the thread pool, going through the memo."""
+
+        def encode() -> ResponseBodyContract:
+            return encode_body(compute().transformed_information)
+
+        try:
+            return await run_in_threadpool(memoizer.get_or_compute, key, encode)
+        except Exception as exception:  # pylint: disable=broad-except
+            raise HTTPException(status_code=_status_code(exception),
+                                detail=str(exception)) from exception
+
+    async def render_stock(symbol: str) -> ResponseBodyContract:
+        """Renders the body of a stock."""
+
+        return await render(('stock', symbol),
+                            FundamentusPipeline(symbol).get_all_information)
+
+    @app.get('/stock/{symbol}')
+    async def stock(request: Request, symbol: str) -> Response:
+        """Returns the transformed information of a stock."""
+
+        return _respond(request, await render_stock(_normalize_symbol(symbol)))
+
+    @app.get('/stocks')
+    async def stocks(request: Request,
+                     symbols: str = Query(..., description='Comma separated symbols.')
+                     ) -> Response:
+        """Returns the transformed information of many stocks.
+
+        A symbol that fails is reported under `errors` instead of failing the batch.
+        """
+
+        normalized = _normalize_symbols(symbols, max_symbols)
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def render_bounded(symbol: str) -> ResponseBodyContract:
+            async with semaphore:
+                return await render_stock(symbol)
+
+        bodies = await asyncio.gather(*(render_bounded(symbol) for symbol in normalized),
+                                      return_exceptions=True)
+
+        results: List[bytes] = []
+        errors: Dict[str, str] = {}
+        for symbol, body in zip(normalized, bodies):
+            if isinstance(body, HTTPException):
+                errors[symbol] = body.detail
+            elif isinstance(body, BaseException):
+                raise body
+            else:
+                results.append(encode_json(symbol) + b':' + body.chunks[0])
+
+        chunk = b'{"results":{' + b','.join(results) + b'},"errors":' + encode_json(errors) + b'}'
+
+        return _respond(request, ResponseBodyContract(chunks=(chunk,), etag=make_etag((chunk,))))
+
+    @app.get('/stocks/stream')
+    async def stocks_stream(symbols: str = Query(None, description='Comma separated symbols. '
+                                                                     'Defaults to every company.')
+                            ) -> StreamingResponse:
+        """Streams the transformed information of many stocks as NDJSON.
+
+        Each line is sent as soon as its stock completes, in completion order.
+        """
+
+        if symbols is not None:
+            normalized = _normalize_symbols(symbols, max_symbols)
+        else:
+            try:
+                listing = await run_in_threadpool(FundamentusPipeline().list_all_companies)
+            except Exception as exception:  # pylint: disable=broad-except
+                raise HTTPException(status_code=_status_code(exception),
+                                    detail=str(exception)) from exception
+            normalized = [company['code'] for company in listing.transformed_information]
+
+        # The synchronous generator is iterated on the thread pool by the response.
+        return StreamingResponse(_ndjson_lines(normalized, max_workers),
+                                 media_type='application/x-ndjson')
+
+    @app.get('/companies')
+    async def companies(request: Request) -> Response:
+        """Returns the listing of the companies."""
+
+        return _respond(request, await render(('companies',),
+                                              FundamentusPipeline().list_all_companies))
+
+    @app.get('/property-funds')
+    async def property_funds(request: Request) -> Response:
+        """Returns the listing of the real estate investment funds."""
+
+        return _respond(request, await render(('property_funds',),
+                                              FundamentusPipeline().list_all_property_funds))
+
+    return app
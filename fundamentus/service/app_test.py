@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: app_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Test the Fundamentus service."""
+
+import json
+
+import pytest
+
+from fundamentus.drivers.mocks.companies_list import COMPANIES_LIST_MOCK
+from fundamentus.cache.memoizer import Memoizer
+from fundamentus.drivers.mocks.html_collector import HTML_COLLECTOR_MOCK
+from fundamentus.main.fundamentus_pipeline import FundamentusPipeline
+from fundamentus.metrics.instrumentation import set_recorder
+from fundamentus.metrics.prometheus_recorder import PrometheusRecorder
+from fundamentus.utilities.config import URL
+
+pytest.importorskip('fastapi')
+
+# pylint: disable=wrong-import-position
+from fastapi.testclient import TestClient  # noqa: E402
+
+from .app import create_app  # noqa: E402
+
+
+@pytest.fixture(name='client')
+def fixture_client() -> TestClient:
+    """Build a client of a new service."""
+
+    return TestClient(create_app())
+
+
+def test_stock(client, requests_mock) -> None:
+    """Test the /stock/{symbol} endpoint and its ETag."""
+
+    requests_mock.get(URL, status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    response = client.get('/stock/mglu3', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.status_code == 200
+    assert response.headers['content-encoding'] == 'gzip'
+    assert response.json()['detailed_information']['stock_type']['title'] == 'Tipo'
+
+    etag = response.headers['etag']
+    not_modified = client.get('/stock/MGLU3', headers={'If-None-Match': etag})
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b''
+    assert client.app.state.memoizer.statistics['hits'] == 1
+
+
+def test_invalid_symbol(client) -> None:
+    """Test that invalid symbols are rejected before scraping."""
+
+    assert client.get('/stock/not-a-ticker').status_code == 422
+    assert client.get('/stocks', params={'symbols': 'PETR4,???'}).status_code == 422
+
+
+def test_status_codes(client, requests_mock, monkeypatch) -> None:
+    """Test the errors of the pipeline are mapped to their status codes."""
+
+    requests_mock.get(f'{URL}?papel=XPTO3', status_code=COMPANIES_LIST_MOCK['status_code'],
+                      text=COMPANIES_LIST_MOCK['content'])
+    requests_mock.get(f'{URL}?papel=FAIL3', status_code=503)
+
+    assert client.get('/stock/XPTO3').status_code == 404
+    assert client.get('/stock/FAIL3').status_code == 502
+
+    def get_all_information(_pipeline) -> None:
+        raise RuntimeError('Unexpected error.')
+
+    monkeypatch.setattr(FundamentusPipeline, 'get_all_information', get_all_information)
+    assert client.get('/stock/MGLU3').status_code == 500
+
+
+def test_given_memoizer() -> None:
+    """Test an empty memoizer given to the service is used."""
+
+    memoizer = Memoizer()
+
+    assert create_app(memoizer=memoizer).state.memoizer is memoizer
+
+
+def test_stocks(client, requests_mock) -> None:
+    """Test the /stocks endpoint, reporting the failing symbols."""
+
+    requests_mock.get(URL, status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+    requests_mock.get(f'{URL}?papel=FAIL3', status_code=503)
+
+    response = client.get('/stocks', params={'symbols': 'MGLU3,FAIL3,mglu3'})
+    body = response.json()
+
+    assert response.status_code == 200
+    assert list(body['results']) == ['MGLU3']
+    assert list(body['errors']) == ['FAIL3']
+
+
+def test_companies(requests_mock) -> None:
+    """Test the /companies endpoint, streamed in chunks."""
+
+    requests_mock.get(URL, status_code=COMPANIES_LIST_MOCK['status_code'],
+                      text=COMPANIES_LIST_MOCK['content'])
+
+    response = TestClient(create_app()).get('/companies')
+
+    assert response.status_code == 200
+    assert response.json()[0]['code'] == 'AALR3'
+    assert 'etag' in response.headers
+
+
+def test_stocks_stream(client, requests_mock) -> None:
+    """Test the /stocks/stream endpoint, one JSON line per symbol."""
+
+    requests_mock.get(URL, status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+    requests_mock.get(f'{URL}?papel=FAIL3', status_code=503)
+
+    response = client.get('/stocks/stream', params={'symbols': 'MGLU3,FAIL3'})
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert sorted(line['symbol'] for line in lines) == ['FAIL3', 'MGLU3']
+    assert {line['symbol']: 'data' in line for line in lines} == {'MGLU3': True,
+                                                                   'FAIL3': False}
+
+
+def test_stocks_stream_limits() -> None:
+    """Test the /stocks/stream endpoint validates the symbols as the batch endpoint."""
+
+    client = TestClient(create_app(max_symbols=2))
+
+    assert client.get('/stocks/stream', params={'symbols': ' , '}).status_code == 422
+    assert client.get('/stocks/stream',
+                      params={'symbols': 'PETR4,VALE3,MGLU3'}).status_code == 422
+
+
+def test_metrics(requests_mock) -> None:
+    """Test the /metrics endpoint."""
+
+    requests_mock.get(URL, status_code=HTML_COLLECTOR_MOCK['status_code'],
+                      text=HTML_COLLECTOR_MOCK['content'])
+
+    try:
+        client = TestClient(create_app(metrics=PrometheusRecorder()))
+        client.get('/stock/MGLU3')
+        response = client.get('/metrics')
+    finally:
+        set_recorder(None)
+
+    assert response.status_code == 200
+    assert 'fundamentus_stage_duration_seconds_count{stage="pipeline"} 1' in response.text
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: json_encoding.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""
+Python Fundamentus JSON Encoding
+
+This module encodes the transformed information as JSON, ready to be sent by the
+service. Each InformationItem becomes an object with its title, tooltip and value,
+and decimals become JSON numbers. Lists, such as the listings of companies, are
+split into chunks so large bodies can be streamed.
+"""
+
+import hashlib
+import json
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
+from typing import Any, Tuple
+
+from fundamentus.contracts.response_body_contract import ResponseBodyContract
+from fundamentus.utilities.config import SERVICE_CHUNK_ITEMS
+
+
+def _default(value: Any) -> Any:
+    """Converts the values the json module does not know how to encode.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: A value the json module can encode.
+
+    Raises:
+        TypeError: If the value cannot be converted.
+    """
+
+    if isinstance(value, Decimal):
+        return float(value) if value.is_finite() else None
+
+    if is_dataclass(value):
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def encode_json(value: Any) -> bytes:
+    """Encodes a value as compact UTF-8 JSON.
+
+    Args:
+        value (Any): The value to encode.
+
+    Returns:
+        bytes: The encoded value.
+    """
+
+    return json.dumps(value, default=_default, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def make_etag(chunks: Tuple[bytes, ...]) -> str:
+    """Builds the strong entity tag of a body.
+
+    Args:
+        chunks (Tuple[bytes, ...]): The chunks of the body.
+
+    Returns:
+        str: The quoted entity tag.
+    """
+
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def encode_body(value: Any, chunk_items: int = SERVICE_CHUNK_ITEMS) -> ResponseBodyContract:
+    """Encodes a value as the body of a response.
+
+    A list is split into chunks of `chunk_items` items, any other value is
+    encoded as a single chunk.
+
+    Args:
+        value (Any): The value to encode.
+        chunk_items (int): The number of items of a list encoded per chunk.
+
+    Returns:
+        ResponseBodyContract: The chunks of the body and its entity tag.
+    """
+
+    if not isinstance(value, list):
+        chunks = (encode_json(value),)
+    else:
+        chunks = []
+        for start in range(0, len(value), chunk_items):
+            items = b','.join(encode_json(item) for item in value[start:start + chunk_items])
+            chunks.append((b'[' if start == 0 else b',') + items)
+        chunks.append(b']' if chunks else b'[]')
+        chunks = tuple(chunks)
+
+    return ResponseBodyContract(chunks=chunks, etag=make_etag(chunks))
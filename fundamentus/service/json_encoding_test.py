@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: json_encoding_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Test the JSON encoding of the service."""
+
+import json
+from decimal import Decimal
+
+from fundamentus.contracts.information_contract import InformationItem
+
+from .json_encoding import encode_body, encode_json
+
+
+def test_encode_json() -> None:
+    """Test that items and decimals are encoded."""
+
+    item = InformationItem(title='P/L', tooltip='Preço sobre lucro.', value=Decimal('12.5'))
+
+    assert json.loads(encode_json({'p_l': item, 'nan': Decimal('NaN')})) == {
+        'p_l': {'title': 'P/L', 'tooltip': 'Preço sobre lucro.', 'value': 12.5},
+        'nan': None}
+
+
+def test_encode_body() -> None:
+    """Test that lists are split into chunks with a stable ETag."""
+
+    listing = [{'code': f'TEST{index}'} for index in range(5)]
+
+    body = encode_body(listing, chunk_items=2)
+
+    assert len(body.chunks) == 4
+    assert json.loads(b''.join(body.chunks)) == listing
+    assert body.etag == encode_body(listing, chunk_items=2).etag
+    assert b''.join(encode_body([]).chunks) == b'[]'
+    assert len(encode_body({'a': 1}).chunks) == 1
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: async_extractor_html_information.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+"""Async Extractor HTML Information."""
+
+import asyncio
+from datetime import datetime as dt
+from typing import Callable
+
+from fundamentus.contracts.extract_contract import ExtractContract
+from fundamentus.drivers.interfaces.async_http_requester import \
+    AsyncHttpRequesterInterface
+from fundamentus.drivers.interfaces.html_collector import \
+    HtmlCollectorInterface
+from fundamentus.exceptions.extract_exception import ExtractException
+
+
+# pylint: disable=too-few-public-methods
+class AsyncExtractorHtmlInformation:
+    """Represents an asynchronous HTML information extractor.
+
+    The HTTP request is awaited on the event loop, while the HTML parsing,
+    which is CPU bound, runs on the default executor so the loop stays responsive.
+    """
+
+    def __init__(self, requester: AsyncHttpRequesterInterface,
+                 collector: HtmlCollectorInterface) -> None:
+        """Initialize the class.
+
+        :param requester: AsyncHttpRequesterInterface: Requester to make the request.
+        :param collector: HtmlCollectorInterface: Collector to collect the information.
+        """
+
+        self.__requester = requester
+        self.__collector = collector
+
+    async def fetch_html(self) -> str:
+        """Request the HTML, without collecting it.
+
+        :return: str: The HTML of the page.
+        :raises ExtractException: If the request fails.
+        """
+
+        try:
+            html_information = await self.__requester.make_request()
+
+            return html_information.response.text
+        except Exception as exception:
+            raise ExtractException(exception) from exception
+
+    async def __extract(self, collect: Callable, html: str = None) -> ExtractContract:
+        """Collect the HTML with the given collector method, requesting it if not given.
+
+        :param collect: Callable: Collector method applied to the HTML.
+        :param html: str: The HTML of the page, if already fetched.
+        :return: ExtractContract: Extracted information.
+        :raises ExtractException: If the extraction fails.
+        """
+
+        if html is None:
+            html = await self.fetch_html()
+
+        try:
+            loop = asyncio.get_running_loop()
+            collect_information = await loop.run_in_executor(None, collect, html)
+
+            return ExtractContract(raw_information=collect_information,
+                                   extraction_date=dt.today().toordinal())
+        except Exception as exception:
+            raise ExtractException(exception) from exception
+
+    async def extract_all_information(self, html: str = None) -> ExtractContract:
+        """Extract the information from the HTML.
+
+        :param html: str: The HTML of the page, if already fetched.
+        :return: ExtractContract: Extracted information.
+        :raises ExtractException: If the extraction fails.
+        """
+
+        return await self.__extract(self.__collector.collect_all_information, html)
+
+    async def extract_companies(self, html: str = None) -> ExtractContract:
+        """Extract the list of companies from the HTML.
+
+        :param html: str: The HTML of the page, if already fetched.
+        :return: ExtractContract: Extracted information.
+        :raises ExtractException: If the extraction fails.
+        """
+
+        return await self.__extract(self.__collector.collect_list_of_companies, html)
+
+    async def extract_property_funds(self, html: str = None) -> ExtractContract:
+        """Extract the list of property funds from the HTML.
+
+        :param html: str: The HTML of the page, if already fetched.
+        :return: ExtractContract: Extracted information.
+        :raises ExtractException: If the extraction fails.
+        """
+
+        return await self.__extract(self.__collector.collect_list_of_property_funds, html)
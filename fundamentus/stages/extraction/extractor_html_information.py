@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: extractor_html_information.py
-#  Version: 0.0.7
+#  Version: 0.0.12
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -18,6 +18,7 @@
 """Extractor HTML Information."""
 
 from datetime import datetime as dt
+from typing import Any, Callable, Iterable
 
 from fundamentus.contracts.extract_contract import ExtractContract
 from fundamentus.drivers.interfaces.html_collector import \
@@ -25,6 +26,7 @@ from fundamentus.drivers.interfaces.html_collector import \
 from fundamentus.drivers.interfaces.http_requester import \
     HttpRequesterInterface
 from fundamentus.exceptions.extract_exception import ExtractException
+from fundamentus.metrics.instrumentation import instrumented
 
 
 # pylint: disable=too-few-public-methods
@@ -42,53 +44,107 @@ class ExtractorHtmlInformation:
         self.__requester = requester
         self.__collector = collector
 
-    def extract_all_information(self) -> ExtractContract:
-        """Extract the information from the HTML.
+    @instrumented('fetch')
+    def fetch_html(self) -> str:
+        """Request the HTML, without collecting it.
 
-        :return: ExtractContract: Extracted information.
-        :raises ExtractException: If the extraction fails.
+        :return: str: The HTML of the page.
+        :raises ExtractException: If the request fails.
         """
 
         try:
-            html_information = self.__requester.make_request()
-            collect_information = self.__collector.collect_all_information(
-                html_information.response.text)
-
-            return ExtractContract(raw_information=collect_information,
-                                   extraction_date=dt.today().toordinal())
+            return self.__requester.make_request().response.text
         except Exception as exception:
             raise ExtractException(exception) from exception
 
-    def extract_companies(self) -> ExtractContract:
-        """Extract the information from the HTML.
+    def __extract(self, collect: Callable, html: str = None) -> ExtractContract:
+        """Collect the HTML with the given collector method, requesting it if not given.
 
+        :param collect: Callable: Collector method applied to the HTML.
+        :param html: str: The HTML of the page, if already fetched.
         :return: ExtractContract: Extracted information.
         :raises ExtractException: If the extraction fails.
         """
 
+        if html is None:
+            html = self.fetch_html()
+
         try:
-            html_information = self.__requester.make_request()
-            collect_information = self.__collector.collect_list_of_companies(
-                html_information.response.text)
+            collect_information = collect(html)
 
             return ExtractContract(raw_information=collect_information,
                                    extraction_date=dt.today().toordinal())
         except Exception as exception:
             raise ExtractException(exception) from exception
 
-    def extract_property_funds(self) -> ExtractContract:
+    def extract_all_information(self, html: str = None,
+                                sections: Iterable[str] = None) -> ExtractContract:
         """Extract the information from the HTML.
 
+        :param html: str: The HTML of the page, if already fetched.
+        :param sections: Iterable[str]: Raw sections to extract. Defaults to every section.
         :return: ExtractContract: Extracted information.
         :raises ExtractException: If the extraction fails.
         """
 
-        try:
-            html_information = self.__requester.make_request()
-            collect_information = self.__collector.collect_list_of_property_funds(
-                html_information.response.text)
+        if sections is None:
+            return self.__extract(self.__collector.collect_all_information, html)
 
-            return ExtractContract(raw_information=collect_information,
-                                   extraction_date=dt.today().toordinal())
+        return self.__extract(lambda html: self.__collector.collect_all_information(html, sections),
+                              html)
+
+    def extract_document(self, html: str = None) -> Any:
+        """Parse the HTML, for its sections to be collected later.
+
+        :param html: str: The HTML of the page, if already fetched.
+        :return: Any: The document parsed by the collector.
+        :raises ExtractException: If the parsing fails.
+        """
+
+        if html is None:
+            html = self.fetch_html()
+
+        try:
+            return self.__collector.parse_document(html)
         except Exception as exception:
             raise ExtractException(exception) from exception
+
+    def extract_companies(self, html: str = None) -> ExtractContract:
+        """Extract the list of companies from the HTML.
+
+        :param html: str: The HTML of the page, if already fetched.
+        :return: ExtractContract: Extracted information.
+        :raises ExtractException: If the extraction fails.
+        """
+
+        return self.__extract(self.__collector.collect_list_of_companies, html)
+
+    def extract_property_funds(self, html: str = None) -> ExtractContract:
+        """Extract the list of property funds from the HTML.
+
+        :param html: str: The HTML of the page, if already fetched.
+        :return: ExtractContract: Extracted information.
+        :raises ExtractException: If the extraction fails.
+        """
+
+        return self.__extract(self.__collector.collect_list_of_property_funds, html)
+
+    def extract_listings(self, html: str = None) -> ExtractContract:
+        """Extract the lists of companies and of property funds from the HTML.
+
+        :param html: str: The HTML of the page, if already fetched.
+        :return: ExtractContract: Extracted information.
+        :raises ExtractException: If the extraction fails.
+        """
+
+        return self.__extract(self.__collector.collect_listings, html)
+
+    def extract_market_results(self, html: str = None) -> ExtractContract:
+        """Extract the indicators of every stock from the market results.
+
+        :param html: str: The HTML of the page, if already fetched.
+        :return: ExtractContract: Extracted information.
+        :raises ExtractException: If the extraction fails.
+        """
+
+        return self.__extract(self.__collector.collect_market_results, html)
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: transform_raw_information.py
-#  Version: 0.1.3
+#  Version: 0.1.9
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -28,12 +28,15 @@ for feeding into financial models.
 """
 
 from decimal import Decimal
-from typing import Dict, List
+from typing import Any, Dict, Iterable, Iterator, List
 
 from fundamentus.contracts.extract_contract import ExtractContract
 from fundamentus.contracts.information_contract import InformationItem
 from fundamentus.contracts.transform_contract import TransformContract
 from fundamentus.exceptions.transform_exception import TransformException
+from fundamentus.metrics.instrumentation import instrumented
+from fundamentus.utilities.number_normalization import normalize_numbers
+from fundamentus.utilities.sections import SECTIONS, select_sections
 
 
 # pylint: disable=too-few-public-methods
@@ -53,6 +56,18 @@ class TransformRawInformation:
     as well as to transform comprehensive datasets for complete analysis.
     """
 
+    def __init__(self, numbers: Dict[str, Decimal] = None) -> None:
+        """Initializes the TransformRawInformation object.
+
+        Args:
+            numbers (Dict[str, Decimal]): Numbers normalized ahead of time, keyed by the
+                                          raw string. Used by transform_many, which
+                                          builds a transformer per call, so transformers
+                                          shared between threads never share them.
+        """
+
+        self.__numbers: Dict[str, Decimal] = dict(numbers or {})
+
     @staticmethod
     def __remove_new_lines(string: str) -> str:
         """
@@ -220,6 +235,10 @@ class TransformRawInformation:
             Decimal: The cleaned and converted Decimal object representing the input number.
         """
 
+        normalized = self.__numbers.get(number)
+        if normalized is not None:
+            return normalized
+
         return self.__to_decimal(
             self.__remove_currency_symbol(
                 self.__change_comma_to_dot(
@@ -975,7 +994,35 @@ class TransformRawInformation:
             }
         }
 
-    def __make_transformation(self, raw_information: Dict) -> Dict:
+    def __transformation_of_section(self, section: str, raw_section: Dict) -> Any:
+        """
+        Transforms a single raw section of the stock detail page.
+
+        Args:
+            section (str): The name of the transformed section, e.g. 'price_information'.
+            raw_section (Dict): The raw section, as collected from the page.
+
+        Returns:
+            Any: The transformed section.
+        """
+
+        transformations = {
+            'stock_identification': self.__transformation_of_stock_identification,
+            'financial_summary': self.__transformation_of_financial_summary,
+            'price_information': self.__transformation_of_price_information,
+            'detailed_information': self.__transformation_of_detailed_information,
+            'oscillations': self.__transformation_of_oscillations,
+            'valuation_indicators': self.__transformation_of_valuation_indicators,
+            'profitability_indicators': self.__transformation_of_profitability_indicators,
+            'indebtedness_indicators': self.__transformation_of_indebtedness_indicators,
+            'balance_sheet': self.__transformation_of_balance_sheet,
+            'income_statement': self.__transformation_of_income_statement
+        }
+
+        return transformations[section](raw_section)
+
+    def __make_transformation(self, raw_information: Dict,
+                              sections: Iterable[str] = None) -> Dict:
         """
         Perform the comprehensive transformation of raw financial information.
 
@@ -995,6 +1042,7 @@ class TransformRawInformation:
             raw_information (Dict): A dictionary containing all the raw financial
             data for a stock, organized by data categories (e.g., price information,
             detailed information, etc.).
+            sections (Iterable[str]): The sections to transform. Defaults to every section.
 
         Returns:
             Dict: A dictionary containing all the transformed financial information,
@@ -1019,58 +1067,9 @@ class TransformRawInformation:
             dict_keys(['price_information', 'detailed_information', 'oscillations', ...])
         """
 
-        # Processing stock identification information.
-        stock_identification = self.__transformation_of_stock_identification(
-            raw_information['identification'])
-
-        # Processing stock Financial Summary.
-        financial_summary = self.__transformation_of_financial_summary(
-            raw_information['financial_summary'])
-
-        # Processing stock price information.
-        price_information = self.__transformation_of_price_information(
-            raw_information['price'])
-
-        # Processing detailed stock information.
-        detailed_information = self.__transformation_of_detailed_information(
-            raw_information['detailed_information'])
-
-        # Processing stock price oscillation information.
-        oscillations = self.__transformation_of_oscillations(
-            raw_information['oscillations'])
-
-        # Processing stock valuation indicators.
-        valuation_indicators = self.__transformation_of_valuation_indicators(
-            raw_information['valuation_indicators'])
-
-        # Processing stock profitability indicators.
-        profitability_indicators = self.__transformation_of_profitability_indicators(
-            raw_information['profitability_indicators'])
-
-        # Processing stock indebtedness indicators.
-        indebtedness_indicators = self.__transformation_of_indebtedness_indicators(
-            raw_information['indebtedness_indicators'])
-
-        # Processing stock balance sheet indicators.
-        balance_sheet = self.__transformation_of_balance_sheet(
-            raw_information['balance_sheet'])
-
-        # Processing stock income statement information.
-        income_statement = self.__transformation_of_income_statement(
-            raw_information['income_statement'])
-
-        return {
-            'stock_identification': stock_identification,
-            'financial_summary': financial_summary,
-            'price_information': price_information,
-            'detailed_information': detailed_information,
-            'oscillations': oscillations,
-            'valuation_indicators': valuation_indicators,
-            'profitability_indicators': profitability_indicators,
-            'indebtedness_indicators': indebtedness_indicators,
-            'balance_sheet': balance_sheet,
-            'income_statement': income_statement
-        }
+        return {section: self.__transformation_of_section(section,
+                                                          raw_information[SECTIONS[section]])
+                for section in select_sections(sections)}
 
     def __make_transformation_companies(self, raw_information: str) -> List[Dict[str, str]]:
         """
@@ -1136,8 +1135,57 @@ class TransformRawInformation:
 
         return transformed
 
+    def __transformation_of_item(self, raw_item: List[str]) -> InformationItem:
+        """
+        Transforms a single raw indicator into an InformationItem.
+
+        Args:
+            raw_item (List[str]): The title, the tooltip and the value of the indicator.
+
+        Returns:
+            InformationItem: The cleaned and structured indicator.
+        """
+
+        return InformationItem(title=self.__string_processing(raw_item[0]),
+                               tooltip=self.__string_processing(raw_item[1]),
+                               value=self.__number_processing(raw_item[2]))
+
+    def __make_transformation_market_snapshot(
+            self, raw_information: List[Dict]) -> Dict[str, Dict]:
+        """
+        Transforms the raw market results into the indicators of each stock.
+
+        The indicators of each stock are structured as in `transform_all_information`,
+        under the same sections and keys, but only the sections and indicators shown in
+        the market results are present.
+
+        Args:
+            raw_information (List[Dict]): The raw information of each stock.
+
+        Returns:
+            Dict[str, Dict]: The transformed information of each stock, keyed by ticker,
+                             in the order of the market results.
+        """
+
+        snapshot = {}
+        for stock in raw_information:
+            identification = self.__transformation_of_stock_identification(
+                stock['identification'])
+
+            transformed = {'stock_identification': identification}
+            for section, raw_section in SECTIONS.items():
+                if section != 'stock_identification' and raw_section in stock:
+                    transformed[section] = {key: self.__transformation_of_item(raw_item)
+                                            for key, raw_item in stock[raw_section].items()}
+
+            snapshot[identification['name'].value] = transformed
+
+        return snapshot
+
+    @instrumented('transform')
     def transform_all_information(
-            self, extract_contract: ExtractContract) -> TransformContract:
+            self, extract_contract: ExtractContract,
+            sections: Iterable[str] = None) -> TransformContract:
         """
         Transforms all extracted information from an ExtractContract into a structured TransformContract.
 
@@ -1146,6 +1194,9 @@ class TransformRawInformation:
 
         Args:
             extract_contract (ExtractContract): The contract containing all raw extracted information.
+            sections (Iterable[str]): The sections to transform, e.g. ['price_information'].
+                                      Only their raw sections need to be extracted.
+                                      Defaults to every section.
 
         Returns:
             TransformContract: A contract containing all transformed information, structured for easy
@@ -1157,7 +1208,7 @@ class TransformRawInformation:
 
         try:
             transform_information = self.__make_transformation(
-                extract_contract.raw_information)
+                extract_contract.raw_information, sections)
 
             transform_contract = TransformContract(
                 transformed_information=transform_information)
@@ -1166,6 +1217,90 @@ class TransformRawInformation:
         except Exception as exception:
             raise TransformException(exception) from exception
 
+    @instrumented('transform')
+    def transform_section(self, section: str, raw_section: Dict) -> Any:
+        """
+        Transforms a single raw section of the stock detail page.
+
+        Used to transform the sections of a page one by one, as they are needed.
+
+        Args:
+            section (str): The name of the transformed section, e.g. 'balance_sheet'.
+            raw_section (Dict): The raw section, as collected from the page.
+
+        Returns:
+            Any: The transformed section.
+
+        Raises:
+            TransformException: If an error occurs during the transformation process.
+        """
+
+        try:
+            return self.__transformation_of_section(section, raw_section)
+        except Exception as exception:
+            raise TransformException(exception) from exception
+
+    @classmethod
+    def __collect_values(cls, raw_information) -> Iterator[str]:
+        """
+        Yields the raw value of every item of the raw information.
+
+        Items are lists holding the value in their last position, nested in
+        dictionaries. Non numeric values are yielded too; they are discarded
+        by the normalization.
+
+        Args:
+            raw_information: The raw information, or a part of it.
+
+        Yields:
+            str: The raw values.
+        """
+
+        if isinstance(raw_information, dict):
+            for information in raw_information.values():
+                yield from cls.__collect_values(information)
+        elif isinstance(raw_information, list) and raw_information:
+            if isinstance(raw_information[-1], str):
+                yield raw_information[-1]
+
+    @instrumented('transform')
+    def transform_many(
+            self, extract_contracts: Iterable[ExtractContract]) -> List[TransformContract]:
+        """
+        Transforms the extracted information of many stocks at once.
+
+        The numbers of every contract are normalized together as a single column before
+        the transformation, so each distinct raw string is converted only once. The
+        results are the same as calling transform_all_information on each contract.
+
+        Args:
+            extract_contracts (Iterable[ExtractContract]): The contracts containing the raw
+                                                           extracted information.
+
+        Returns:
+            List[TransformContract]: The transformed contracts, in the order given.
+
+        Raises:
+            TransformException: If an error occurs during the transformation process.
+        """
+
+        extract_contracts = list(extract_contracts)
+
+        try:
+            numbers = normalize_numbers(value
+                                        for extract_contract in extract_contracts
+                                        for value in self.__collect_values(
+                                            extract_contract.raw_information))
+        except Exception as exception:
+            raise TransformException(exception) from exception
+
+        transformer = TransformRawInformation({raw: number for raw, number in numbers.items()
+                                               if number is not None})
+
+        return [transformer.transform_all_information(extract_contract)
+                for extract_contract in extract_contracts]
+
+    @instrumented('transform')
     def transform_companies(
             self, extract_contract: ExtractContract) -> TransformContract:
         """
@@ -1195,6 +1330,7 @@ class TransformRawInformation:
         except Exception as exception:
             raise TransformException(exception) from exception
 
+    @instrumented('transform')
     def transform_property_funds(
             self, extract_contract: ExtractContract) -> TransformContract:
         """
@@ -1222,3 +1358,62 @@ class TransformRawInformation:
             return transform_contract
         except Exception as exception:
             raise TransformException(exception) from exception
+
+    @instrumented('transform')
+    def transform_listings(
+            self, extract_contract: ExtractContract) -> TransformContract:
+        """
+        Transforms the extracted lists of companies and of property funds at once.
+
+        Args:
+            extract_contract (ExtractContract): The contract containing both raw lists.
+
+        Returns:
+            TransformContract: A contract with the transformed 'companies' and
+                               'property_funds' lists.
+
+        Raises:
+            TransformException: If an error occurs during the transformation of the lists.
+        """
+
+        try:
+            raw_information = extract_contract.raw_information
+
+            transform_information = {
+                'companies': self.__make_transformation_companies(
+                    raw_information['companies']),
+                'property_funds': self.__make_transformation_property_funds(
+                    raw_information['property_funds'])
+            }
+
+            return TransformContract(transformed_information=transform_information)
+        except Exception as exception:
+            raise TransformException(exception) from exception
+
+    @instrumented('transform')
+    def transform_market_snapshot(
+            self, extract_contract: ExtractContract) -> TransformContract:
+        """
+        Transforms the extracted market results into a TransformContract.
+
+        The market results hold the main indicators of every listed stock in a single page,
+        structured under the same sections and keys as the stock detail page.
+
+        Args:
+            extract_contract (ExtractContract): The contract containing the raw market results.
+
+        Returns:
+            TransformContract: A contract with the transformed information of each stock,
+                               keyed by ticker.
+
+        Raises:
+            TransformException: If an error occurs during the transformation of the market results.
+        """
+
+        try:
+            transform_information = self.__make_transformation_market_snapshot(
+                extract_contract.raw_information)
+
+            return TransformContract(transformed_information=transform_information)
+        except Exception as exception:
+            raise TransformException(exception) from exception
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: transform_raw_information_test.py
-#  Version: 0.0.11
+#  Version: 0.0.12
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -17,12 +17,20 @@
 # ------------------------------------------------------------------------------
 """Test of transform raw information from the HTTP requester."""
 
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
 from fundamentus.contracts.mocks.extract_contract import EXTRACT_CONTRACT_MOCK
 from fundamentus.contracts.mocks.extract_contract_companies import \
     EXTRACT_CONTRACT_COMPANIES_MOCK
 from fundamentus.contracts.mocks.extract_contract_property_funds import \
     EXTRACT_CONTRACT_PROPERTY_FUNDS_MOCK
+from fundamentus.contracts.extract_contract import ExtractContract
 from fundamentus.contracts.transform_contract import TransformContract
+from fundamentus.drivers.html_collector import HtmlCollector
+from fundamentus.drivers.mocks.market_results import MARKET_RESULTS_MOCK
 from fundamentus.exceptions.transform_exception import TransformException
 
 from fundamentus.contracts.information_contract import InformationItem
@@ -304,3 +312,85 @@ def test_transform_raw_information_of_property_funds_exception() -> None:
         transformed = transform.transform_property_funds([])  # pylint: disable=unused-variable
     except TransformException as exception:
         assert isinstance(exception, TransformException)
+
+
+def test_transform_many() -> None:
+    """Test of transform many extracted information at once."""
+
+    transform = TransformRawInformation()
+    transformed = transform.transform_many([EXTRACT_CONTRACT_MOCK, EXTRACT_CONTRACT_MOCK])
+
+    assert len(transformed) == 2
+    assert transformed[0] == transform.transform_all_information(EXTRACT_CONTRACT_MOCK)
+    assert transformed[1] == transformed[0]
+
+
+def test_transform_many_shared_between_threads() -> None:
+    """Test of transform many with a transformer shared between threads."""
+
+    transform = TransformRawInformation()
+    expected = transform.transform_all_information(EXTRACT_CONTRACT_MOCK)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        batches = list(executor.map(transform.transform_many,
+                                    [[EXTRACT_CONTRACT_MOCK] * 3] * 8))
+
+    assert all(transformed == expected for batch in batches for transformed in batch)
+
+
+def test_transform_many_exception() -> None:
+    """Test of transform many extracted information with an invalid contract.
+
+    :raises: TransformException
+    """
+
+    with pytest.raises(TransformException):
+        TransformRawInformation().transform_many([EXTRACT_CONTRACT_MOCK, []])
+
+
+def test_transform_shares_titles_and_tooltips() -> None:
+    """Test the items of different transformations share their titles and tooltips."""
+
+    first = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+    second = TransformRawInformation().transform_all_information(EXTRACT_CONTRACT_MOCK)
+
+    first_item = first.transformed_information['valuation_indicators']['dividend_yield']
+    second_item = second.transformed_information['valuation_indicators']['dividend_yield']
+
+    assert not hasattr(first_item, '__dict__')
+    assert first_item.title is second_item.title
+    assert first_item.tooltip is second_item.tooltip
+
+
+def test_transform_market_snapshot() -> None:
+    """Test the market snapshot uses the sections and keys of the detail page."""
+
+    transform = TransformRawInformation()
+    raw_information = HtmlCollector().collect_market_results(MARKET_RESULTS_MOCK['content'])
+    transformed = transform.transform_market_snapshot(
+        ExtractContract(raw_information=raw_information, extraction_date=0))
+
+    assert isinstance(transformed, TransformContract)
+    assert list(transformed.transformed_information) == ['AALR3', 'ABCB4', 'MGLU3', 'PETR4']
+
+    detail = transform.transform_all_information(
+        EXTRACT_CONTRACT_MOCK).transformed_information
+    snapshot = transformed.transformed_information['PETR4']
+
+    for section, information in snapshot.items():
+        assert set(information) <= set(detail[section])
+
+    assert snapshot['stock_identification']['name'].value == 'PETR4'
+    assert snapshot['price_information']['price'].value == Decimal('36.28')
+    assert snapshot['valuation_indicators']['dividend_yield'].value == Decimal('0.1829')
+    assert snapshot['balance_sheet']['equity'].value == Decimal('393000000000.00')
+
+
+def test_transform_market_snapshot_exception() -> None:
+    """Test the market snapshot of invalid raw information."""
+
+    transform = TransformRawInformation()
+
+    with pytest.raises(TransformException):
+        transform.transform_market_snapshot(
+            ExtractContract(raw_information=[{}], extraction_date=0))
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: config.py
-#  Version: 0.0.1
+#  Version: 0.0.12
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -19,4 +19,101 @@
 """Configuration file for the Python Fundamentus API."""
 
 URL = 'https://www.fundamentus.com.br/detalhes.php'
+
+# Page of the indicators of every listed stock, in a single table.
+RESULTS_URL = 'https://www.fundamentus.com.br/resultado.php'
 INTERFACE = 'mobile'
+
+# Number of worker threads used by the batch pipeline.
+MAX_WORKERS = 8
+
+# Maximum number of requests in flight in the async pipeline.
+MAX_CONCURRENCY = 32
+
+# Connection pool of the shared HTTP session.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# Retries with exponential backoff for throttled or failing requests.
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# B3 trading sessions, in Brasília time (UTC-3, without daylight saving time since 2019).
+# The regular session runs from 10:00 to 17:00, and the closing prices are published
+# on the website about 30 minutes (1800 seconds) after the close.
+MARKET_UTC_OFFSET = -3
+MARKET_OPEN = (10, 0)
+MARKET_CLOSE = (17, 0)
+MARKET_SETTLE = 1800
+
+# While the prices may change, detail pages and the market results expire after
+# 15 minutes (900 seconds); when the market is closed, they are kept until it opens.
+SESSION_CACHE_TTL = 900
+
+# Backend of the response cache: 'memory', 'sqlite' or 'filesystem'.
+CACHE_BACKEND = 'sqlite'
+CACHE_NAME = 'fundamentus_cache'
+
+# Maximum number of responses kept by the in-memory cache backend.
+CACHE_MAX_ENTRIES = 1024
+
+# Detail pages and the market results expire after 12 hours (43200 seconds),
+# listings after 7 days (604800 seconds).
+CACHE_TTL = {'detail': 43200, 'listing': 604800, 'results': 43200, 'default': 43200}
+
+# Parsed pages are addressed by the hash of their HTML, so they are kept for a day.
+PARSED_CACHE_MAX_ENTRIES = 2048
+PARSED_CACHE_TTL = 86400
+
+# Transformed sections kept by a SectionCache with a fixed time to live: the price
+# derived sections for 15 minutes (900 seconds), the sections of the financial
+# statements for 7 days (604800 seconds), the others as long as a detail page.
+SECTION_CACHE_TTL = {
+    'stock_identification': 604800,
+    'financial_summary': 43200,
+    'price_information': 900,
+    'detailed_information': 43200,
+    'oscillations': 900,
+    'valuation_indicators': 900,
+    'profitability_indicators': 604800,
+    'indebtedness_indicators': 604800,
+    'balance_sheet': 604800,
+    'income_statement': 604800
+}
+
+# Transformed sections derived from the price: by default, a SectionCache keeps them
+# for SESSION_CACHE_TTL while the prices may change, and until the next session opens
+# when the market is closed.
+PRICE_SECTIONS = ('price_information', 'oscillations', 'valuation_indicators')
+
+# Results memoized by the pipeline are reused for 5 minutes (300 seconds).
+MEMOIZER_MAX_ENTRIES = 512
+MEMOIZER_TTL = 300
+
+# Maximum number of symbols of a batch or stream request to the service.
+SERVICE_MAX_SYMBOLS = 50
+
+# Items of a listing sent per chunk of a streamed response.
+SERVICE_CHUNK_ITEMS = 256
+
+# Responses smaller than 1 KiB are not worth compressing.
+SERVICE_GZIP_MINIMUM_SIZE = 1024
+
+# The crawler sends at most 2 requests per second, in bursts of up to 4 requests.
+CRAWL_RATE = 2.0
+CRAWL_BURST = 4
+
+# Status codes telling the website is throttling the requests.
+THROTTLE_STATUS_CODES = (429, 503)
+
+# The adaptive rate limiter stays between 0.2 and 10 requests per second. When healthy,
+# it adds 0.1 request per second, and 1 request in flight, for each window of requests;
+# it halves both on a throttled or failed request, or on a request 3 times slower than
+# usual, at most once every 2 seconds.
+ADAPTIVE_MIN_RATE = 0.2
+ADAPTIVE_MAX_RATE = 10.0
+ADAPTIVE_RATE_INCREASE = 0.1
+ADAPTIVE_DECREASE_FACTOR = 0.5
+ADAPTIVE_LATENCY_FACTOR = 3.0
+ADAPTIVE_COOLDOWN = 2.0
@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: indicator_names.py
-#  Version: 0.0.1
+#  Version: 0.0.2
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -76,5 +76,86 @@ INDICATOR_NAME = {
     'lucro_liquido_ultimos_12_meses': 'Lucro Líquido nos Últimos 12 meses',
     'receita_liquida_ultimos_3_meses': 'Receita Líquida nos últimos 03 meses',
     'ebit_ultimos_3_meses': 'EBIT nos Últimos 03 meses',
-    'lucro_liquido_ultimos_3_meses': 'Lucro Líquido nos Últimos 03 meses'
+    'lucro_liquido_ultimos_3_meses': 'Lucro Líquido nos Últimos 03 meses',
+    'divida_bruta_sobre_patrimonio': 'Dívida Bruta/Patrimônio Líquido',
+    'divida_liquida_sobre_patrimonio': 'Dívida Líquida/Patrimônio Líquido',
+    'divida_liquida_sobre_ebitda': 'Dívida Líquida/EBITDA',
+    'patrimonio_sobre_ativos': 'Patrimônio Líquido/Ativos',
+    'carteira_de_credito': 'Carteira de Crédito',
+    'depositos': 'Depósitos'
 }
+
+# Path of each indicator in the transformed information.
+INDICATOR_PATH = {
+    'cotacao': ('price_information', 'price'),
+    'ultima_cotação': ('price_information', 'date'),
+    'minino_52_semanas': ('detailed_information', 'variation_52_weeks', 'lowest_value'),
+    'maximo_52_semanas': ('detailed_information', 'variation_52_weeks', 'highest_value'),
+    'trading_code': ('stock_identification', 'name'),
+    'empresa': ('stock_identification', 'ticker'),
+    'tipo': ('detailed_information', 'stock_type'),
+    'setor': ('financial_summary', 'sector'),
+    'subsetor': ('financial_summary', 'subsector'),
+    'valor_de_mercado': ('financial_summary', 'market_valuation'),
+    'valor_da_firma': ('financial_summary', 'enterprise_valuation'),
+    'numero_de_acoes': ('financial_summary', 'number_of_shares'),
+    'data_ultimo_balanço': ('financial_summary', 'last_financial_statement'),
+    'volume_negociacoes_2_meses': ('detailed_information', 'traded_volume_per_day'),
+    'dia': ('oscillations', 'variation_day'),
+    'mes': ('oscillations', 'variation_month'),
+    '30_dias': ('oscillations', 'variation_30_days'),
+    '12_meses': ('oscillations', 'variation_12_months'),
+    '2022': ('oscillations', 'variation_2022'),
+    '2021': ('oscillations', 'variation_2021'),
+    '2020': ('oscillations', 'variation_2020'),
+    '2019': ('oscillations', 'variation_2019'),
+    '2018': ('oscillations', 'variation_2018'),
+    '2017': ('oscillations', 'variation_2017'),
+    'preco_sobre_lucro': ('valuation_indicators', 'price_divided_by_profit_title'),
+    'preco_sobre_valor_patrimonial': ('valuation_indicators', 'price_divided_by_asset_value'),
+    'preco_sobre_ebit': ('valuation_indicators', 'price_divided_by_ebit'),
+    'preco_sobre_ativos': ('valuation_indicators', 'price_divided_by_total_assets'),
+    'preco_sobre_ativo_circulante_liquido': ('valuation_indicators',
+                                             'price_divided_by_net_current_assets'),
+    'preco_sobre_capital_giro': ('valuation_indicators', 'price_by_working_capital'),
+    'lucro_por_acao': ('detailed_information', 'earnings_per_share'),
+    'valor_patrimonial_por_acao': ('detailed_information', 'equity_value_per_share'),
+    'price_sales_ratio': ('valuation_indicators', 'price_divided_by_net_revenue'),
+    'dividend_yield': ('valuation_indicators', 'dividend_yield'),
+    'enterprise_value_sobre_ebitda': ('valuation_indicators', 'enterprise_value_by_ebitda'),
+    'enterprise_value_sobre_ebit': ('valuation_indicators', 'enterprise_value_by_ebit'),
+    'return_invested_capital': ('profitability_indicators', 'return_on_invested_capital'),
+    'return_on_equity': ('profitability_indicators', 'return_on_equity'),
+    'ebit_sobre_ativos_totais': ('profitability_indicators', 'ebit_divided_by_total_assets'),
+    'crescimento_receita_liquida_5_anos': ('profitability_indicators',
+                                           'net_revenue_growth_last_5_years'),
+    'giro_ativos': ('profitability_indicators', 'net_revenue_divided_by_total_assets'),
+    'margem_bruta': ('profitability_indicators', 'gross_profit_divided_by_net_revenue'),
+    'margem_ebit': ('profitability_indicators', 'ebit_divided_by_net_revenue'),
+    'margem_liquida': ('profitability_indicators', 'net_income_divided_by_net_revenue'),
+    'liquidez_corrente': ('indebtedness_indicators', 'current_liquidity'),
+    'divida_bruta_sobre_patrimonio': ('indebtedness_indicators', 'gross_debt_by_equity'),
+    'divida_liquida_sobre_patrimonio': ('indebtedness_indicators', 'net_debt_by_equity'),
+    'divida_liquida_sobre_ebitda': ('indebtedness_indicators', 'net_debt_by_ebitda'),
+    'patrimonio_sobre_ativos': ('indebtedness_indicators', 'equity_by_total_assets'),
+    'ativo': ('balance_sheet', 'total_assets'),
+    'ativo_circulante': ('balance_sheet', 'current_assets'),
+    'disponibilidades': ('balance_sheet', 'cash'),
+    'divida_bruta': ('balance_sheet', 'gross_debt'),
+    'divida_líquida': ('balance_sheet', 'net_debt'),
+    'patrimonio_Liquido': ('balance_sheet', 'equity'),
+    'carteira_de_credito': ('balance_sheet', 'credit_portfolio'),
+    'depositos': ('balance_sheet', 'deposits'),
+    'receita_liquida_ultimos_12_meses': ('income_statement', 'twelve_months', 'revenue'),
+    'ebit_ultimos_12_meses': ('income_statement', 'twelve_months', 'ebit'),
+    'lucro_liquido_ultimos_12_meses': ('income_statement', 'twelve_months', 'net_income'),
+    'receita_liquida_ultimos_3_meses': ('income_statement', 'three_months', 'revenue'),
+    'ebit_ultimos_3_meses': ('income_statement', 'three_months', 'ebit'),
+    'lucro_liquido_ultimos_3_meses': ('income_statement', 'three_months', 'net_income')
+}
+
+# Indicators holding text instead of numbers.
+TEXT_INDICATORS = frozenset(['trading_code', 'empresa', 'tipo', 'setor', 'subsetor'])
+
+# Indicators holding dates formatted as dd/mm/yyyy.
+DATE_INDICATORS = frozenset(['ultima_cotação', 'data_ultimo_balanço'])
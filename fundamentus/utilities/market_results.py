@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: market_results.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Columns of the market results page."""
+
+# Column of the market results page holding the ticker of each stock.
+TICKER_COLUMN = 'Papel'
+
+# Columns of the market results page, by header, mapped to the raw section and the key
+# of the same indicator in the stock detail page. Other columns are not collected.
+RESULTS_COLUMNS = {
+    'Cotação': ('price', 'price'),
+    'P/L': ('valuation_indicators', 'price_divided_by_profit_title'),
+    'P/VP': ('valuation_indicators', 'price_divided_by_asset_value'),
+    'PSR': ('valuation_indicators', 'price_divided_by_net_revenue'),
+    'Div.Yield': ('valuation_indicators', 'dividend_yield'),
+    'P/Ativo': ('valuation_indicators', 'price_divided_by_total_assets'),
+    'P/Cap.Giro': ('valuation_indicators', 'price_by_working_capital'),
+    'P/EBIT': ('valuation_indicators', 'price_divided_by_ebit'),
+    'P/Ativ Circ.Liq': ('valuation_indicators', 'price_divided_by_net_current_assets'),
+    'EV/EBIT': ('valuation_indicators', 'enterprise_value_by_ebit'),
+    'EV/EBITDA': ('valuation_indicators', 'enterprise_value_by_ebitda'),
+    'Mrg Ebit': ('profitability_indicators', 'ebit_divided_by_net_revenue'),
+    'Mrg. Líq.': ('profitability_indicators', 'net_income_divided_by_net_revenue'),
+    'ROIC': ('profitability_indicators', 'return_on_invested_capital'),
+    'ROE': ('profitability_indicators', 'return_on_equity'),
+    'Cresc. Rec.5a': ('profitability_indicators', 'net_revenue_growth_last_5_years'),
+    'Liq. Corr.': ('indebtedness_indicators', 'current_liquidity'),
+    'Dív.Brut/ Patrim.': ('indebtedness_indicators', 'gross_debt_by_equity'),
+    'Liq.2meses': ('detailed_information', 'traded_volume_per_day'),
+    'Patrim. Líq': ('balance_sheet', 'equity')
+}
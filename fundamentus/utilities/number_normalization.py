@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: number_normalization.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Normalizes Brazilian formatted numbers ("1.234,56", "12,3%", "R$ 10", "-") in batch.
+
+The numbers of many pages are normalized as a single column: repeated strings are
+converted only once, and the cleaning runs as one `str.translate` per string instead
+of a chain of `str.replace` calls. The results are the same Decimals the scalar path
+of the transformer returns.
+"""
+
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterable, Optional
+
+# Removes new lines and thousand separators, and turns the decimal comma into a dot.
+__NUMBER_TRANSLATION = str.maketrans({'\n': None, '.': None, ',': '.'})
+
+
+def to_decimal(value: str) -> Decimal:
+    """Convert a cleaned string to a Decimal, handling percentages and missing values.
+
+    :param value: str: The cleaned number, e.g. "1234.56", "12.3%" or "-".
+    :return: Decimal: The number, with percentages divided by 100 and "-" as zero.
+    :raises InvalidOperation: If the string is not a number.
+    """
+
+    value = value.strip()
+
+    if value.endswith('%'):
+        value = value[:-1].strip()
+
+        return Decimal(0) if value == '-' else Decimal(value) / 100
+
+    return Decimal(0) if value == '-' else Decimal(value)
+
+
+def normalize_number(number: str) -> Decimal:
+    """Normalize a single Brazilian formatted number.
+
+    :param number: str: The raw number, e.g. "R$ 1.234,56".
+    :return: Decimal: The number.
+    :raises InvalidOperation: If the string is not a number.
+    """
+
+    return to_decimal(number.translate(__NUMBER_TRANSLATION).replace('R$', ''))
+
+
+def normalize_numbers(numbers: Iterable[str]) -> Dict[str, Optional[Decimal]]:
+    """Normalize a column of Brazilian formatted numbers.
+
+    :param numbers: Iterable[str]: The raw numbers, usually from many pages.
+    :return: Dict[str, Optional[Decimal]]: Each distinct raw string mapped to its number,
+             or to None when it is not a number.
+    """
+
+    normalized = {}
+
+    for number in dict.fromkeys(numbers):
+        try:
+            normalized[number] = normalize_number(number)
+        except InvalidOperation:
+            normalized[number] = None
+
+    return normalized
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: number_normalization_test.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Test of the number normalization."""
+
+from decimal import Decimal, InvalidOperation
+
+import pytest
+
+from .number_normalization import normalize_number, normalize_numbers
+
+
+@pytest.mark.parametrize('number, expected', [
+    ('1.234,56', Decimal('1234.56')),
+    ('R$ 7,45', Decimal('7.45')),
+    ('\n12,3%', Decimal('0.123')),
+    ('-0,5 %', Decimal('-0.005')),
+    ('16.318.000.000', Decimal('16318000000')),
+    ('-', Decimal(0)),
+    (' - %', Decimal(0)),
+])
+def test_normalize_number(number, expected) -> None:
+    """Test normalize_number function."""
+
+    assert normalize_number(number) == expected
+
+
+def test_normalize_number_invalid() -> None:
+    """Test normalize_number function with a string that is not a number."""
+
+    with pytest.raises(InvalidOperation):
+        normalize_number('Varejo')
+
+
+def test_normalize_numbers() -> None:
+    """Test normalize_numbers function."""
+
+    normalized = normalize_numbers(['1,5%', '2.000', '1,5%', 'Varejo'])
+
+    assert normalized == {'1,5%': Decimal('0.015'), '2.000': Decimal('2000'), 'Varejo': None}
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: sections.py
+#  Version: 0.0.1
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Sections of the stock detail page."""
+
+from typing import Iterable, Tuple
+
+# Sections of the stock detail page, in the order of the page. Each transformed
+# section is mapped to the name of its raw section in the collected information.
+SECTIONS = {
+    'stock_identification': 'identification',
+    'financial_summary': 'financial_summary',
+    'price_information': 'price',
+    'detailed_information': 'detailed_information',
+    'oscillations': 'oscillations',
+    'valuation_indicators': 'valuation_indicators',
+    'profitability_indicators': 'profitability_indicators',
+    'indebtedness_indicators': 'indebtedness_indicators',
+    'balance_sheet': 'balance_sheet',
+    'income_statement': 'income_statement'
+}
+
+# Raw sections of the collected information, in the order of the page.
+RAW_SECTIONS = tuple(SECTIONS.values())
+
+
+def select_sections(sections: Iterable[str] = None) -> Tuple[str, ...]:
+    """Validate a selection of sections, putting it in the order of the page.
+
+    :param sections: Iterable[str]: Names of the transformed sections. Defaults to every section.
+    :return: Tuple[str, ...]: The selected sections, without duplicates.
+    :raises ValueError: If a section is unknown.
+    """
+
+    if sections is None:
+        return tuple(SECTIONS)
+
+    if isinstance(sections, str):
+        sections = [sections]
+
+    selected = set(sections)
+    unknown = selected.difference(SECTIONS)
+    if unknown:
+        raise ValueError(f'Unknown sections: {", ".join(sorted(unknown))}. '
+                         f'Expected any of: {", ".join(SECTIONS)}.')
+
+    return tuple(section for section in SECTIONS if section in selected)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: trading_calendar.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Trading Calendar of B3.
+
+This module tells the trading sessions of B3 apart from the periods the market is
+closed: nights, weekends and holidays. The prices on the Fundamentus website only
+change during a session, and until its closing prices are published.
+
+The holidays are the national ones, the moving ones of B3 (Carnival, Good Friday
+and Corpus Christi), and Christmas and New Year's Eve, when B3 does not trade.
+Other closures, announced by B3 each year, can be given to the calendar.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Tuple
+
+from fundamentus.utilities.config import (MARKET_CLOSE, MARKET_OPEN,
+                                          MARKET_SETTLE, MARKET_UTC_OFFSET)
+
+# Days searched for the next session, more than any closure of B3.
+_MAX_CLOSED_DAYS = 15
+
+# First year Black Awareness Day is a national holiday.
+_BLACK_AWARENESS_DAY_SINCE = 2024
+
+
+def easter(year: int) -> date:
+    """Compute the Easter Sunday of a year, with the anonymous Gregorian algorithm.
+
+    :param year: int: The year.
+    :return: date: The Easter Sunday.
+    """
+
+    golden = year % 19
+    century, year_of_century = divmod(year, 100)
+    leap_centuries, century_remainder = divmod(century, 4)
+    correction = (century + 8) // 25
+    moon = (century - correction + 1) // 3
+    epact = (19 * golden + century - leap_centuries - moon + 15) % 30
+    leap_years, year_remainder = divmod(year_of_century, 4)
+    weekday = (32 + 2 * century_remainder + 2 * leap_years - epact - year_remainder) % 7
+    offset = (golden + 11 * epact + 22 * weekday) // 451
+    month, day = divmod(epact + weekday - 7 * offset + 114, 31)
+
+    return date(year, month, day + 1)
+
+
+@lru_cache(maxsize=32)
+def b3_holidays(year: int) -> FrozenSet[date]:
+    """Return the days of a year B3 does not trade, besides the weekends.
+
+    :param year: int: The year.
+    :return: FrozenSet[date]: The holidays.
+    """
+
+    sunday = easter(year)
+
+    holidays = {
+        date(year, 1, 1),                  # Confraternização Universal.
+        sunday - timedelta(days=48),       # Carnaval.
+        sunday - timedelta(days=47),       # Carnaval.
+        sunday - timedelta(days=2),        # Paixão de Cristo.
+        date(year, 4, 21),                 # Tiradentes.
+        date(year, 5, 1),                  # Dia do Trabalho.
+        sunday + timedelta(days=60),       # Corpus Christi.
+        date(year, 9, 7),                  # Independência do Brasil.
+        date(year, 10, 12),                # Nossa Senhora Aparecida.
+        date(year, 11, 2),                 # Finados.
+        date(year, 11, 15),                # Proclamação da República.
+        date(year, 12, 24),                # Véspera de Natal.
+        date(year, 12, 25),                # Natal.
+        date(year, 12, 31)                 # Último dia do ano.
+    }
+
+    if year >= _BLACK_AWARENESS_DAY_SINCE:
+        holidays.add(date(year, 11, 20))   # Dia Nacional de Zumbi e da Consciência Negra.
+
+    return frozenset(holidays)
+
+
+class TradingCalendar:
+    """Represents the trading sessions of B3."""
+
+    def __init__(self,
+                 open_at: Tuple[int, int] = MARKET_OPEN,
+                 close_at: Tuple[int, int] = MARKET_CLOSE,
+                 settle: float = MARKET_SETTLE,
+                 utc_offset: int = MARKET_UTC_OFFSET,
+                 holidays: Iterable[date] = ()) -> None:
+        """Initialize the class.
+
+        :param open_at: Tuple[int, int]: Hour and minute the session opens.
+        :param close_at: Tuple[int, int]: Hour and minute the session closes.
+        :param settle: float: Seconds after the close until the closing prices
+                       are published.
+        :param utc_offset: int: Hours of the time zone of the sessions from UTC.
+        :param holidays: Iterable[date]: Closures of B3 besides the usual holidays.
+        """
+
+        self.__timezone = timezone(timedelta(hours=utc_offset))
+        self.__open = time(*open_at)
+        self.__close = time(*close_at)
+        self.__settle = timedelta(seconds=settle)
+        self.__holidays = frozenset(holidays)
+
+    @property
+    def timezone(self) -> timezone:
+        """Time zone of the sessions."""
+
+        return self.__timezone
+
+    def now(self) -> datetime:
+        """Return the current time, in the time zone of the sessions.
+
+        :return: datetime: The current time.
+        """
+
+        return datetime.now(self.__timezone)
+
+    def is_trading_day(self, day: date) -> bool:
+        """Tell whether B3 trades on a day.
+
+        :param day: date: The day.
+        :return: bool: Whether the day has a session.
+        """
+
+        return (day.weekday() < 5
+                and day not in b3_holidays(day.year)
+                and day not in self.__holidays)
+
+    def __at(self, day: date, moment: time) -> datetime:
+        """Combine a day and a time of the day, in the time zone of the sessions.
+
+        :param day: date: The day.
+        :param moment: time: The time of the day.
+        :return: datetime: The aware date and time.
+        """
+
+        return datetime.combine(day, moment).replace(tzinfo=self.__timezone)
+
+    def __local(self, moment: datetime = None) -> datetime:
+        """Convert a moment to the time zone of the sessions, defaulting to now.
+
+        :param moment: datetime: The moment. Naive moments are taken as local time.
+        :return: datetime: The aware moment.
+        """
+
+        return self.now() if moment is None else moment.astimezone(self.__timezone)
+
+    def is_open(self, moment: datetime = None) -> bool:
+        """Tell whether a session is running.
+
+        :param moment: datetime: The moment. Defaults to now.
+        :return: bool: Whether the market is open.
+        """
+
+        moment = self.__local(moment)
+
+        return (self.is_trading_day(moment.date())
+                and self.__at(moment.date(), self.__open) <= moment
+                < self.__at(moment.date(), self.__close))
+
+    def is_volatile(self, moment: datetime = None) -> bool:
+        """Tell whether the prices may change: during a session, and until they settle.
+
+        :param moment: datetime: The moment. Defaults to now.
+        :return: bool: Whether the prices may change.
+        """
+
+        moment = self.__local(moment)
+
+        return (self.is_trading_day(moment.date())
+                and self.__at(moment.date(), self.__open) <= moment
+                < self.__at(moment.date(), self.__close) + self.__settle)
+
+    def __next(self, moment: datetime, daily: timedelta) -> datetime:
+        """Find the first time of the day of a session after a moment.
+
+        :param moment: datetime: The moment, in the time zone of the sessions.
+        :param daily: timedelta: The time of the day, from midnight.
+        :return: datetime: The first trading day at that time after the moment.
+        :raises ValueError: If no session is found, as every day is a holiday.
+        """
+
+        for days in range(_MAX_CLOSED_DAYS):
+            day = moment.date() + timedelta(days=days)
+            candidate = self.__at(day, time()) + daily
+
+            if candidate > moment and self.is_trading_day(day):
+                return candidate
+
+        raise ValueError(f'No session of B3 in the {_MAX_CLOSED_DAYS} days after {moment}.')
+
+    def next_open(self, moment: datetime = None) -> datetime:
+        """Return the opening of the next session.
+
+        :param moment: datetime: The moment. Defaults to now.
+        :return: datetime: The first opening after the moment.
+        """
+
+        return self.__next(self.__local(moment),
+                           timedelta(hours=self.__open.hour, minutes=self.__open.minute))
+
+    def next_settle(self, moment: datetime = None) -> datetime:
+        """Return when the closing prices of the next session are published.
+
+        :param moment: datetime: The moment. Defaults to now.
+        :return: datetime: The first close, plus the settle time, after the moment.
+        """
+
+        return self.__next(self.__local(moment),
+                           timedelta(hours=self.__close.hour, minutes=self.__close.minute)
+                           + self.__settle)
+
+    def last_session(self, moment: datetime = None) -> date:
+        """Return the day of the last session opened, whose prices are the current ones.
+
+        :param moment: datetime: The moment. Defaults to now.
+        :return: date: The last trading day opened at or before the moment.
+        :raises ValueError: If no session is found, as every day is a holiday.
+        """
+
+        moment = self.__local(moment)
+
+        for days in range(_MAX_CLOSED_DAYS):
+            day = moment.date() - timedelta(days=days)
+
+            if self.is_trading_day(day) and self.__at(day, self.__open) <= moment:
+                return day
+
+        raise ValueError(f'No session of B3 in the {_MAX_CLOSED_DAYS} days before {moment}.')
+
+    def ttl(self, session_ttl: float, moment: datetime = None) -> float:
+        """Seconds a page showing the prices is valid.
+
+        While the prices may change, the page expires after session_ttl, and no later
+        than when the prices settle, so the closing prices are requested again. When
+        the market is closed, the page is valid until the next session opens.
+
+        :param session_ttl: float: Seconds a page is valid while the prices may change.
+        :param moment: datetime: The moment the page is stored. Defaults to now.
+        :return: float: Seconds before the page expires.
+        """
+
+        moment = self.__local(moment)
+
+        if self.is_volatile(moment):
+            return min(session_ttl, (self.next_settle(moment) - moment).total_seconds())
+
+        return (self.next_open(moment) - moment).total_seconds()
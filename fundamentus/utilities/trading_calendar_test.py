@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# ------------------------------------------------------------------------------
+#  Name: trading_calendar_test.py
+#  Version: 0.0.2
+#
+#  Summary: Python Fundamentus
+#           Python Fundamentus is a Python API that allows you to quickly
+#           access the main fundamental indicators of the main stocks
+#           in the Brazilian market.
+#
+#  Author: Alexsander Lopes Camargos
+#  Author-email: alcamargos@vivaldi.net
+#
+#  License: MIT
+# ------------------------------------------------------------------------------
+
+"""Test of the trading calendar of B3."""
+
+from datetime import date, datetime, timedelta, timezone
+
+from .trading_calendar import TradingCalendar, b3_holidays, easter
+
+# The time zone of B3.
+BRT = timezone(timedelta(hours=-3))
+
+# Seconds in an hour.
+HOUR = 3600
+
+
+def test_easter() -> None:
+    """Test the date of Easter Sunday."""
+
+    assert easter(2024) == date(2024, 3, 31)
+    assert easter(2025) == date(2025, 4, 20)
+    assert easter(2026) == date(2026, 4, 5)
+
+
+def test_b3_holidays() -> None:
+    """Test the holidays of B3, fixed and moving."""
+
+    holidays = b3_holidays(2026)
+
+    assert date(2026, 2, 16) in holidays  # Carnival Monday
+    assert date(2026, 2, 17) in holidays  # Carnival Tuesday
+    assert date(2026, 4, 3) in holidays  # Good Friday
+    assert date(2026, 6, 4) in holidays  # Corpus Christi
+    assert date(2026, 11, 20) in holidays
+    assert date(2026, 12, 31) in holidays
+    assert date(2026, 2, 18) not in holidays
+
+    assert date(2023, 11, 20) not in b3_holidays(2023)
+
+
+def test_sessions() -> None:
+    """Test the sessions are told apart from the closed periods."""
+
+    calendar = TradingCalendar()
+
+    assert calendar.is_open(datetime(2026, 3, 13, 10, tzinfo=BRT))
+    assert not calendar.is_open(datetime(2026, 3, 13, 17, tzinfo=BRT))
+    assert calendar.is_volatile(datetime(2026, 3, 13, 17, 20, tzinfo=BRT))
+    assert not calendar.is_volatile(datetime(2026, 3, 13, 17, 30, tzinfo=BRT))
+    assert not calendar.is_open(datetime(2026, 3, 14, 12, tzinfo=BRT))
+    assert not calendar.is_open(datetime(2026, 4, 3, 12, tzinfo=BRT))
+
+    # 13:00 UTC is 10:00 at B3.
+    assert calendar.is_open(datetime(2026, 3, 13, 13, tzinfo=timezone.utc))
+
+
+def test_next_session() -> None:
+    """Test the next opening and settle skip the weekends and the holidays."""
+
+    calendar = TradingCalendar()
+    thursday = datetime(2026, 4, 2, 18, tzinfo=BRT)
+
+    # Good Friday and the weekend are skipped.
+    assert calendar.next_open(thursday) == datetime(2026, 4, 6, 10, tzinfo=BRT)
+    assert calendar.next_settle(thursday) == datetime(2026, 4, 6, 17, 30, tzinfo=BRT)
+
+    calendar = TradingCalendar(holidays=[date(2026, 4, 6)])
+    assert calendar.next_open(thursday) == datetime(2026, 4, 7, 10, tzinfo=BRT)
+
+
+def test_last_session() -> None:
+    """Test the last session skips the weekends, the holidays and the days not opened yet."""
+
+    calendar = TradingCalendar()
+
+    assert calendar.last_session(datetime(2026, 3, 13, 12, tzinfo=BRT)) == date(2026, 3, 13)
+    assert calendar.last_session(datetime(2026, 3, 16, 9, tzinfo=BRT)) == date(2026, 3, 13)
+    assert calendar.last_session(datetime(2026, 4, 5, 12, tzinfo=BRT)) == date(2026, 4, 2)
+
+
+def test_ttl() -> None:
+    """Test the time to live follows the sessions."""
+
+    calendar = TradingCalendar()
+
+    # During a session, and until the prices settle.
+    assert calendar.ttl(900, datetime(2026, 3, 13, 12, tzinfo=BRT)) == 900
+    assert calendar.ttl(900, datetime(2026, 3, 13, 17, 20, tzinfo=BRT)) == 600
+
+    # Across the weekend, until Monday opens.
+    assert calendar.ttl(900, datetime(2026, 3, 13, 18, tzinfo=BRT)) == 64 * HOUR
+
+    # Overnight, and before the opening.
+    assert calendar.ttl(900, datetime(2026, 3, 12, 18, tzinfo=BRT)) == 16 * HOUR
+    assert calendar.ttl(900, datetime(2026, 3, 13, 9, tzinfo=BRT)) == HOUR
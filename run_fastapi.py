@@ -3,7 +3,7 @@
 
 # ------------------------------------------------------------------------------
 #  Name: run_fastapi.py
-#  Version: 0.0.7
+#  Version: 0.0.9
 #
 #  Summary: Python Fundamentus
 #           Python Fundamentus is a Python API that allows you to quickly
@@ -16,34 +16,17 @@
 #  License: MIT
 # ------------------------------------------------------------------------------
 
-"""Fundamentus Command line interface."""
+"""Fundamentus HTTP service.
 
-from fastapi import FastAPI
+Run with `python run_fastapi.py` or `uvicorn run_fastapi:app`.
+"""
 
-from fundamentus.contracts.transform_contract import TransformContract
-from fundamentus.main.fundamentus_pipeline import \
-    FundamentusPipeline as Fundamentus
+import uvicorn
 
-app = FastAPI()
+from fundamentus.service.app import create_app
 
+app = create_app()
 
-def get_stock_data(symbol: str) -> TransformContract:
-    """Get the stock data.
 
-    :param symbol: str: Stock symbol.
-    :return: dict: Stock data.
-    """
-
-    url = 'https://www.fundamentus.com.br/detalhes.php'
-    params = {'papel': symbol}
-
-    main_pipeline = Fundamentus(url=url, params=params)
-    response = main_pipeline.get_stock_information()
-
-    return response
-
-
-@app.get("/stock/{symbol}")
-async def stock(symbol: str):
-
-    return get_stock_data(symbol)[0]
+if __name__ == '__main__':
+    uvicorn.run(app, host='127.0.0.1', port=8000)